@@ -0,0 +1,72 @@
+"""
+엔드포인트 벤치마크
+
+로컬 PostGIS 의 빈 벤치마크 DB 에 합성 데이터셋을 적재한 뒤 고정된 요청 구성으로 엔드포인트를 호출하고
+p50 / p95 / p99 응답 시간, 처리량, 요청당 쿼리 수를 JSON 으로 출력한다.
+
+    # 데이터셋 적재 후 실행
+    DATABASE_URL=postgis://.../yumyum_bench python -m benchmarks --size 100k --prepare --output before.json
+    # 같은 데이터셋으로 다른 커밋에서 다시 실행해 비교
+    DATABASE_URL=postgis://.../yumyum_bench python -m benchmarks --size 100k --output after.json
+"""
+import os, django
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+django.setup()
+
+import argparse, io, json, random, subprocess, sys
+from datetime import datetime, timezone
+
+from benchmarks import datasets, runner, scenarios
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔드포인트 벤치마크")
+    parser.add_argument("--size", choices=sorted(datasets.SIZES), default="10k", help="합성 데이터셋 크기")
+    parser.add_argument("--seed", type=int, default=0, help="데이터셋과 요청 목록의 난수 seed")
+    parser.add_argument("--prepare", action="store_true", help="빈 DB 에 합성 데이터셋을 먼저 적재")
+    parser.add_argument("--mix", choices=sorted(scenarios.MIXES), default="default", help="요청 구성")
+    parser.add_argument("--requests", type=int, default=2000, help="측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=200, help="측정 전 워밍업 요청 수 (메모리 인덱스 적재 등)")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 요청 스레드 수")
+    parser.add_argument("--output", help="결과 JSON 경로 (없으면 표준 출력)")
+    args = parser.parse_args()
+
+    spec = datasets.dataset_spec(args.size, args.seed)
+    if args.prepare:
+        datasets.prepare(spec, stdout=io.StringIO())
+        print(f"dataset {args.size} prepared", file=sys.stderr)
+
+    rng = random.Random(args.seed)
+    ctx = scenarios.Context.load(rng)
+    requests = scenarios.plan(rng, ctx, args.mix, args.warmup + args.requests)
+    runner.run(requests[:args.warmup], args.concurrency)
+    results, elapsed = runner.run(requests[args.warmup:], args.concurrency)
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "dataset": {**spec, "actual": datasets.describe()},
+        "mix": args.mix,
+        "warmup": args.warmup,
+        "concurrency": args.concurrency,
+        **runner.summarize(results, elapsed),
+    }
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
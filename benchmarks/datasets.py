@@ -0,0 +1,63 @@
+from django.core.management import call_command
+
+from restaurants.models import Restaurant
+
+# 데이터셋 크기 이름 -> 식당 수
+SIZES = {
+    "10k": 10_000,
+    "100k": 100_000,
+    "1m": 1_000_000,
+}
+# 식당 수 대비 리뷰 / 유저 / 웨이팅 비율 (seed_reviews 기본값과 같은 식당당 리뷰 3개)
+REVIEWS_PER_RESTAURANT = 3
+USERS_PER_RESTAURANT = 0.2
+RESERVATIONS_PER_RESTAURANT = 0.05
+
+
+def dataset_spec(size, seed):
+    restaurants = SIZES[size]
+    return {
+        "size": size,
+        "seed": seed,
+        "restaurants": restaurants,
+        "reviews": restaurants * REVIEWS_PER_RESTAURANT,
+        "users": max(1, int(restaurants * USERS_PER_RESTAURANT)),
+        "reservations": int(restaurants * RESERVATIONS_PER_RESTAURANT),
+    }
+
+
+def prepare(spec, stdout=None):
+    """
+    빈 DB 에 spec 의 합성 데이터셋 적재 (같은 spec 이면 같은 데이터)
+
+    Raises:
+        * RuntimeError: 이미 식당이 있는 DB (다른 데이터셋과 섞이지 않도록)
+    """
+    if Restaurant.objects.exists():
+        raise RuntimeError("Restaurant 테이블이 비어 있지 않습니다. 빈 벤치마크 DB 를 사용하거나 --prepare 없이 실행해 기존 데이터를 사용하세요.")
+    call_command("seed_restaurants", restaurants=spec["restaurants"], seed=spec["seed"], stdout=stdout)
+    call_command(
+        "seed_reviews",
+        reviews=spec["reviews"],
+        users=spec["users"],
+        reservations=spec["reservations"],
+        seed=spec["seed"],
+        stdout=stdout,
+    )
+    call_command("sync_waiting_queues", stdout=stdout)
+
+
+def describe():
+    """
+    현재 DB 의 데이터셋 규모 (결과 JSON 에 기록)
+    """
+    from restaurants.models import Reservation
+    from reviews.models import Review
+    from users.models import User
+
+    return {
+        "restaurants": Restaurant.objects.count(),
+        "reviews": Review.objects.count(),
+        "users": User.objects.count(),
+        "reservations": Reservation.objects.count(),
+    }
@@ -0,0 +1,113 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+
+from django.db import connections
+from django.test import Client
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def send(client, request):
+    """
+    요청 하나 실행
+
+    Returns:
+        * (endpoint, 응답 시간(초), 쿼리 수, 상태 코드)
+    """
+    endpoint, path, params, authorization = request
+    headers = {"HTTP_AUTHORIZATION": authorization} if authorization else {}
+    counter = QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        start = time.perf_counter()
+        response = client.get(path, params, **headers)
+        seconds = time.perf_counter() - start
+    return endpoint, seconds, counter.count, response.status_code
+
+
+def run_serial(requests):
+    client = Client(SERVER_NAME="localhost")
+    return [send(client, request) for request in requests]
+
+
+def run(requests, concurrency=1):
+    """
+    요청 목록 실행 (concurrency 개 스레드가 나눠서, 스레드마다 Client 와 DB 연결 하나)
+
+    Returns:
+        * (결과 목록, 전체 경과 시간(초))
+    """
+    start = time.perf_counter()
+    if concurrency <= 1:
+        results = run_serial(requests)
+    else:
+        def worker(chunk):
+            try:
+                return run_serial(chunk)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            chunks = [requests[i::concurrency] for i in range(concurrency)]
+            results = [result for chunk in executor.map(worker, chunks) for result in chunk]
+    return results, time.perf_counter() - start
+
+
+def percentile(sorted_values, p):
+    """
+    nearest-rank 백분위수
+    """
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * p // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(results, elapsed):
+    """
+    엔드포인트별 p50 / p95 / p99 응답 시간(ms), 처리량, 요청당 쿼리 수
+    """
+    by_endpoint = {}
+    for endpoint, seconds, queries, status in results:
+        by_endpoint.setdefault(endpoint, []).append((seconds, queries, status))
+
+    endpoints = {}
+    for endpoint, rows in sorted(by_endpoint.items()):
+        latencies = sorted(seconds * 1000 for seconds, _, _ in rows)
+        queries = sorted(count for _, count, _ in rows)
+        statuses = {}
+        for _, _, status in rows:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        endpoints[endpoint] = {
+            "requests": len(rows),
+            "statuses": statuses,
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50), 3),
+                "p95": round(percentile(latencies, 95), 3),
+                "p99": round(percentile(latencies, 99), 3),
+                "mean": round(sum(latencies) / len(latencies), 3),
+                "max": round(latencies[-1], 3),
+            },
+            # 이 엔드포인트만 직렬로 처리할 때의 처리량
+            "throughput_rps": round(len(latencies) / (sum(latencies) / 1000), 1) if sum(latencies) else None,
+            "queries_per_request": {
+                "mean": round(sum(queries) / len(queries), 2),
+                "p95": percentile(queries, 95),
+                "max": queries[-1],
+            },
+        }
+    return {
+        "requests": len(results),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(results) / elapsed, 1) if elapsed else None,
+        "endpoints": endpoints,
+    }
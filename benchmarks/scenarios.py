@@ -0,0 +1,147 @@
+import math
+
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from restaurants.models import Reservation, Restaurant
+from users.models import User
+from utils.category import category_name
+
+# 타일 요청 zoom
+TILE_ZOOM = 15
+# 요청 위치를 식당 위치에서 흔드는 범위 (도, 약 200m)
+JITTER_DEG = 0.002
+
+
+class Context:
+    """
+    요청 생성에 쓰는 표본 (식당 위치 / id, 로그인 토큰)
+    """
+    def __init__(self, restaurants, users):
+        # [(restaurant_id, name, latitude, longitude), ...]
+        self.restaurants = restaurants
+        # [Authorization 헤더 값, ...]
+        self.users = users
+
+    @classmethod
+    def load(cls, rng, restaurant_samples=1000, user_samples=200):
+        ids = list(Restaurant.objects.order_by("restaurant_id").values_list("restaurant_id", flat=True))
+        sampled = sorted(rng.sample(ids, min(restaurant_samples, len(ids))))
+        rows = Restaurant.objects.filter(restaurant_id__in=sampled).order_by("restaurant_id")
+        restaurants = [(r.restaurant_id, r.name, float(r.latitude), float(r.longitude)) for r in rows]
+
+        # 웨이팅 중인 유저를 먼저, 나머지는 전체 유저에서
+        waiting = sorted(set(Reservation.objects.values_list("user_id", flat=True)))
+        waiting = rng.sample(waiting, min(user_samples // 2, len(waiting)))
+        user_ids = list(User.objects.order_by("user_id").values_list("user_id", flat=True))
+        others = rng.sample(user_ids, min(user_samples - len(waiting), len(user_ids)))
+        users = [
+            f"Bearer {RefreshToken.for_user(user).access_token}"
+            for user in User.objects.filter(user_id__in=set(waiting) | set(others)).order_by("user_id")
+        ]
+        if not (restaurants and users):
+            raise RuntimeError("식당과 유저 데이터가 필요합니다. --prepare 로 데이터셋을 먼저 적재하세요.")
+        return cls(restaurants, users)
+
+    def point(self, rng):
+        _, _, latitude, longitude = rng.choice(self.restaurants)
+        return (
+            round(latitude + rng.uniform(-JITTER_DEG, JITTER_DEG), 7),
+            round(longitude + rng.uniform(-JITTER_DEG, JITTER_DEG), 7),
+        )
+
+
+def tile_of(latitude, longitude, z):
+    n = 2 ** z
+    x = int((longitude + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(latitude))) / math.pi) / 2 * n)
+    return x, y
+
+
+# 엔드포인트별 요청 생성: (rng, ctx) -> (path, query params, Authorization 헤더 or None)
+
+def filtered(rng, ctx):
+    latitude, longitude = ctx.point(rng)
+    params = {"latitude": latitude, "longitude": longitude}
+    roll = rng.random()
+    if roll < 0.3:
+        params["category"] = ",".join(str(code) for code in rng.sample(sorted(category_name), rng.randint(1, 2)))
+    elif roll < 0.5:
+        params["restaurant_name"] = rng.choice(ctx.restaurants)[1][:2]
+    return "/restaurants/filtered/", params, None
+
+
+def alternative(rng, ctx):
+    return "/restaurants/alternative/", {"restaurant_id": rng.choice(ctx.restaurants)[0]}, None
+
+
+def nearby(rng, ctx):
+    latitude, longitude = ctx.point(rng)
+    return "/restaurants/nearby/", {"latitude": latitude, "longitude": longitude, "dist": rng.choice((0.5, 1))}, None
+
+
+def all_restaurants(rng, ctx):
+    return "/restaurants/all/", {"category": rng.choice(sorted(category_name))}, None
+
+
+def tiles(rng, ctx):
+    x, y = tile_of(*ctx.point(rng), TILE_ZOOM)
+    return f"/restaurants/tiles/{TILE_ZOOM}/{x}/{y}.mvt", {}, None
+
+
+def autocomplete(rng, ctx):
+    latitude, longitude = ctx.point(rng)
+    name = rng.choice(ctx.restaurants)[1]
+    return "/restaurants/autocomplete/", {"q": name[:rng.randint(1, 3)], "latitude": latitude, "longitude": longitude}, None
+
+
+def detail(rng, ctx):
+    return f"/restaurants/{rng.choice(ctx.restaurants)[0]}/", {}, None
+
+
+def restaurant_reviews(rng, ctx):
+    return f"/restaurants/{rng.choice(ctx.restaurants)[0]}/reviews/", {}, None
+
+
+def waitings(rng, ctx):
+    return "/users/waitings/", {}, rng.choice(ctx.users)
+
+
+def thread(rng, ctx):
+    latitude, longitude = ctx.point(rng)
+    return "/reviews/thread/", {"latitude": latitude, "longitude": longitude}, rng.choice(ctx.users)
+
+
+ENDPOINTS = {
+    "filtered": filtered,
+    "alternative": alternative,
+    "nearby": nearby,
+    "all": all_restaurants,
+    "tiles": tiles,
+    "autocomplete": autocomplete,
+    "detail": detail,
+    "restaurant_reviews": restaurant_reviews,
+    "waitings": waitings,
+    "thread": thread,
+}
+
+# 요청 구성 (엔드포인트 -> 비중)
+MIXES = {
+    "default": {
+        "filtered": 20, "nearby": 15, "all": 5, "alternative": 10, "thread": 15,
+        "waitings": 10, "autocomplete": 10, "detail": 5, "restaurant_reviews": 5, "tiles": 5,
+    },
+    "map": {"nearby": 30, "all": 20, "tiles": 40, "filtered": 10},
+    "feed": {"thread": 50, "waitings": 30, "restaurant_reviews": 20},
+}
+
+
+def plan(rng, ctx, mix, count):
+    """
+    같은 seed 면 같은 요청 목록 [(endpoint, path, params, authorization), ...]
+    """
+    names = sorted(MIXES[mix])
+    weights = [MIXES[mix][name] for name in names]
+    requests = []
+    for name in rng.choices(names, weights, k=count):
+        requests.append((name, *ENDPOINTS[name](rng, ctx)))
+    return requests
@@ -0,0 +1,124 @@
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+
+# 쓰기 직후 primary 에서 읽는 시간 (초, 복제 지연보다 길게)
+PRIMARY_PIN_SECONDS = 5
+PRIMARY_PIN_COOKIE = "primary_pin"
+PRIMARY_PIN_PREFIX = "db:pin:user"
+
+# 현재 요청이 읽을 replica alias (None 이면 primary)
+_replica = ContextVar("db_replica", default=None)
+
+
+def choose_replica():
+    replicas = settings.REPLICA_DATABASES
+    return random.choice(replicas) if replicas else None
+
+
+def pin_key(user_id):
+    return f"{PRIMARY_PIN_PREFIX}:{user_id}"
+
+
+def is_pinned(request):
+    """
+    최근에 쓰기를 한 클라이언트인지 (쿠키 또는 로그인 유저 기준)
+    """
+    if PRIMARY_PIN_COOKIE in request.COOKIES:
+        return True
+    user = getattr(request, "user", None)
+    return bool(user is not None and user.is_authenticated and cache.get(pin_key(user.pk)))
+
+
+class ReplicaRouter:
+    """
+    ReplicaReadMixin 뷰의 읽기는 replica 로, 나머지 읽기와 모든 쓰기는 primary 로
+    """
+    def db_for_read(self, model, **hints):
+        alias = _replica.get()
+        if alias is None or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return alias
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replica 는 primary 의 복제본이므로 같은 데이터
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == DEFAULT_DB_ALIAS
+
+
+class ReplicaReadMixin:
+    """
+    APIView 의 GET / HEAD 를 replica 에서 읽도록 (최근 쓰기를 한 클라이언트는 primary)
+    """
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self._adispatch(request, *args, **kwargs)
+        token = _replica.set(None)
+        try:
+            return super().dispatch(request, *args, **kwargs)
+        finally:
+            _replica.reset(token)
+
+    async def _adispatch(self, request, *args, **kwargs):
+        # initial 은 스레드에서 실행되지만 sync_to_async 가 ContextVar 변경을 되돌려주므로
+        # 이후의 async ORM 호출도 같은 replica 를 읽는다
+        token = _replica.set(None)
+        try:
+            return await super().dispatch(request, *args, **kwargs)
+        finally:
+            _replica.reset(token)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method in SAFE_METHODS and not is_pinned(request):
+            _replica.set(choose_replica())
+
+
+class PrimaryPinMiddleware:
+    """
+    쓰기 요청이 성공하면 PRIMARY_PIN_SECONDS 동안 그 클라이언트의 읽기를 primary 로 고정
+    (read-your-writes, 쿠키와 로그인 유저 둘 다 기록)
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        response = self.get_response(request)
+        if self.should_pin(request, response):
+            self.pin(request, response)
+        return response
+
+    async def __acall__(self, request):
+        response = await self.get_response(request)
+        if self.should_pin(request, response):
+            # 세션 유저가 아직 로드되지 않았을 수 있으므로 (DB 조회) 스레드에서
+            await sync_to_async(self.pin)(request, response)
+        return response
+
+    def should_pin(self, request, response):
+        return request.method not in SAFE_METHODS and response.status_code < 400 and bool(settings.REPLICA_DATABASES)
+
+    def pin(self, request, response):
+        response.set_cookie(PRIMARY_PIN_COOKIE, str(int(time.time())), max_age=PRIMARY_PIN_SECONDS, httponly=True)
+        # DRF 인증(JWT) 결과도 request.user 에 반영됨
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            cache.set(pin_key(user.pk), 1, timeout=PRIMARY_PIN_SECONDS)
@@ -44,6 +44,7 @@ ALLOWED_HOSTS = ["yumyum-backend-48405822bc43.herokuapp.com", "127.0.0.1", "loca
 # Application definition
 
 INSTALLED_APPS = [
+    "daphne",
     "django.contrib.admin",
     "django.contrib.auth",
     "django.contrib.contenttypes",
@@ -62,17 +63,22 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt.token_blacklist",
     "drf_yasg",
     "corsheaders",
+    # channels
+    "channels",
 ]
 
 MIDDLEWARE = [
+    "utils.metrics.MetricsMiddleware",  # URL 패턴별 응답 시간 / 쿼리 수 (GET /metrics)
     "corsheaders.middleware.CorsMiddleware",  # CORS 추가
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "utils.staticfiles.AsyncWhiteNoiseMiddleware",  # async 뷰 앞에서 스레드로 넘어가지 않도록
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.db_router.PrimaryPinMiddleware",  # 쓰기 직후 읽기를 primary 로 고정
+    "utils.profiling.ProfilingMiddleware",  # X-Profile 헤더 / 관리자 ?_profile=1 요청 프로파일링
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -96,6 +102,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "config.wsgi.application"
+ASGI_APPLICATION = "config.asgi.application"
 
 
 # Database
@@ -112,9 +119,77 @@ DATABASES = {
     }
 }
 
-db_from_env = dj_database_url.config(conn_max_age=600)
+# daphne (ASGI) 에서는 요청마다 다른 스레드가 DB 연결을 열기 때문에 지속 연결을 켜면
+# 요청 스레드와 함께 버려진 연결이 쌓인다. 기본은 요청마다 연결을 닫고, 연결 재사용은 PgBouncer 같은 풀러에 맡긴다.
+DB_CONN_MAX_AGE = int(os.environ.get("DB_CONN_MAX_AGE", 0))
+
+db_from_env = dj_database_url.config(conn_max_age=DB_CONN_MAX_AGE)
 DATABASES["default"].update(db_from_env)
 
+# 읽기 전용 replica (쉼표로 구분한 DATABASE_URL 목록)
+# 로컬에서는 Postgres DB 두 개로 확인: DATABASE_REPLICA_URLS=postgis://user:pw@localhost:5432/yumyum_replica
+REPLICA_DATABASES = []
+for i, url in enumerate(filter(None, os.environ.get("DATABASE_REPLICA_URLS", "").split(",")), start=1):
+    alias = f"replica_{i}"
+    DATABASES[alias] = {
+        **dj_database_url.parse(url.strip(), conn_max_age=DB_CONN_MAX_AGE),
+        "ENGINE": "django.contrib.gis.db.backends.postgis",
+        "TEST": {"MIRROR": "default"},
+    }
+    REPLICA_DATABASES.append(alias)
+
+DATABASE_ROUTERS = ["config.db_router.ReplicaRouter"]
+
+# Cache
+# REDIS_URL 이 설정되어 있으면 워커 간 공유 캐시로 Redis 사용
+# 없으면 프로세스별 캐시이므로 식당 데이터셋 버전은 Postgres sequence 로 공유하고 (restaurants.dataset)
+# 프로세스 메모리 리뷰 피드는 LOCAL_FEED_TTL 마다 DB 에서 다시 채운다 (reviews.feed)
+
+REDIS_URL = os.environ.get("REDIS_URL")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+# Channel layer (웨이팅 큐 실시간 알림, Redis 미설정 시 프로세스 메모리)
+
+if REDIS_URL:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels_redis.core.RedisChannelLayer",
+            "CONFIG": {"hosts": [REDIS_URL]},
+        }
+    }
+else:
+    CHANNEL_LAYERS = {
+        "default": {
+            "BACKEND": "channels.layers.InMemoryChannelLayer",
+        }
+    }
+
+# 웨이팅 큐 백엔드 (Redis 미설정 시 Postgres 기록을 그대로 사용, 프로세스 메모리 큐는 여러 워커에서 순번이 어긋남)
+
+WAITING_QUEUE = {
+    "BACKEND": "restaurants.queues.RedisQueueBackend" if REDIS_URL else "restaurants.queues.DatabaseQueueBackend",
+    "OPTIONS": {},
+}
+
+# 지역 셀별 최근 리뷰 피드
+REVIEW_FEED = {
+    "BACKEND": "reviews.feed.RedisFeedBackend" if REDIS_URL else "reviews.feed.InMemoryFeedBackend",
+    "OPTIONS": {},
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -141,6 +216,9 @@ LANGUAGE_CODE = "en-us"
 
 TIME_ZONE = "UTC"
 
+# 식당 운영시간(영업 중 여부) 판단 기준 시간대
+RESTAURANT_TIME_ZONE = "Asia/Seoul"
+
 USE_I18N = True
 
 USE_TZ = True
@@ -184,7 +262,8 @@ AUTH_USER_MODEL = "users.User"
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.TokenAuthentication",
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # JWTAuthentication + User 캐시, 폐기 토큰 확인 (users/authentication.py)
+        "users.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         # 'rest_framework.permissions.IsAuthenticated', # 인증된 사용자만 접근
@@ -222,7 +301,36 @@ SIMPLE_JWT = {
     "SLIDING_TOKEN_REFRESH_LIFETIME": timedelta(days=1),
 }
 
+# /metrics 접근 토큰 (Authorization: Bearer <token>, 설정하지 않으면 DEBUG 에서만 접근 가능)
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+
 CORS_ORIGIN_ALLOW_ALL = True
 CORS_ALLOW_CREDENTIALS = False
 
-S3_base_url = "https://yumyum-s3-bucket.s3.ap-northeast-2.amazonaws.com/"
+S3_BUCKET = "yumyum-s3-bucket"
+S3_REGION = "ap-northeast-2"
+S3_BASE_URL = f"https://{S3_BUCKET}.s3.{S3_REGION}.amazonaws.com/"
+# moto 서버 등 S3 호환 저장소 주소 (없으면 AWS)
+S3_ENDPOINT_URL = os.environ.get("S3_ENDPOINT_URL")
+# 공용 S3 client 연결 풀 크기 (IMAGE_UPLOAD_WORKERS 보다 크게)
+S3_MAX_POOL_CONNECTIONS = int(os.environ.get("S3_MAX_POOL_CONNECTIONS", 32))
+
+# 이미지 변형(thumbnail / medium / original, WebP + JPEG) 저장소와 워커 수
+# IMAGE_STORAGE=local 이면 MEDIA_ROOT 에 저장 (개발, 테스트용)
+MEDIA_URL = "/media/"
+MEDIA_ROOT = os.path.join(BASE_DIR, "media")
+if os.environ.get("IMAGE_STORAGE") == "local":
+    IMAGE_STORAGE = {
+        "BACKEND": "utils.images.LocalImageStorage",
+        "OPTIONS": {"root": MEDIA_ROOT, "base_url": MEDIA_URL},
+    }
+else:
+    IMAGE_STORAGE = {
+        "BACKEND": "utils.images.S3ImageStorage",
+        "OPTIONS": {
+            "bucket": S3_BUCKET,
+            "base_url": S3_BASE_URL,
+        },
+    }
+IMAGE_WORKERS = int(os.environ.get("IMAGE_WORKERS", 2))
+IMAGE_UPLOAD_WORKERS = int(os.environ.get("IMAGE_UPLOAD_WORKERS", 8))
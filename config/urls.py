@@ -19,6 +19,8 @@ from django.urls import path, include, re_path
 from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
+from utils.metrics import metrics_view
+from utils.profiling import ProfileListView, ProfileDetailView, ProfileCollapsedView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -34,10 +36,15 @@ schema_view = get_schema_view(
 )
 
 urlpatterns = [
+    # 요청 프로파일 (admin.site.urls 가 admin/ 아래를 모두 받으므로 먼저 둔다)
+    path("admin/profiles/", ProfileListView.as_view()),
+    path("admin/profiles/<int:profile_id>/", ProfileDetailView.as_view()),
+    path("admin/profiles/<int:profile_id>/collapsed", ProfileCollapsedView.as_view()),
     path("admin/", admin.site.urls),
     path("users/", include("users.urls")),
     path("reviews/", include("reviews.urls")),
     path("restaurants/", include("restaurants.urls")),
+    path("metrics", metrics_view),  # Prometheus
     
     #swagger
     re_path(r'^swagger(?P<format>\.json|\.yaml)$', schema_view.without_ui(cache_timeout=0), name='schema-json'),
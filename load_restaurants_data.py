@@ -3,9 +3,14 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 django.setup()
 
 from django.contrib.gis.geos import GEOSGeometry
+from django.db import transaction
 from restaurants.models import Restaurant
+from restaurants.dataset import bump_version
+from restaurants.schedule import build_schedule
 from utils import kakao_map_api
-import csv, re
+from utils.category import category_mask
+from utils.geocoding import GeocodeCache, CachedGeocoder, StubGeocoder, geocode_many, make_executor
+import argparse, csv, json, re
 
 Category_id ={
     "기타":0,
@@ -60,57 +65,146 @@ def parse_category(raw_ctgr_names) -> list:
     return category_ids
 
 
-def load_restaurants_data():
-    # csv 파일 경로
-    csv_path = "./Dongjak_Restaurants.csv"
+def build_restaurant(row, coords):
+    longitude, latitude = coords
+    restaurant = Restaurant(
+        name=row[2],
+        category=parse_category(row[6]),
+        longitude=longitude,
+        latitude=latitude,
+        location=GEOSGeometry(f"POINT({longitude} {latitude})", srid=4326),
+        address=row[4],
+        day_of_week=[],
+    )
+    # bulk_create 는 save() 를 거치지 않으므로 카테고리 bitmask, 영업시간 비트맵을 직접 계산
+    restaurant.category_mask = category_mask(restaurant.category)
+    restaurant.open_hours = build_schedule(
+        restaurant.is_24_hours, restaurant.day_of_week, restaurant.start_time, restaurant.end_time,
+    )
+    return restaurant
+
+
+def restaurant_key(name, address, category):
+    return name, address, tuple(category)
+
+
+def new_restaurants(restaurants):
+    """
+    이미 적재된 식당과 배치 안의 중복을 제외
+
+    예전 get_or_create 와 같은 기준으로 (이름, 주소, 카테고리) 가 같으면 같은 식당으로 본다.
+    좌표는 주소에서 정해지므로 (지오코딩 캐시) 기준에서 뺀다.
+    """
+    names = {restaurant.name for restaurant in restaurants}
+    seen = {
+        restaurant_key(*row)
+        for row in Restaurant.objects.filter(name__in=names).values_list("name", "address", "category")
+    }
+    result = []
+    for restaurant in restaurants:
+        key = restaurant_key(restaurant.name, restaurant.address, restaurant.category)
+        if key not in seen:
+            seen.add(key)
+            result.append(restaurant)
+    return result
+
+
+def read_checkpoint(checkpoint_path, csv_path):
+    if not os.path.exists(checkpoint_path):
+        return 0
+    with open(checkpoint_path, "r") as f:
+        checkpoint = json.load(f)
+    return checkpoint["next_row"] if checkpoint.get("csv") == csv_path else 0
+
+
+def write_checkpoint(checkpoint_path, csv_path, next_row):
+    tmp_path = checkpoint_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"csv": csv_path, "next_row": next_row}, f)
+    os.replace(tmp_path, checkpoint_path)
+
+
+def load_restaurants_data(
+    csv_path="./Dongjak_Restaurants.csv",
+    geocoder=None,
+    workers=8,
+    batch_size=500,
+    cache_path="./geocode_cache.sqlite3",
+    checkpoint_path="./load_restaurants.checkpoint.json",
+    unsaved_path="./unsaved_restaurant.csv",
+):
+    """
+    식당 CSV 를 DB 에 적재
+
+    * 주소 -> 좌표 변환은 워커 풀에서 병렬로 처리하고 디스크 캐시에 저장
+    * batch_size 행마다 bulk_create 후 체크포인트 기록 (재실행 시 이어서 진행)
+    * 이미 있는 (name, address, category) 식당은 건너뜀 (체크포인트 기록 전에 중단되거나 처음부터 다시 실행해도 중복 없음)
+    * 좌표/카테고리를 얻지 못한 행은 unsaved_path 에 기록
+    """
+    cache = GeocodeCache(cache_path)
+    geocoder = CachedGeocoder(geocoder or kakao_map_api.addr_to_coords, cache)
 
-    # csv 파일 읽기
     with open(csv_path, "r") as f:
-        reader = csv.reader(f)
-        header = next(reader, None)
-        
-        try:
-            # csv 데이터를 DB에 삽입
-            unsaved = []
-            cnt = 1
-            for row in reader:
-                name = row[2]
-                address = row[4]
-                
-                category = parse_category(row[6])
-                latitude, longitude = kakao_map_api.addr_to_coords(address)
-                if not (category and latitude):
-                    unsaved.append(row)
-                    print(f"{(cnt*100/8528):.2f}% {cnt}: {name} not saved ------------------------!")
-                    cnt += 1
+        rows = list(csv.reader(f))
+    header, rows = rows[0], rows[1:]
+    total = len(rows)
+    start = read_checkpoint(checkpoint_path, csv_path)
+    if start:
+        print(f"Resuming from row {start}/{total}")
+
+    unsaved_count = 0
+    processed = 0
+    existing = Restaurant.objects.count()
+    with make_executor(workers) as executor, open(unsaved_path, "a" if start else "w", newline="") as unsaved_file:
+        unsaved_writer = csv.writer(unsaved_file)
+        if not start:
+            unsaved_writer.writerow(header)
+        for batch_start in range(start, total, batch_size):
+            batch = rows[batch_start:batch_start + batch_size]
+            results = geocode_many([row[4] for row in batch], geocoder, executor)
+
+            restaurants = []
+            for row, (coords, error) in zip(batch, results):
+                if error is not None:
+                    print(f"{row[2]} not saved: {error}")
+                if coords is None or not parse_category(row[6]):
+                    unsaved_writer.writerow(row)
+                    unsaved_count += 1
                     continue
-                location = GEOSGeometry(f"POINT({longitude} {latitude})", srid=4326)
-                
-                new_restaurant, created = Restaurant.objects.get_or_create(
-                    name=name,
-                    category=category,
-                    longitude=longitude,
-                    latitude=latitude,
-                    location=location,
-                    address=address,
-                )
-                new_restaurant.save()
-                print(f"{(cnt*100/8528):.2f}% {cnt}: {name} saved")
-                cnt += 1
-                
-            print("Restaurants are saved successfully.")
-        except Exception: pass
-        if unsaved:
-            with open("./unsaved_restaurant.csv", "w") as f:
-                f.write(','.join(header)+'\n')
-                for row in unsaved:
-                    if str(row[3]).__contains__(','):
-                        row[3] = f"\"{row[3]}\""
-                    f.write(','.join(row)+'\n')
-            print("Unsaved restaurants:")
-            print(str(unsaved).replace('],','],\n'))
-        
+                restaurants.append(build_restaurant(row, coords))
+
+            with transaction.atomic():
+                restaurants = new_restaurants(restaurants)
+                Restaurant.objects.bulk_create(restaurants, batch_size=batch_size)
+            unsaved_file.flush()
+            processed += len(restaurants)
+            next_row = batch_start + len(batch)
+            write_checkpoint(checkpoint_path, csv_path, next_row)
+            print(f"{(next_row*100/total):.2f}% {next_row}/{total}: {processed} saved, {unsaved_count} not saved")
+
+    cache.close()
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    # bulk_create 는 post_save 를 보내지 않으므로 인덱스/캐시 갱신을 위해 버전 증가
+    bump_version()
+    print(f"Restaurants are saved successfully. ({Restaurant.objects.count() - existing} new)")
+    if unsaved_count:
+        print(f"{unsaved_count} unsaved restaurants are written to {unsaved_path}")
+
 
 if __name__ == "__main__":
-    load_restaurants_data()
-    
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="식당 CSV 적재")
+    parser.add_argument("--csv", default="./Dongjak_Restaurants.csv")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--geocode-cache", default="./geocode_cache.sqlite3")
+    parser.add_argument("--stub-geocoder", help="주소,경도,위도 CSV (Kakao API 대신 사용)")
+    args = parser.parse_args()
+
+    load_restaurants_data(
+        csv_path=args.csv,
+        geocoder=StubGeocoder(csv_path=args.stub_geocoder) if args.stub_geocoder else None,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        cache_path=args.geocode_cache,
+    )
@@ -0,0 +1,360 @@
+import math
+import re
+import threading
+from bisect import insort
+
+from django.db import DEFAULT_DB_ALIAS
+
+from utils.geo import haversine
+from .dataset import current_version
+
+# 한글 음절 분해 (유니코드 '가' ~ '힣')
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+CHOSEONG_SET = frozenset(CHOSEONG)
+
+# 노드마다 보관하는 후보 수 (별점 순 상위)
+NODE_CANDIDATES = 64
+# 위치 기반 후보용 격자 칸 크기 (도, 위도 기준 약 2.2km) 와 칸별 노드 후보 수
+CELL_DEG = 0.02
+CELL_CANDIDATES = 16
+# 점수 = 별점(0~1) * STAR_WEIGHT + 근접도(0~1) * PROXIMITY_WEIGHT
+STAR_WEIGHT = 1.0
+PROXIMITY_WEIGHT = 1.0
+# 이 거리(m)에서 근접도가 1/e 로 감소
+PROXIMITY_SCALE_M = 1000
+
+
+def is_syllable(char):
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def choseong(char):
+    """
+    음절의 초성 (한글 음절이 아니면 그대로)
+    """
+    if is_syllable(char):
+        return CHOSEONG[(ord(char) - HANGUL_BASE) // (JUNGSEONG_COUNT * JONGSEONG_COUNT)]
+    return char
+
+
+def choseong_string(text):
+    return "".join(choseong(char) for char in text)
+
+
+def normalize(text):
+    return re.sub(r"\s+", " ", text or "").strip().lower()
+
+
+def name_keys(name):
+    """
+    이름 -> trie key 목록
+
+    공백 제거한 이름과 단어 시작 위치부터의 접미사("김밥천국 노량진점" -> "노량진점"),
+    그리고 각각의 초성 문자열
+    """
+    words = normalize(name).split(" ")
+    keys = set()
+    for i in range(len(words)):
+        key = "".join(words[i:])
+        if key:
+            keys.add(key)
+            keys.add(choseong_string(key))
+    return keys
+
+
+def _matches_partial(char, typed):
+    """
+    입력 중인 마지막 글자 typed 가 char 의 앞부분인지
+    (초성만 입력: 'ㅂ' -> '밥', 받침 없이 입력: '바' -> '밥')
+    """
+    if char == typed:
+        return True
+    if typed in CHOSEONG_SET:
+        return choseong(char) == typed
+    if is_syllable(char) and is_syllable(typed):
+        typed_offset = ord(typed) - HANGUL_BASE
+        if typed_offset % JONGSEONG_COUNT == 0:
+            return (ord(char) - HANGUL_BASE) // JONGSEONG_COUNT == typed_offset // JONGSEONG_COUNT
+    return False
+
+
+class TrieNode:
+    __slots__ = ("children", "terminal", "top")
+
+    def __init__(self):
+        self.children = {}
+        # 이 노드에서 끝나는 key 의 식당 id
+        self.terminal = set()
+        # 하위 트리 식당 중 별점 상위 limit 개 [(-weight, restaurant_id), ...]
+        self.top = []
+
+    def _offer(self, item, limit):
+        if item in self.top:
+            return
+        if len(self.top) < limit or item < self.top[-1]:
+            insort(self.top, item)
+            del self.top[limit:]
+
+    def _discard(self, item, entries, limit):
+        """
+        후보 목록에서 item 제거 (목록이 가득 차 있었으면 하위 트리로부터 다시 채움)
+        """
+        if item not in self.top:
+            return
+        if len(self.top) < limit:
+            self.top.remove(item)
+        else:
+            self._recompute(entries, limit)
+
+    def _recompute(self, entries, limit):
+        items = {(-entries[restaurant_id][1], restaurant_id) for restaurant_id in self.terminal}
+        for child in self.children.values():
+            items.update(child.top)
+        self.top = sorted(items)[:limit]
+
+
+class PrefixTrie:
+    """
+    key prefix -> 별점 상위 limit 개 식당 id
+    """
+    def __init__(self, limit):
+        self.limit = limit
+        self.root = TrieNode()
+
+    def __bool__(self):
+        return bool(self.root.children)
+
+    def insert(self, restaurant_id, keys, item):
+        for key in keys:
+            node = self.root
+            node._offer(item, self.limit)
+            for char in key:
+                node = node.children.setdefault(char, TrieNode())
+                node._offer(item, self.limit)
+            node.terminal.add(restaurant_id)
+
+    def insert_keys(self, restaurant_id, keys):
+        """
+        초기 적재용: key 만 넣고 후보 목록은 recompute_all 에서 한 번에 계산
+        """
+        for key in keys:
+            node = self.root
+            for char in key:
+                node = node.children.setdefault(char, TrieNode())
+            node.terminal.add(restaurant_id)
+
+    def recompute_all(self, entries):
+        # 잎에서부터 후보 목록 계산
+        stack = [(self.root, False)]
+        while stack:
+            node, visited = stack.pop()
+            if visited:
+                node._recompute(entries, self.limit)
+            else:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+
+    def remove(self, restaurant_id, keys, item, entries):
+        for key in keys:
+            path = [self.root]
+            for char in key:
+                node = path[-1].children.get(char)
+                if node is None:
+                    break
+                path.append(node)
+            else:
+                path[-1].terminal.discard(restaurant_id)
+            # 잎에서 뿌리 방향으로 후보 목록 재계산, 빈 노드 제거
+            for depth in range(len(path) - 1, -1, -1):
+                node = path[depth]
+                if depth and not node.terminal and not node.children:
+                    del path[depth - 1].children[key[depth - 1]]
+                    continue
+                node._discard(item, entries, self.limit)
+
+    def candidates(self, key):
+        node = self.root
+        for char in key:
+            node = node.children.get(char)
+            if node is None:
+                break
+        else:
+            return [restaurant_id for _, restaurant_id in node.top]
+
+        # 마지막 글자를 입력 중인 경우 ('김바' -> '김밥')
+        node = self.root
+        for char in key[:-1]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        items = set()
+        for char, child in node.children.items():
+            if _matches_partial(char, key[-1]):
+                items.update(child.top)
+        return [restaurant_id for _, restaurant_id in sorted(items)[:self.limit]]
+
+
+def grid_cell(latitude, longitude):
+    return int(math.floor(latitude / CELL_DEG)), int(math.floor(longitude / CELL_DEG))
+
+
+class AutocompleteIndex:
+    """
+    식당 이름 prefix trie (초성 key 포함)
+
+    각 노드가 하위 트리의 별점 상위 후보를 들고 있어 한 글자 입력마다
+    prefix 길이 + 후보 수 만큼만 계산한다 (DB 조회 없음).
+
+    전체 trie 의 후보는 별점 상위 NODE_CANDIDATES 개뿐이라 짧은 prefix 에서는 가까운 저평점 식당이
+    빠질 수 있으므로, 격자 칸(CELL_DEG)마다 같은 trie 를 따로 두고 위치가 주어지면
+    주변 3x3 칸의 후보(칸마다 CELL_CANDIDATES 개)를 함께 점수화한다.
+    한 칸 안에서 prefix 가 같은 식당이 CELL_CANDIDATES 개를 넘으면 그 안의 저평점 식당은 여전히 빠진다.
+    """
+    def __init__(self):
+        self.version = None
+        self.trie = PrefixTrie(NODE_CANDIDATES)
+        # 격자 칸 -> PrefixTrie
+        self.cells = {}
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _cell_trie(self, latitude, longitude):
+        cell = grid_cell(latitude, longitude)
+        trie = self.cells.get(cell)
+        if trie is None:
+            trie = self.cells[cell] = PrefixTrie(CELL_CANDIDATES)
+        return trie
+
+    def add(self, restaurant_id, name, star_avg, latitude, longitude):
+        with self._lock:
+            if restaurant_id in self._entries:
+                self._remove(restaurant_id)
+            weight = float(star_avg or 0)
+            latitude, longitude = float(latitude), float(longitude)
+            self._entries[restaurant_id] = (name, weight, latitude, longitude)
+            item = (-weight, restaurant_id)
+            keys = name_keys(name)
+            self.trie.insert(restaurant_id, keys, item)
+            self._cell_trie(latitude, longitude).insert(restaurant_id, keys, item)
+
+    def load(self, rows):
+        """
+        초기 적재: key 를 모두 넣은 뒤 후보 목록을 잎에서부터 한 번에 계산
+        """
+        with self._lock:
+            for restaurant_id, name, star_avg, latitude, longitude in rows:
+                latitude, longitude = float(latitude), float(longitude)
+                self._entries[restaurant_id] = (name, float(star_avg or 0), latitude, longitude)
+                keys = name_keys(name)
+                self.trie.insert_keys(restaurant_id, keys)
+                self._cell_trie(latitude, longitude).insert_keys(restaurant_id, keys)
+            self.trie.recompute_all(self._entries)
+            for trie in self.cells.values():
+                trie.recompute_all(self._entries)
+
+    def remove(self, restaurant_id):
+        with self._lock:
+            self._remove(restaurant_id)
+
+    def _remove(self, restaurant_id):
+        entry = self._entries.get(restaurant_id)
+        if entry is None:
+            return
+        name, weight, latitude, longitude = entry
+        item = (-weight, restaurant_id)
+        keys = name_keys(name)
+        self.trie.remove(restaurant_id, keys, item, self._entries)
+        cell = grid_cell(latitude, longitude)
+        trie = self.cells.get(cell)
+        if trie is not None:
+            trie.remove(restaurant_id, keys, item, self._entries)
+            if not trie:
+                del self.cells[cell]
+        del self._entries[restaurant_id]
+
+    def _candidates(self, query, latitude=None, longitude=None):
+        key = "".join(normalize(query).split(" "))
+        if not key:
+            return []
+        candidates = set(self.trie.candidates(key))
+        if latitude is not None and longitude is not None:
+            row, col = grid_cell(latitude, longitude)
+            for cell in ((row + i, col + j) for i in (-1, 0, 1) for j in (-1, 0, 1)):
+                trie = self.cells.get(cell)
+                if trie is not None:
+                    candidates.update(trie.candidates(key))
+        return candidates
+
+    def complete(self, query, latitude=None, longitude=None, limit=10):
+        """
+        입력 중인 이름의 자동완성 후보를 별점, 거리 가중치 순으로 반환
+
+        Returns:
+            * [(restaurant_id, name, star_avg, distance or None), ...]
+        """
+        with self._lock:
+            candidates = [
+                (rid, self._entries[rid]) for rid in self._candidates(query, latitude, longitude) if rid in self._entries
+            ]
+
+        results = []
+        for restaurant_id, (name, weight, lat, lng) in candidates:
+            score = weight / 5 * STAR_WEIGHT
+            distance = None
+            if latitude is not None and longitude is not None:
+                distance = haversine(latitude, longitude, lat, lng)
+                score += math.exp(-distance / PROXIMITY_SCALE_M) * PROXIMITY_WEIGHT
+            results.append((score, restaurant_id, name, weight, distance))
+        results.sort(key=lambda result: (-result[0], result[1]))
+        return [(restaurant_id, name, weight, distance) for _, restaurant_id, name, weight, distance in results[:limit]]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def build_index():
+    from .models import Restaurant
+
+    index = AutocompleteIndex()
+    # 데이터셋 버전과 맞도록 replica 가 아닌 primary 에서 읽음
+    rows = Restaurant.objects.using(DEFAULT_DB_ALIAS).values_list("restaurant_id", "name", "star_avg", "latitude", "longitude")
+    index.load(rows.iterator(chunk_size=2000))
+    return index
+
+
+def get_index():
+    """
+    워커 프로세스별 자동완성 trie (데이터셋 버전이 바뀌면 재생성)
+    """
+    global _index
+    version = current_version()
+    if _index is not None and _index.version == version:
+        return _index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            index = build_index()
+            index.version = version
+            _index = index
+    return _index
+
+
+def apply_change(restaurant=None, restaurant_id=None, version=None):
+    """
+    post_save / post_delete 시 워커의 trie 를 증분 갱신 (spatial_index.apply_change 와 동일한 규칙)
+    """
+    index = _index
+    if index is None or version is None or index.version != version - 1:
+        return
+    if restaurant is not None:
+        index.add(restaurant.restaurant_id, restaurant.name, restaurant.star_avg, restaurant.latitude, restaurant.longitude)
+    else:
+        index.remove(restaurant_id)
+    index.version = version
@@ -0,0 +1,32 @@
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
+from django.db import transaction
+
+
+def waiting_group(restaurant_id):
+    return f"waiting_{restaurant_id}"
+
+
+def publish_queue_change(restaurant_id, event, position):
+    """
+    웨이팅 큐 변경을 구독 중인 클라이언트에 전송 (트랜잭션 커밋 후)
+
+    Args:
+        * restaurant_id (int): 식당 id
+        * event (str): "joined" (대기 추가), "left" (대기 취소), "entered" (입장)
+        * position (int): 변경된 순번. left/entered 이면 이 순번 뒤의 대기자는 한 칸씩 당겨짐
+    """
+    channel_layer = get_channel_layer()
+    if channel_layer is None:
+        return
+    message = {
+        "type": "queue.update",
+        "data": {
+            "restaurant_id": restaurant_id,
+            "event": event,
+            "position": position,
+        },
+    }
+    transaction.on_commit(
+        lambda: async_to_sync(channel_layer.group_send)(waiting_group(restaurant_id), message)
+    )
@@ -0,0 +1,34 @@
+from channels.db import database_sync_to_async
+from channels.generic.websocket import AsyncJsonWebsocketConsumer
+
+from .broadcast import waiting_group
+from .queues import get_queue_backend, ensure_queue_loaded
+
+
+class WaitingQueueConsumer(AsyncJsonWebsocketConsumer):
+    """
+    식당 웨이팅 큐 구독 (ws/restaurants/<restaurant_id>/waitings/)
+
+    연결 시 현재 대기 인원을 보내고, 이후 큐가 바뀔 때마다 변경 내용을 push
+    """
+    async def connect(self):
+        self.restaurant_id = self.scope["url_route"]["kwargs"]["restaurant_id"]
+        self.group_name = waiting_group(self.restaurant_id)
+        await self.channel_layer.group_add(self.group_name, self.channel_name)
+        await self.accept()
+        await self.send_json({
+            "restaurant_id": self.restaurant_id,
+            "event": "snapshot",
+            "length": await self.queue_length(),
+        })
+
+    async def disconnect(self, code):
+        await self.channel_layer.group_discard(self.group_name, self.channel_name)
+
+    async def queue_update(self, event):
+        await self.send_json(event["data"])
+
+    @database_sync_to_async
+    def queue_length(self):
+        ensure_queue_loaded(self.restaurant_id)
+        return get_queue_backend().length(self.restaurant_id)
@@ -0,0 +1,47 @@
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import DEFAULT_DB_ALIAS, connections
+
+DATASET_VERSION_KEY = "restaurants:dataset_version"
+# 공유 캐시가 없을 때 버전을 저장하는 Postgres sequence (migration 0007)
+DATASET_VERSION_SEQUENCE = "Restaurant_dataset_version"
+
+
+def shared_cache():
+    """
+    기본 캐시를 워커 / dyno 끼리 공유하는지 (LocMemCache 는 프로세스별)
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def _sequence(sql):
+    with connections[DEFAULT_DB_ALIAS].cursor() as cursor:
+        cursor.execute(sql)
+        return cursor.fetchone()[0]
+
+
+def current_version():
+    """
+    Restaurant 데이터셋 버전 (워커 간 공유 캐시, 없으면 Postgres sequence 에 저장)
+    """
+    if not shared_cache():
+        return _sequence(f'SELECT last_value FROM "{DATASET_VERSION_SEQUENCE}"')
+    version = cache.get(DATASET_VERSION_KEY)
+    if version is None:
+        cache.add(DATASET_VERSION_KEY, 1, timeout=None)
+        version = cache.get(DATASET_VERSION_KEY, 1)
+    return version
+
+
+def bump_version():
+    """
+    Restaurant 생성/수정/삭제 시 데이터셋 버전 증가
+    """
+    if not shared_cache():
+        return _sequence(f"SELECT nextval('\"{DATASET_VERSION_SEQUENCE}\"')")
+    try:
+        return cache.incr(DATASET_VERSION_KEY)
+    except ValueError:
+        cache.add(DATASET_VERSION_KEY, 1, timeout=None)
+        return cache.incr(DATASET_VERSION_KEY)
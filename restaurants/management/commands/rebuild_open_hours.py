@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from restaurants.dataset import bump_version
+from restaurants.schedule import rebuild_open_hours
+
+
+class Command(BaseCommand):
+    help = "운영시간 필드(is_24_hours, day_of_week, start_time, end_time)로부터 모든 식당의 주간 영업시간 비트맵(open_hours)을 재계산"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = rebuild_open_hours()
+            transaction.on_commit(bump_version)
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt open hours for {updated} restaurants."))
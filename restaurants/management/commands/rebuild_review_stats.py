@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from restaurants.models import Restaurant
+
+
+class Command(BaseCommand):
+    help = "Review 테이블로부터 모든 식당의 리뷰 집계(review_count, star_sum, 별점 분포, star_avg)를 재계산"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            updated = Restaurant.rebuild_review_stats()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt review stats for {updated} restaurants."))
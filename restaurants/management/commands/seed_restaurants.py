@@ -0,0 +1,107 @@
+import math
+import random
+from datetime import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.utils import timezone
+
+from restaurants.dataset import bump_version
+from restaurants.schedule import build_schedule
+from utils.bulk_copy import copy_rows
+from utils.category import category_mask, category_name
+
+# 동작구 경계 (위도, 경도)와 Dongjak_Restaurants.csv 의 식당 수
+DONGJAK_BOUNDS = ((37.4750, 126.9050), (37.5150, 126.9850))
+DONGJAK_RESTAURANTS = 4510
+# 상권(식당이 몰린 지점) 하나에 평균 식당 수
+RESTAURANTS_PER_HOTSPOT = 150
+# 상권 중심에서의 표준편차 (도)
+HOTSPOT_SPREAD_DEG = 0.002
+
+NAME_PREFIXES = ["김밥", "국밥", "돈까스", "짬뽕", "초밥", "파스타", "치킨", "족발", "떡볶이", "카페", "포차", "버거", "라멘", "곱창", "냉면"]
+NAME_SUFFIXES = ["천국", "나라", "하우스", "명가", "상회", "식당", "공방", "집", "본점", "키친"]
+DONGS = ["노량진동", "상도동", "흑석동", "사당동", "대방동", "신대방동", "본동", "동작동"]
+CATEGORIES = sorted(category_name)
+# 카테고리 선택 가중치 (한식, 카페, 술집이 많음)
+CATEGORY_WEIGHTS = [3, 30, 8, 8, 8, 12, 6, 3, 22]
+
+
+def synthetic_bounds(count):
+    """
+    식당 수에 맞춰 넓힌 영역 (식당 밀도를 동작구와 비슷하게 유지)
+    """
+    (south, west), (north, east) = DONGJAK_BOUNDS
+    scale = math.sqrt(max(count, DONGJAK_RESTAURANTS) / DONGJAK_RESTAURANTS)
+    center_lat, center_lng = (south + north) / 2, (west + east) / 2
+    half_lat, half_lng = (north - south) / 2 * scale, (east - west) / 2 * scale
+    return (center_lat - half_lat, center_lng - half_lng), (center_lat + half_lat, center_lng + half_lng)
+
+
+def restaurant_rows(rng, count, now):
+    """
+    같은 seed 면 같은 식당 행을 생성 (상권 주변에 모인 위치, 카테고리, 영업시간)
+    """
+    (south, west), (north, east) = synthetic_bounds(count)
+    hotspots = [
+        (rng.uniform(south, north), rng.uniform(west, east))
+        for _ in range(max(1, count // RESTAURANTS_PER_HOTSPOT))
+    ]
+    for i in range(count):
+        # 80% 는 상권 주변, 나머지는 영역 전체에 고르게
+        if rng.random() < 0.8:
+            center_lat, center_lng = rng.choice(hotspots)
+            latitude = min(max(rng.gauss(center_lat, HOTSPOT_SPREAD_DEG), south), north)
+            longitude = min(max(rng.gauss(center_lng, HOTSPOT_SPREAD_DEG), west), east)
+        else:
+            latitude, longitude = rng.uniform(south, north), rng.uniform(west, east)
+        latitude, longitude = round(latitude, 7), round(longitude, 7)
+
+        categories = sorted(set(rng.choices(CATEGORIES, CATEGORY_WEIGHTS, k=rng.choice((1, 1, 1, 2)))))
+        if rng.random() < 0.3:
+            is_24_hours, day_of_week, start_time, end_time = True, [], None, None
+        else:
+            is_24_hours = False
+            day_of_week = [] if rng.random() < 0.6 else sorted(rng.sample(range(7), rng.randint(5, 6)))
+            start_time = time(rng.randint(7, 12), rng.choice((0, 30)))
+            end_time = time(rng.choice((20, 21, 22, 23, 0, 1, 2)), rng.choice((0, 30)))
+        dong = rng.choice(DONGS)
+
+        yield (
+            f"{rng.choice(NAME_PREFIXES)}{rng.choice(NAME_SUFFIXES)} {dong[:-1]}{i}호점",
+            categories,
+            category_mask(categories),
+            longitude,
+            latitude,
+            f"SRID=4326;POINT({longitude} {latitude})",
+            f"서울특별시 동작구 {dong} {rng.randint(1, 400)}-{rng.randint(1, 30)}",
+            0,
+            "",
+            is_24_hours,
+            day_of_week,
+            start_time,
+            end_time,
+            "\\x" + build_schedule(is_24_hours, day_of_week, start_time, end_time).hex(),
+            now,
+            now,
+        )
+
+
+class Command(BaseCommand):
+    help = "동작구 주변에 합성 식당 데이터를 PostgreSQL COPY 로 대량 적재 (벤치마크용, 같은 seed 면 같은 데이터)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--restaurants", type=int, default=10000, help="생성할 식당 수")
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (같은 seed 면 같은 데이터)")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        with transaction.atomic(), connection.cursor() as cursor:
+            created = copy_rows(cursor, "Restaurant",
+                ["name", "category", "category_mask", "longitude", "latitude", "location", "address", "star_avg", "image",
+                 "is_24_hours", "day_of_week", "start_time", "end_time", "open_hours", "created_at", "updated_at"],
+                restaurant_rows(rng, options["restaurants"], timezone.now()),
+                force_not_null=["image"])
+            # COPY 는 signal 을 거치지 않으므로 인덱스/캐시 갱신을 위해 버전 증가
+            transaction.on_commit(bump_version)
+        self.stdout.write(self.style.SUCCESS(f"{created} restaurants copied."))
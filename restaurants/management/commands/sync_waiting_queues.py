@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from restaurants.models import ReservationQueue
+from restaurants.queues import sync_queue
+
+
+class Command(BaseCommand):
+    help = "Postgres 의 ReservationQueue 기록으로 웨이팅 큐 백엔드를 다시 채움"
+
+    def handle(self, *args, **options):
+        restaurant_ids = ReservationQueue.objects.values_list("restaurant_id", flat=True).distinct()
+        for restaurant_id in restaurant_ids:
+            size = sync_queue(restaurant_id)
+            self.stdout.write(f"{restaurant_id}: {size} waiting")
+        self.stdout.write(self.style.SUCCESS("Waiting queues synced."))
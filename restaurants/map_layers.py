@@ -0,0 +1,113 @@
+import gzip
+import hashlib
+import json
+import threading
+from array import array
+
+from django.db import DEFAULT_DB_ALIAS
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.http import parse_etags
+
+from utils.category import category_bit
+from .dataset import current_version
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 시 gzip 만 제공
+    brotli = None
+
+
+class MapLayer:
+    """
+    카테고리별 지도 핀 스냅샷
+
+    id / 위도 / 경도를 배열로 보관하고, 응답 JSON 을 원본, gzip, brotli 로
+    미리 직렬화해 둔다. 데이터셋 버전이 바뀌기 전까지 재사용.
+    """
+    def __init__(self, category, version, rows):
+        self.category = category
+        self.version = version
+        self.restaurant_ids = array("l")
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        for restaurant_id, latitude, longitude in rows:
+            self.restaurant_ids.append(restaurant_id)
+            self.latitudes.append(float(latitude))
+            self.longitudes.append(float(longitude))
+
+        self.body = json.dumps({
+            "status": "success",
+            "message": "All restaurants retrieved successfully",
+            "restaurants": [
+                {"restaurant_id": restaurant_id, "lat": latitude, "lng": longitude}
+                for restaurant_id, latitude, longitude in zip(self.restaurant_ids, self.latitudes, self.longitudes)
+            ],
+        }, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag = f'W/"{hashlib.md5(self.body).hexdigest()}"'
+        self.encoded = {"gzip": gzip.compress(self.body, compresslevel=9)}
+        if brotli is not None:
+            self.encoded["br"] = brotli.compress(self.body, quality=11)
+
+    def __len__(self):
+        return len(self.restaurant_ids)
+
+    def response(self, request):
+        """
+        If-None-Match 가 일치하면 304, 아니면 Accept-Encoding 에 맞는 미리 압축된 본문
+        """
+        etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+        if "*" in etags or self.etag in etags or self.etag[2:] in etags:
+            response = HttpResponseNotModified()
+        else:
+            encoding = self._negotiate(request.META.get("HTTP_ACCEPT_ENCODING", ""))
+            response = HttpResponse(self.encoded.get(encoding, self.body), content_type="application/json")
+            if encoding in self.encoded:
+                response["Content-Encoding"] = encoding
+        response["ETag"] = self.etag
+        response["Vary"] = "Accept-Encoding"
+        response["Cache-Control"] = "no-cache"
+        return response
+
+    def _negotiate(self, accept_encoding):
+        accepted = set()
+        for token in accept_encoding.split(","):
+            coding, _, params = token.strip().partition(";")
+            if params.replace(" ", "") in ("q=0", "q=0.0"):
+                continue
+            accepted.add(coding.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.encoded:
+                return encoding
+        return None
+
+
+_layers = {}
+_layers_lock = threading.Lock()
+
+
+def build_map_layer(category, version):
+    from .models import Restaurant
+
+    rows = (
+        # 데이터셋 버전과 맞도록 replica 가 아닌 primary 에서 읽음
+        Restaurant.objects.using(DEFAULT_DB_ALIAS).filter(category_mask__bitany=category_bit(category))
+        .order_by("restaurant_id")
+        .values_list("restaurant_id", "latitude", "longitude")
+    )
+    return MapLayer(category, version, rows.iterator(chunk_size=2000))
+
+
+def get_map_layer(category):
+    """
+    워커 프로세스별 카테고리 스냅샷 (데이터셋 버전이 바뀌면 재생성)
+    """
+    version = current_version()
+    layer = _layers.get(category)
+    if layer is not None and layer.version == version:
+        return layer
+    with _layers_lock:
+        layer = _layers.get(category)
+        if layer is None or layer.version != version:
+            layer = build_map_layer(category, version)
+            _layers[category] = layer
+    return layer
@@ -0,0 +1,72 @@
+# Restaurant 는 managed = False 이므로 컬럼은 RunSQL 로 추가
+
+from django.db import migrations
+
+# 기존 리뷰로 집계 컬럼 채우기 (restaurants.models.REBUILD_REVIEW_STATS_SQL 의 이 시점 사본)
+REBUILD_REVIEW_STATS_SQL = """
+    UPDATE "Restaurant" AS r SET
+        review_count = s.review_count,
+        star_sum = s.star_sum,
+        star_1_count = s.star_1_count,
+        star_2_count = s.star_2_count,
+        star_3_count = s.star_3_count,
+        star_4_count = s.star_4_count,
+        star_5_count = s.star_5_count,
+        latest_review_at = s.latest_review_at,
+        star_avg = CASE WHEN s.review_count > 0
+            THEN ROUND(s.star_sum::numeric / s.review_count, 2) ELSE 0 END
+    FROM (
+        SELECT
+            r2.restaurant_id,
+            COUNT(v.review_id) AS review_count,
+            COALESCE(SUM(v.stars), 0) AS star_sum,
+            COUNT(*) FILTER (WHERE v.stars = 1) AS star_1_count,
+            COUNT(*) FILTER (WHERE v.stars = 2) AS star_2_count,
+            COUNT(*) FILTER (WHERE v.stars = 3) AS star_3_count,
+            COUNT(*) FILTER (WHERE v.stars = 4) AS star_4_count,
+            COUNT(*) FILTER (WHERE v.stars = 5) AS star_5_count,
+            MAX(v.created_at) AS latest_review_at
+        FROM "Restaurant" AS r2
+        LEFT JOIN "Review" AS v ON v.restaurant_id = r2.restaurant_id
+        GROUP BY r2.restaurant_id
+    ) AS s
+    WHERE r.restaurant_id = s.restaurant_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0002_reservation_reservationqueue'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                ALTER TABLE "Restaurant"
+                    ADD COLUMN IF NOT EXISTS review_count integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS star_sum integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS star_1_count integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS star_2_count integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS star_3_count integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS star_4_count integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS star_5_count integer NOT NULL DEFAULT 0,
+                    ADD COLUMN IF NOT EXISTS latest_review_at timestamp with time zone NULL;
+                CREATE INDEX IF NOT EXISTS "Review_restaurant_id_created_at_idx"
+                    ON "Review" (restaurant_id, created_at DESC);
+            ''',
+            reverse_sql='''
+                DROP INDEX IF EXISTS "Review_restaurant_id_created_at_idx";
+                ALTER TABLE "Restaurant"
+                    DROP COLUMN IF EXISTS review_count,
+                    DROP COLUMN IF EXISTS star_sum,
+                    DROP COLUMN IF EXISTS star_1_count,
+                    DROP COLUMN IF EXISTS star_2_count,
+                    DROP COLUMN IF EXISTS star_3_count,
+                    DROP COLUMN IF EXISTS star_4_count,
+                    DROP COLUMN IF EXISTS star_5_count,
+                    DROP COLUMN IF EXISTS latest_review_at;
+            ''',
+        ),
+        migrations.RunSQL(REBUILD_REVIEW_STATS_SQL, reverse_sql=migrations.RunSQL.noop),
+    ]
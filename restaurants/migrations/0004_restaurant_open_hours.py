@@ -0,0 +1,75 @@
+# Restaurant 는 managed = False 이므로 컬럼은 RunSQL 로 추가
+
+from django.db import migrations
+
+# 이 시점의 주간 영업시간 비트맵 계산 (restaurants.schedule.schedule_bits 의 사본)
+# 7일 x 96칸(15분) = 672 비트, 84 bytes little endian
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+SCHEDULE_BYTES = 7 * SLOTS_PER_DAY // 8
+BATCH_SIZE = 1000
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def schedule_bits(is_24_hours, day_of_week, start_time, end_time):
+    days = sorted(set(day_of_week)) if day_of_week else range(7)
+    full_day = (1 << SLOTS_PER_DAY) - 1
+    bits = 0
+    if is_24_hours:
+        for day in days:
+            bits |= full_day << (day * SLOTS_PER_DAY)
+        return bits
+    if start_time is None or end_time is None:
+        return 0
+
+    start = _minutes(start_time) // SLOT_MINUTES
+    end = -(-_minutes(end_time) // SLOT_MINUTES)
+    for day in days:
+        base = day * SLOTS_PER_DAY
+        if start == end:
+            bits |= full_day << base
+        elif start < end:
+            bits |= ((1 << (end - start)) - 1) << (base + start)
+        else:
+            bits |= ((1 << (SLOTS_PER_DAY - start)) - 1) << (base + start)
+            next_base = (day + 1) % 7 * SLOTS_PER_DAY
+            bits |= ((1 << end) - 1) << next_base
+    return bits
+
+
+def rebuild_open_hours(apps, schema_editor):
+    # 마이그레이션 상태의 Restaurant 에는 운영시간 필드가 없으므로 (managed = False, 컬럼은 RunSQL 로 관리)
+    # 이 마이그레이션의 연결로 직접 읽고 쓴다
+    connection = schema_editor.connection
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT restaurant_id, is_24_hours, day_of_week, start_time, end_time FROM "Restaurant"')
+        rows = cursor.fetchall()
+        updates = [
+            (schedule_bits(is_24_hours, day_of_week, start_time, end_time).to_bytes(SCHEDULE_BYTES, "little"), restaurant_id)
+            for restaurant_id, is_24_hours, day_of_week, start_time, end_time in rows
+        ]
+        for i in range(0, len(updates), BATCH_SIZE):
+            cursor.executemany('UPDATE "Restaurant" SET open_hours = %s WHERE restaurant_id = %s', updates[i:i + BATCH_SIZE])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0003_restaurant_review_stats'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                ALTER TABLE "Restaurant"
+                    ADD COLUMN IF NOT EXISTS open_hours bytea NOT NULL DEFAULT decode(repeat('00', 84), 'hex');
+            ''',
+            reverse_sql='''
+                ALTER TABLE "Restaurant" DROP COLUMN IF EXISTS open_hours;
+            ''',
+        ),
+        migrations.RunPython(rebuild_open_hours, migrations.RunPython.noop),
+    ]
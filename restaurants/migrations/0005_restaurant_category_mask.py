@@ -0,0 +1,45 @@
+# Restaurant 는 managed = False 이므로 컬럼과 인덱스는 RunSQL 로 추가
+
+from django.db import migrations
+
+# 이 시점의 카테고리 코드 (utils.category.category_name 의 사본, 비트 = 코드 // 100)
+CATEGORY_CODES = (0, 100, 200, 300, 400, 500, 600, 700, 800)
+CATEGORY_CODES_SQL = ", ".join(str(code) for code in CATEGORY_CODES)
+
+# 카테고리별 부분 GiST 인덱스 (지도 / 타일의 "카테고리 + 영역" 조회용)
+CATEGORY_INDEXES = [
+    (
+        f'CREATE INDEX IF NOT EXISTS "Restaurant_location_category_{code}_idx" '
+        f'ON "Restaurant" USING gist (location) WHERE (category_mask & {1 << (code // 100)}) <> 0;',
+        f'DROP INDEX IF EXISTS "Restaurant_location_category_{code}_idx";',
+    )
+    for code in CATEGORY_CODES
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0004_restaurant_open_hours'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            # 정의되지 않은 코드는 건너뜀 (utils.category.category_mask 와 동일)
+            sql=f'''
+                ALTER TABLE "Restaurant"
+                    ADD COLUMN IF NOT EXISTS category_mask integer NOT NULL DEFAULT 0;
+                UPDATE "Restaurant" SET category_mask = COALESCE(
+                    (SELECT bit_or(1 << (c / 100)) FROM unnest(category) AS c WHERE c IN ({CATEGORY_CODES_SQL})),
+                    0
+                );
+                CREATE INDEX IF NOT EXISTS "Restaurant_category_gin_idx"
+                    ON "Restaurant" USING gin (category);
+            ''',
+            reverse_sql='''
+                DROP INDEX IF EXISTS "Restaurant_category_gin_idx";
+                ALTER TABLE "Restaurant" DROP COLUMN IF EXISTS category_mask;
+            ''',
+        ),
+        *[migrations.RunSQL(sql, reverse_sql=reverse_sql) for sql, reverse_sql in CATEGORY_INDEXES],
+    ]
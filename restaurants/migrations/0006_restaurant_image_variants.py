@@ -0,0 +1,22 @@
+# Restaurant 는 managed = False 이므로 컬럼은 RunSQL 로 추가
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0005_restaurant_category_mask'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                ALTER TABLE "Restaurant"
+                    ADD COLUMN IF NOT EXISTS image_variants jsonb NOT NULL DEFAULT '{}'::jsonb;
+            ''',
+            reverse_sql='''
+                ALTER TABLE "Restaurant" DROP COLUMN IF EXISTS image_variants;
+            ''',
+        ),
+    ]
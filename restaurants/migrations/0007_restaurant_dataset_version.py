@@ -0,0 +1,23 @@
+# 공유 캐시(Redis)가 없을 때 워커 간에 공유하는 데이터셋 버전 (restaurants.dataset)
+# setval(.., 1, true) 로 현재 값을 1 로 두어 첫 nextval 이 2 를 반환하게 한다.
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('restaurants', '0006_restaurant_image_variants'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                CREATE SEQUENCE IF NOT EXISTS "Restaurant_dataset_version";
+                SELECT setval('"Restaurant_dataset_version"', 1, true);
+            ''',
+            reverse_sql='''
+                DROP SEQUENCE IF EXISTS "Restaurant_dataset_version";
+            ''',
+        ),
+    ]
@@ -1,26 +1,120 @@
 from django.contrib.postgres.fields import ArrayField
 from django.contrib.gis.db import models
-from utils.aws import S3ImgUploader
-from config.settings import S3_base_url
+from django.db import connection, transaction
+from django.db.models import F, Lookup, OuterRef, Subquery, Value
+from django.db.models.functions import Cast, Coalesce, Greatest, NullIf
+from decimal import Decimal
+from utils.aws import public_url
+from utils.images import submit_image, submit_upload
+from utils.category import category_mask
+from .schedule import WeeklyScheduleField, build_schedule
 import os
 
+STAR_COUNT_FIELDS = {
+    1: "star_1_count",
+    2: "star_2_count",
+    3: "star_3_count",
+    4: "star_4_count",
+    5: "star_5_count",
+}
+
+# update_review_stats 만 갱신하는 집계 컬럼 (전체 save() 에서 제외)
+REVIEW_STATS_FIELDS = frozenset({
+    "review_count", "star_sum", "star_avg", "latest_review_at", *STAR_COUNT_FIELDS.values(),
+})
+
+REBUILD_REVIEW_STATS_SQL = """
+    UPDATE "Restaurant" AS r SET
+        review_count = s.review_count,
+        star_sum = s.star_sum,
+        star_1_count = s.star_1_count,
+        star_2_count = s.star_2_count,
+        star_3_count = s.star_3_count,
+        star_4_count = s.star_4_count,
+        star_5_count = s.star_5_count,
+        latest_review_at = s.latest_review_at,
+        star_avg = CASE WHEN s.review_count > 0
+            THEN ROUND(s.star_sum::numeric / s.review_count, 2) ELSE 0 END
+    FROM (
+        SELECT
+            r2.restaurant_id,
+            COUNT(v.review_id) AS review_count,
+            COALESCE(SUM(v.stars), 0) AS star_sum,
+            COUNT(*) FILTER (WHERE v.stars = 1) AS star_1_count,
+            COUNT(*) FILTER (WHERE v.stars = 2) AS star_2_count,
+            COUNT(*) FILTER (WHERE v.stars = 3) AS star_3_count,
+            COUNT(*) FILTER (WHERE v.stars = 4) AS star_4_count,
+            COUNT(*) FILTER (WHERE v.stars = 5) AS star_5_count,
+            MAX(v.created_at) AS latest_review_at
+        FROM "Restaurant" AS r2
+        LEFT JOIN "Review" AS v ON v.restaurant_id = r2.restaurant_id
+        GROUP BY r2.restaurant_id
+    ) AS s
+    WHERE r.restaurant_id = s.restaurant_id
+"""
+
+
+class CategoryMaskField(models.IntegerField):
+    """
+    카테고리 bitmask 컬럼 (utils.category.category_mask)
+
+    filter(category_mask__bitall=mask) : mask 의 카테고리를 모두 포함
+    filter(category_mask__bitany=mask) : mask 의 카테고리 중 하나라도 포함
+    """
+
+
+@CategoryMaskField.register_lookup
+class BitAll(Lookup):
+    lookup_name = "bitall"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"({lhs} & {rhs}) = {rhs}", (*lhs_params, *rhs_params, *rhs_params)
+
+
+@CategoryMaskField.register_lookup
+class BitAny(Lookup):
+    lookup_name = "bitany"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"({lhs} & {rhs}) <> 0", (*lhs_params, *rhs_params)
+
 
 class Restaurant(models.Model):
     restaurant_id = models.AutoField(primary_key=True)
     name = models.CharField(max_length=30)
     category = ArrayField(models.IntegerField())
+    # category 의 bitmask (save() 시 계산)
+    category_mask = CategoryMaskField(default=0)
     longitude = models.DecimalField(max_digits=10, decimal_places=7)
     latitude = models.DecimalField(max_digits=10, decimal_places=7)
     location = models.GeometryField(srid=4326)
     address = models.CharField()
     star_avg = models.DecimalField(max_digits=10, decimal_places=2, default=0)
     image = models.URLField()
+    # 이미지 변형 URL {"thumbnail": {"webp": url, "jpeg": url}, "medium": {...}, "original": {...}}
+    image_variants = models.JSONField(default=dict, blank=True)
+
+    # 리뷰 집계 (리뷰 작성/수정/삭제 시 증분 갱신, star_avg = star_sum / review_count)
+    review_count = models.IntegerField(default=0)
+    star_sum = models.IntegerField(default=0)
+    star_1_count = models.IntegerField(default=0)
+    star_2_count = models.IntegerField(default=0)
+    star_3_count = models.IntegerField(default=0)
+    star_4_count = models.IntegerField(default=0)
+    star_5_count = models.IntegerField(default=0)
+    latest_review_at = models.DateTimeField(null=True, blank=True)
     
     is_24_hours = models.BooleanField(default=True)
     day_of_week = ArrayField(models.IntegerField())
     start_time = models.TimeField(null=True)
     end_time = models.TimeField(null=True)
     etc_reason = models.TextField(null=True, blank=True)
+    # 주간 영업시간 비트맵 (운영시간 필드로부터 save() 시 계산)
+    open_hours = WeeklyScheduleField()
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -30,22 +124,111 @@ class Restaurant(models.Model):
     class Meta:
         managed = False
         db_table = "Restaurant"
+
+    def save(self, *args, **kwargs):
+        self.category_mask = category_mask(self.category)
+        self.open_hours = build_schedule(self.is_24_hours, self.day_of_week, self.start_time, self.end_time)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is None and not self._state.adding and not kwargs.get("force_insert"):
+            # 전체 save() 는 앞서 읽은 집계 값을 그대로 쓰므로 그 사이 반영된 리뷰 증분을 덮어쓰지 않도록 제외
+            update_fields = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in REVIEW_STATS_FIELDS
+            ]
+        if update_fields is not None:
+            update_fields = set(update_fields)
+            if "category" in update_fields:
+                update_fields.add("category_mask")
+            if {"is_24_hours", "day_of_week", "start_time", "end_time"} & update_fields:
+                update_fields.add("open_hours")
+            kwargs["update_fields"] = update_fields
+        super().save(*args, **kwargs)
     
-    def update_star_avg(self):
-        # 해당 레스토랑의 리뷰를 기반으로 평균 별점을 계산 후 저장
-        avg_rating = self.review_set.aggregate(models.Avg('stars'))['stars__avg']
-        self.save()
-        return avg_rating if avg_rating is not None else 0
+    @classmethod
+    def update_review_stats(cls, restaurant_id, added=None, removed=None, created_at=None):
+        """
+        리뷰 작성/수정/삭제를 집계에 O(1)로 반영 (단일 UPDATE)
+
+        Args:
+            * restaurant_id (int): 식당 id
+            * added (int): 추가된 리뷰 별점 (작성, 수정 후 별점)
+            * removed (int): 제거된 리뷰 별점 (삭제, 수정 전 별점)
+            * created_at (datetime): 추가된 리뷰 작성 시각
+        """
+        count_delta = (added is not None) - (removed is not None)
+        sum_delta = (added or 0) - (removed or 0)
+        updates = {
+            "review_count": F("review_count") + count_delta,
+            "star_sum": F("star_sum") + sum_delta,
+            "star_avg": Coalesce(
+                Cast(F("star_sum") + sum_delta, models.DecimalField(max_digits=10, decimal_places=2))
+                / NullIf(F("review_count") + count_delta, 0),
+                Value(Decimal(0)),
+            ),
+        }
+        # 1~5 가 아닌 별점은 별점별 개수에 넣지 않음 (REBUILD_REVIEW_STATS_SQL 과 동일)
+        if added != removed:
+            if added is not None and int(added) in STAR_COUNT_FIELDS:
+                field = STAR_COUNT_FIELDS[int(added)]
+                updates[field] = F(field) + 1
+            if removed is not None and int(removed) in STAR_COUNT_FIELDS:
+                field = STAR_COUNT_FIELDS[int(removed)]
+                updates[field] = F(field) - 1
+        if created_at is not None:
+            updates["latest_review_at"] = Greatest(Coalesce(F("latest_review_at"), Value(created_at)), Value(created_at))
+        elif count_delta < 0:
+            from reviews.models import Review
+            updates["latest_review_at"] = Subquery(
+                Review.objects.filter(restaurant_id=OuterRef("restaurant_id"))
+                .order_by("-created_at").values("created_at")[:1]
+            )
+        return cls.objects.filter(restaurant_id=restaurant_id).update(**updates)
+
+    @staticmethod
+    def rebuild_review_stats():
+        """
+        전체 식당의 리뷰 집계를 Review 테이블로부터 한 번에 재계산
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(REBUILD_REVIEW_STATS_SQL)
+            return cursor.rowcount
     
     def save_img(self, img_path):
         if os.path.exists(img_path):
             with open(img_path, "rb") as img:
-                url = S3ImgUploader(img).upload_restaurant_img(self.restaurant_id)
-                self.image = S3_base_url+url
-                self.save()
-                return url
+                self.enqueue_image(img.read())
+                return
         raise Exception('Invalid image file path')
 
+    def enqueue_image(self, data):
+        """
+        이미지 변형 생성 / 업로드를 커밋 후 워커 풀에 맡기고 바로 반환
+
+        완료되면 image(원본 JPEG URL)와 image_variants 를 갱신한다.
+        """
+        prefix, on_done = self._image_job()
+        transaction.on_commit(lambda: submit_image(data, prefix, on_done))
+
+    def attach_upload(self, key):
+        """
+        presigned 직접 업로드 완료 처리
+
+        업로드된 원본을 바로 image 로 연결하고, 변형 생성은 커밋 후 워커 풀에서 원본을 내려받아 처리한다.
+        """
+        self.image = public_url(key)
+        Restaurant.objects.filter(restaurant_id=self.restaurant_id).update(image=self.image)
+        prefix, on_done = self._image_job()
+        transaction.on_commit(lambda: submit_upload(key, prefix, on_done))
+
+    def _image_job(self):
+        restaurant_id = self.restaurant_id
+
+        def on_done(variants):
+            Restaurant.objects.filter(restaurant_id=restaurant_id).update(
+                image=variants["original"]["jpeg"], image_variants=variants,
+            )
+        return f"img/restaurants/{restaurant_id}/", on_done
+
 
 # Restaurant - User 관계의 중간테이블
 class Reservation(models.Model):
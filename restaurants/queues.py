@@ -0,0 +1,399 @@
+import bisect
+import threading
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.utils.module_loading import import_string
+
+# 식당별 웨이팅 큐 advisory lock 의 첫 번째 key (두 번째 key 는 restaurant_id)
+QUEUE_LOCK_KEY = 5101
+
+
+def queue_member(user=None, phone_number=None):
+    """
+    웨이팅 큐에서 회원/비회원을 구분하는 식별자
+    """
+    if user is not None:
+        return f"user:{user.pk}"
+    return f"phone:{phone_number}"
+
+
+def reservation_member(user_id, phone_number):
+    if user_id is not None:
+        return f"user:{user_id}"
+    return queue_member(phone_number=phone_number)
+
+
+def lock_queue(restaurant_id, using=DEFAULT_DB_ALIAS):
+    """
+    식당 웨이팅 큐의 트랜잭션 단위 advisory lock (트랜잭션 안에서 호출)
+
+    대기 추가 / 취소 / 입장 트랜잭션과 sync_queue 의 적재를 직렬화해
+    적재 스냅샷을 읽은 뒤 커밋된 변경이 적재로 덮어써지지 않게 한다.
+    """
+    with connections[using].cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s, %s)", [QUEUE_LOCK_KEY, int(restaurant_id)])
+
+
+class QueueBackend:
+    """
+    식당별 웨이팅 큐 백엔드
+
+    큐 원소는 queue_member() 식별자이며 score 는 reservation_id (먼저 예약한 순서)
+    Postgres 의 Reservation / ReservationQueue 가 영속 기록이고,
+    백엔드는 순번 계산을 담당한다. 뷰는 lock_queue 를 잡고 Postgres 를 바꾼 뒤
+    커밋되면 (transaction.on_commit) 백엔드에 반영한다.
+    """
+    def enqueue(self, restaurant_id, member, score):
+        """
+        큐에 추가 후 순번(1부터) 반환, 다른 예약으로 이미 대기 중이면 None
+
+        같은 예약(score)이 이미 있으면 (적재가 먼저 반영한 경우) 그 순번을 반환
+        """
+        raise NotImplementedError
+
+    def dequeue(self, restaurant_id):
+        """
+        맨 앞 대기자를 꺼내 (member, score) 반환, 비어 있으면 None
+        """
+        raise NotImplementedError
+
+    def remove(self, restaurant_id, member):
+        """
+        대기자 제거 후 제거 전 순번 반환, 대기 중이 아니면 None
+        """
+        raise NotImplementedError
+
+    def rank(self, restaurant_id, member):
+        """
+        대기자의 순번(1부터) 반환, 대기 중이 아니면 None
+        """
+        raise NotImplementedError
+
+    def ranks(self, pairs):
+        """
+        여러 큐의 순번을 한 번에 조회
+
+        Args:
+            * pairs: [(restaurant_id, member), ...]
+
+        Returns:
+            * [position or None, ...]
+        """
+        return [self.rank(restaurant_id, member) for restaurant_id, member in pairs]
+
+    def length(self, restaurant_id):
+        raise NotImplementedError
+
+    def is_loaded(self, restaurant_id):
+        raise NotImplementedError
+
+    def load(self, restaurant_id, entries):
+        """
+        Postgres 기록으로 큐를 다시 채움
+
+        Args:
+            * entries: [(member, score), ...]
+        """
+        raise NotImplementedError
+
+
+class InMemoryQueueBackend(QueueBackend):
+    """
+    프로세스 메모리 큐 (테스트, 단일 워커 개발용)
+    """
+    def __init__(self, **options):
+        self._queues = {}
+        self._scores = {}
+        self._lock = threading.Lock()
+
+    def _queue(self, restaurant_id):
+        return self._queues.setdefault(restaurant_id, []), self._scores.setdefault(restaurant_id, {})
+
+    def enqueue(self, restaurant_id, member, score):
+        with self._lock:
+            queue, scores = self._queue(restaurant_id)
+            if member in scores:
+                if scores[member] != score:
+                    return None
+            else:
+                scores[member] = score
+                bisect.insort(queue, (score, member))
+            return bisect.bisect_left(queue, (score, member)) + 1
+
+    def dequeue(self, restaurant_id):
+        with self._lock:
+            queue, scores = self._queue(restaurant_id)
+            if not queue:
+                return None
+            score, member = queue.pop(0)
+            del scores[member]
+            return member, score
+
+    def remove(self, restaurant_id, member):
+        with self._lock:
+            queue, scores = self._queue(restaurant_id)
+            if member not in scores:
+                return None
+            index = bisect.bisect_left(queue, (scores.pop(member), member))
+            del queue[index]
+            return index + 1
+
+    def rank(self, restaurant_id, member):
+        with self._lock:
+            queue, scores = self._queue(restaurant_id)
+            if member not in scores:
+                return None
+            return bisect.bisect_left(queue, (scores[member], member)) + 1
+
+    def length(self, restaurant_id):
+        return len(self._queues.get(restaurant_id, ()))
+
+    def is_loaded(self, restaurant_id):
+        return restaurant_id in self._queues
+
+    def load(self, restaurant_id, entries):
+        with self._lock:
+            self._queues[restaurant_id] = sorted((score, member) for member, score in entries)
+            self._scores[restaurant_id] = {member: score for member, score in entries}
+
+
+class DatabaseQueueBackend(QueueBackend):
+    """
+    Postgres 의 ReservationQueue 를 그대로 큐로 사용 (별도 상태 없음)
+
+    Redis 가 없을 때의 기본 백엔드. 워커 / dyno 가 여러 개여도 순번이 항상 같다.
+    enqueue / remove 는 뷰가 커밋한 기록을 기준으로 순번만 계산한다.
+    """
+    def __init__(self, **options):
+        pass
+
+    def _position(self, entries, member):
+        for position, (entry_member, score) in enumerate(entries, start=1):
+            if entry_member == member:
+                return position, score
+        return None, None
+
+    def enqueue(self, restaurant_id, member, score):
+        position, existing = self._position(queue_entries(restaurant_id), member)
+        return position if existing == score else None
+
+    def dequeue(self, restaurant_id):
+        from .models import ReservationQueue
+
+        with transaction.atomic(using=DEFAULT_DB_ALIAS):
+            head = (
+                ReservationQueue.objects.using(DEFAULT_DB_ALIAS).filter(restaurant_id=restaurant_id)
+                .select_related("reservation").select_for_update(skip_locked=True, of=("self",))
+                .order_by("reservation_id").first()
+            )
+            if head is None:
+                return None
+            head.delete()
+        return reservation_member(head.reservation.user_id, head.reservation.phone_number), head.reservation_id
+
+    def remove(self, restaurant_id, member):
+        from .models import ReservationQueue
+
+        position, score = self._position(queue_entries(restaurant_id), member)
+        if position is not None:
+            ReservationQueue.objects.using(DEFAULT_DB_ALIAS).filter(
+                restaurant_id=restaurant_id, reservation_id=score,
+            ).delete()
+        return position
+
+    def rank(self, restaurant_id, member):
+        return self._position(queue_entries(restaurant_id), member)[0]
+
+    def ranks(self, pairs):
+        queues = queue_entries_many({restaurant_id for restaurant_id, _ in pairs})
+        return [self._position(queues.get(restaurant_id, ()), member)[0] for restaurant_id, member in pairs]
+
+    def length(self, restaurant_id):
+        from .models import ReservationQueue
+
+        return ReservationQueue.objects.using(DEFAULT_DB_ALIAS).filter(restaurant_id=restaurant_id).count()
+
+    def is_loaded(self, restaurant_id):
+        return True
+
+    def load(self, restaurant_id, entries):
+        return len(entries)
+
+
+class RedisQueueBackend(QueueBackend):
+    """
+    Redis sorted set 기반 큐 (식당별 key 하나, Lua 스크립트로 원자적 처리)
+
+    적재(LOAD_SCRIPT)는 key 를 지우고 Postgres 스냅샷으로 다시 채우므로
+    sync_queue 는 lock_queue 를 잡은 채로 스냅샷을 읽고 적재한다.
+    """
+    ENQUEUE_SCRIPT = """
+        local score = redis.call('ZSCORE', KEYS[1], ARGV[1])
+        if not score then
+            redis.call('ZADD', KEYS[1], ARGV[2], ARGV[1])
+        elseif tonumber(score) ~= tonumber(ARGV[2]) then
+            return -1
+        end
+        return redis.call('ZRANK', KEYS[1], ARGV[1]) + 1
+    """
+    DEQUEUE_SCRIPT = """
+        local head = redis.call('ZPOPMIN', KEYS[1])
+        if #head == 0 then
+            return false
+        end
+        return head
+    """
+    REMOVE_SCRIPT = """
+        local rank = redis.call('ZRANK', KEYS[1], ARGV[1])
+        if not rank then
+            return -1
+        end
+        redis.call('ZREM', KEYS[1], ARGV[1])
+        return rank + 1
+    """
+    LOAD_SCRIPT = """
+        redis.call('DEL', KEYS[1])
+        for i = 1, #ARGV, 2 do
+            redis.call('ZADD', KEYS[1], ARGV[i + 1], ARGV[i])
+        end
+        redis.call('SET', KEYS[2], 1)
+        return redis.call('ZCARD', KEYS[1])
+    """
+
+    def __init__(self, url=None, prefix="waiting", **options):
+        import redis
+
+        self.client = redis.Redis.from_url(url or settings.REDIS_URL, decode_responses=True)
+        self.prefix = prefix
+        self._enqueue = self.client.register_script(self.ENQUEUE_SCRIPT)
+        self._dequeue = self.client.register_script(self.DEQUEUE_SCRIPT)
+        self._remove = self.client.register_script(self.REMOVE_SCRIPT)
+        self._load = self.client.register_script(self.LOAD_SCRIPT)
+
+    def _key(self, restaurant_id):
+        return f"{self.prefix}:{restaurant_id}"
+
+    def _loaded_key(self, restaurant_id):
+        return f"{self.prefix}:{restaurant_id}:loaded"
+
+    def enqueue(self, restaurant_id, member, score):
+        position = self._enqueue(keys=[self._key(restaurant_id)], args=[member, score])
+        return position if position > 0 else None
+
+    def dequeue(self, restaurant_id):
+        head = self._dequeue(keys=[self._key(restaurant_id)])
+        if not head:
+            return None
+        member, score = head
+        return member, int(float(score))
+
+    def remove(self, restaurant_id, member):
+        position = self._remove(keys=[self._key(restaurant_id)], args=[member])
+        return position if position > 0 else None
+
+    def rank(self, restaurant_id, member):
+        rank = self.client.zrank(self._key(restaurant_id), member)
+        return rank + 1 if rank is not None else None
+
+    def ranks(self, pairs):
+        pipe = self.client.pipeline(transaction=False)
+        for restaurant_id, member in pairs:
+            pipe.zrank(self._key(restaurant_id), member)
+        return [rank + 1 if rank is not None else None for rank in pipe.execute()]
+
+    def length(self, restaurant_id):
+        return self.client.zcard(self._key(restaurant_id))
+
+    def is_loaded(self, restaurant_id):
+        return bool(self.client.exists(self._loaded_key(restaurant_id)))
+
+    def load(self, restaurant_id, entries):
+        args = []
+        for member, score in entries:
+            args.extend((member, score))
+        return self._load(keys=[self._key(restaurant_id), self._loaded_key(restaurant_id)], args=args)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+_loaded = set()
+
+
+def get_queue_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                config = settings.WAITING_QUEUE
+                _backend = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+    return _backend
+
+
+def ensure_queue_loaded(restaurant_id):
+    """
+    백엔드에 해당 식당 큐가 없으면 Postgres 기록으로 채움
+    """
+    if restaurant_id in _loaded:
+        return
+    backend = get_queue_backend()
+    if not backend.is_loaded(restaurant_id):
+        sync_queue(restaurant_id)
+    _loaded.add(restaurant_id)
+
+
+def queue_entries_many(restaurant_ids):
+    """
+    Postgres 기록 기준 식당별 대기 목록 (예약 순)
+
+    Returns:
+        * {restaurant_id: [(member, reservation_id), ...]}
+    """
+    from .models import ReservationQueue
+
+    # 공유 큐 백엔드와 맞추므로 replica 가 아닌 primary 에서 읽음
+    rows = (
+        ReservationQueue.objects.using(DEFAULT_DB_ALIAS).filter(restaurant_id__in=restaurant_ids)
+        .order_by("restaurant_id", "reservation_id")
+        .values_list("restaurant_id", "reservation__user_id", "reservation__phone_number", "reservation_id")
+    )
+    queues = {}
+    for restaurant_id, user_id, phone_number, reservation_id in rows:
+        queues.setdefault(restaurant_id, []).append((reservation_member(user_id, phone_number), reservation_id))
+    return queues
+
+
+def queue_entries(restaurant_id):
+    return queue_entries_many([restaurant_id]).get(restaurant_id, [])
+
+
+def sync_queue(restaurant_id):
+    # 스냅샷을 읽고 적재하는 동안 이 식당 큐의 트랜잭션이 커밋되지 않도록 lock
+    with transaction.atomic(using=DEFAULT_DB_ALIAS):
+        lock_queue(restaurant_id)
+        return get_queue_backend().load(restaurant_id, queue_entries(restaurant_id))
+
+
+def user_queue_positions(user):
+    """
+    회원이 대기 중인 모든 식당과 순번 (DB 조회 1회 + 큐 백엔드 일괄 조회 1회)
+
+    Returns:
+        * [(restaurant_id, restaurant_name, position), ...]
+    """
+    from .models import ReservationQueue
+
+    rows = list(
+        ReservationQueue.objects.filter(reservation__user=user)
+        .order_by("reservation_id")
+        .values_list("restaurant_id", "restaurant__name")
+    )
+    for restaurant_id, _ in rows:
+        ensure_queue_loaded(restaurant_id)
+    member = queue_member(user=user)
+    positions = get_queue_backend().ranks([(restaurant_id, member) for restaurant_id, _ in rows])
+    return [
+        (restaurant_id, name, position)
+        for (restaurant_id, name), position in zip(rows, positions)
+        if position is not None
+    ]
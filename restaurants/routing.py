@@ -0,0 +1,6 @@
+from django.urls import path
+from restaurants.consumers import WaitingQueueConsumer
+
+websocket_urlpatterns = [
+    path('ws/restaurants/<int:restaurant_id>/waitings/', WaitingQueueConsumer.as_asgi()),      # 웨이팅 큐 구독
+]
@@ -0,0 +1,154 @@
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Lookup
+from django.utils import timezone
+
+# 주간 영업시간 비트맵: 7일 x 96칸(15분) = 672 비트
+# slot = 요일(월=0 ... 일=6) * 96 + (시*60 + 분) // 15
+SLOT_MINUTES = 15
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+SLOTS_PER_WEEK = 7 * SLOTS_PER_DAY
+SCHEDULE_BYTES = SLOTS_PER_WEEK // 8
+# slot 비트는 byte[slot // 8] 의 (slot % 8) 번째 하위 비트 (PostgreSQL get_bit(bytea, n) 과 동일)
+ALL_DAYS = range(7)
+
+
+def restaurant_timezone():
+    return ZoneInfo(settings.RESTAURANT_TIME_ZONE)
+
+
+def local_now():
+    """
+    식당 기준 시간대의 현재 시각
+    """
+    return timezone.localtime(timezone.now(), restaurant_timezone())
+
+
+def week_slot(dt=None):
+    """
+    시각 -> 주간 slot 번호 (naive datetime 은 식당 시간대 기준으로 간주)
+    """
+    if dt is None:
+        dt = local_now()
+    elif timezone.is_aware(dt):
+        dt = timezone.localtime(dt, restaurant_timezone())
+    return dt.weekday() * SLOTS_PER_DAY + (dt.hour * 60 + dt.minute) // SLOT_MINUTES
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def schedule_bits(is_24_hours, day_of_week, start_time, end_time):
+    """
+    운영시간 필드 -> 672 비트 정수
+
+    * day_of_week 가 비어 있으면 매일 영업으로 간주
+    * is_24_hours 면 해당 요일 전체 영업
+    * end_time < start_time 이면 자정을 넘겨 다음 요일 end_time 까지 영업 (예: 18:00 ~ 02:00)
+    * start_time == end_time 이면 해당 요일 전체 영업, 시간이 비어 있으면 영업 안 함
+    * 15분 칸의 일부라도 영업하면 그 칸은 영업으로 표시
+    """
+    days = sorted(set(day_of_week)) if day_of_week else ALL_DAYS
+    full_day = (1 << SLOTS_PER_DAY) - 1
+    bits = 0
+    if is_24_hours:
+        for day in days:
+            bits |= full_day << (day * SLOTS_PER_DAY)
+        return bits
+    if start_time is None or end_time is None:
+        return 0
+
+    start = _minutes(start_time) // SLOT_MINUTES
+    end = -(-_minutes(end_time) // SLOT_MINUTES)
+    for day in days:
+        base = day * SLOTS_PER_DAY
+        if start == end:
+            bits |= full_day << base
+        elif start < end:
+            bits |= ((1 << (end - start)) - 1) << (base + start)
+        else:
+            bits |= ((1 << (SLOTS_PER_DAY - start)) - 1) << (base + start)
+            next_base = (day + 1) % 7 * SLOTS_PER_DAY
+            bits |= ((1 << end) - 1) << next_base
+    return bits
+
+
+def build_schedule(is_24_hours, day_of_week, start_time, end_time):
+    """
+    운영시간 필드 -> open_hours 컬럼 값 (84 bytes)
+    """
+    return schedule_bits(is_24_hours, day_of_week, start_time, end_time).to_bytes(SCHEDULE_BYTES, "little")
+
+
+def schedule_to_bits(schedule):
+    """
+    open_hours 컬럼 값(bytes / memoryview) -> 정수 (메모리 캐시에서 비트 검사용)
+    """
+    if not schedule:
+        return 0
+    return int.from_bytes(bytes(schedule), "little")
+
+
+def empty_schedule():
+    return bytes(SCHEDULE_BYTES)
+
+
+def is_open_at(bits, slot):
+    return bool(bits >> slot & 1)
+
+
+def rebuild_open_hours(batch_size=1000):
+    """
+    모든 식당의 open_hours 를 운영시간 필드로부터 재계산
+    """
+    from .models import Restaurant
+
+    rows = Restaurant.objects.values_list("restaurant_id", "is_24_hours", "day_of_week", "start_time", "end_time")
+    batch = []
+    updated = 0
+    for restaurant_id, is_24_hours, day_of_week, start_time, end_time in rows.iterator(chunk_size=batch_size):
+        batch.append(Restaurant(
+            restaurant_id=restaurant_id,
+            open_hours=build_schedule(is_24_hours, day_of_week, start_time, end_time),
+        ))
+        if len(batch) >= batch_size:
+            updated += Restaurant.objects.bulk_update(batch, ["open_hours"])
+            batch = []
+    if batch:
+        updated += Restaurant.objects.bulk_update(batch, ["open_hours"])
+    return updated
+
+
+class WeeklyScheduleField(models.BinaryField):
+    """
+    주간 영업시간 비트맵 컬럼 (bytea, 672 비트)
+
+    filter(open_hours__open_at=slot) 으로 slot 시각에 영업 중인 식당을 비트 하나로 검사
+    """
+    description = "Weekly open hours bitmap"
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("default", empty_schedule)
+        super().__init__(*args, **kwargs)
+
+
+@WeeklyScheduleField.register_lookup
+class OpenAt(Lookup):
+    lookup_name = "open_at"
+    prepare_rhs = False
+
+    def get_prep_lookup(self):
+        if not hasattr(self.rhs, "resolve_expression"):
+            self.rhs = int(self.rhs)
+            if not 0 <= self.rhs < SLOTS_PER_WEEK:
+                raise ValueError(f"slot must be in [0, {SLOTS_PER_WEEK})")
+        return self.rhs
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"get_bit({lhs}, {rhs}) = 1", (*lhs_params, *rhs_params)
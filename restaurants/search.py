@@ -0,0 +1,319 @@
+import logging
+import re
+import threading
+import time
+
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from .dataset import current_version
+
+logger = logging.getLogger(__name__)
+
+# 필드별 가중치 (이름 > 메뉴 > 주소)
+FIELD_WEIGHTS = {"name": 3.0, "menu": 2.0, "address": 1.0}
+# 이름이 검색어로 시작 / 일치하면 추가 점수
+NAME_PREFIX_BONUS = 1.0
+NAME_EXACT_BONUS = 2.0
+# 다른 워커에서 추가된 리뷰 메뉴를 반영하기 위한 백그라운드 재생성 주기 (초)
+MAX_INDEX_AGE = 10 * 60
+
+
+def normalize(text):
+    """
+    검색용 정규화 (소문자, 공백 제거)
+    """
+    return re.sub(r"\s+", "", text or "").lower()
+
+
+def ngrams(text):
+    """
+    정규화된 문자열의 글자 1-gram + 2-gram
+
+    한글은 한 글자가 한 음절이라 2-gram 으로도 충분히 선택적이고,
+    한 글자 검색은 1-gram posting 으로 처리한다.
+    """
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(term):
+    if len(term) == 1:
+        return {term}
+    return {term[i:i + 2] for i in range(len(term) - 1)}
+
+
+class SearchDocument:
+    __slots__ = ("restaurant_id", "name", "address", "menus")
+
+    def __init__(self, restaurant_id, name, address, menus=()):
+        self.restaurant_id = restaurant_id
+        self.name = normalize(name)
+        self.address = normalize(address)
+        self.menus = {normalize(menu) for menu in menus if menu}
+
+    def grams(self):
+        grams = ngrams(self.name) | ngrams(self.address)
+        for menu in self.menus:
+            grams |= ngrams(menu)
+        return grams
+
+    def score(self, term):
+        """
+        검색어 하나에 대한 관련도 (어떤 필드에도 부분 문자열로 없으면 0)
+        """
+        score = 0.0
+        if term in self.name:
+            score += FIELD_WEIGHTS["name"]
+            if self.name == term:
+                score += NAME_EXACT_BONUS
+            elif self.name.startswith(term):
+                score += NAME_PREFIX_BONUS
+        if any(term in menu for menu in self.menus):
+            score += FIELD_WEIGHTS["menu"]
+        if term in self.address:
+            score += FIELD_WEIGHTS["address"]
+        return score
+
+
+class SearchIndex:
+    """
+    식당 이름 / 주소 / 리뷰 메뉴의 글자 n-gram 역색인
+
+    검색 비용은 검색어 n-gram 의 posting 크기에만 비례하고
+    전체 식당 수와는 무관하다.
+    """
+    def __init__(self):
+        self.version = None
+        self.built_at = time.monotonic()
+        self._postings = {}
+        self._documents = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._documents)
+
+    def get(self, restaurant_id):
+        return self._documents.get(restaurant_id)
+
+    def add(self, document):
+        with self._lock:
+            self._remove(document.restaurant_id)
+            self._documents[document.restaurant_id] = document
+            for gram in document.grams():
+                self._postings.setdefault(gram, set()).add(document.restaurant_id)
+
+    def remove(self, restaurant_id):
+        with self._lock:
+            self._remove(restaurant_id)
+
+    def _remove(self, restaurant_id):
+        document = self._documents.pop(restaurant_id, None)
+        if document is None:
+            return
+        for gram in document.grams():
+            posting = self._postings.get(gram)
+            if posting is not None:
+                posting.discard(restaurant_id)
+                if not posting:
+                    del self._postings[gram]
+
+    def add_menus(self, restaurant_id, menus):
+        """
+        리뷰에 새로 등장한 메뉴를 식당 문서에 추가
+        """
+        with self._lock:
+            document = self._documents.get(restaurant_id)
+            if document is None:
+                return
+            for menu in menus or ():
+                menu = normalize(menu)
+                if not menu or menu in document.menus:
+                    continue
+                document.menus.add(menu)
+                for gram in ngrams(menu):
+                    self._postings.setdefault(gram, set()).add(restaurant_id)
+
+    def search(self, query, candidates=None):
+        """
+        공백으로 나눈 검색어를 모두 포함하는 식당을 관련도와 함께 반환
+
+        Args:
+            * query (str): 검색어
+            * candidates (set): 주어지면 이 식당 id 안에서만 검색 (거리 / 카테고리 필터 결과)
+
+        Returns:
+            * {restaurant_id: score}
+        """
+        terms = [normalize(term) for term in (query or "").split()]
+        terms = [term for term in terms if term]
+        if not terms:
+            return {}
+
+        with self._lock:
+            postings = []
+            for term in terms:
+                for gram in query_grams(term):
+                    posting = self._postings.get(gram)
+                    if not posting:
+                        return {}
+                    postings.append(posting)
+            postings.sort(key=len)
+            if candidates is not None:
+                matched = set(candidates) & postings[0]
+            else:
+                matched = set(postings[0])
+            for posting in postings[1:]:
+                matched &= posting
+                if not matched:
+                    return {}
+            documents = [self._documents[restaurant_id] for restaurant_id in matched]
+
+        # n-gram 후보 중 실제로 검색어를 포함하는 문서만 점수화
+        scores = {}
+        for document in documents:
+            total = 0.0
+            for term in terms:
+                score = document.score(term)
+                if not score:
+                    break
+                total += score
+            else:
+                scores[document.restaurant_id] = total
+        return scores
+
+
+_index = None
+_index_lock = threading.Lock()
+# 백그라운드 재생성 상태와 그 동안 들어온 리뷰 메뉴 [(restaurant_id, menus), ...]
+_refreshing = False
+_pending_menus = []
+_refresh_lock = threading.Lock()
+
+
+def restaurant_menus():
+    """
+    식당별 리뷰 메뉴 집합
+    """
+    from reviews.models import Review
+
+    menus = {}
+    rows = Review.objects.using(DEFAULT_DB_ALIAS).values_list("restaurant_id", "menu")
+    for restaurant_id, menu in rows.iterator(chunk_size=5000):
+        if menu:
+            menus.setdefault(restaurant_id, set()).update(menu)
+    return menus
+
+
+def build_index(previous=None):
+    """
+    검색 인덱스 생성
+
+    previous 가 주어지면 리뷰 메뉴는 Review 테이블을 다시 읽지 않고 이전 인덱스에서 가져온다.
+    """
+    from .models import Restaurant
+
+    index = SearchIndex()
+    if previous is not None:
+        index.built_at = previous.built_at
+        menus = {restaurant_id: document.menus for restaurant_id, document in previous._documents.items()}
+    else:
+        menus = restaurant_menus()
+    # 데이터셋 버전과 맞도록 replica 가 아닌 primary 에서 읽음
+    rows = Restaurant.objects.using(DEFAULT_DB_ALIAS).values_list("restaurant_id", "name", "address")
+    for restaurant_id, name, address in rows.iterator(chunk_size=2000):
+        index.add(SearchDocument(restaurant_id, name, address, menus.get(restaurant_id, ())))
+    return index
+
+
+def _expired(index):
+    return time.monotonic() - index.built_at >= MAX_INDEX_AGE
+
+
+def _refresh(version):
+    """
+    Review 전체를 다시 읽어 인덱스를 만든 뒤 교체 (백그라운드 스레드)
+    """
+    global _index, _refreshing
+    try:
+        index = build_index()
+        index.version = version
+        with _index_lock, _refresh_lock:
+            for restaurant_id, menus in _pending_menus:
+                index.add_menus(restaurant_id, menus)
+            _index = index
+    except Exception:
+        # 실패하면 다음 주기까지 지금 인덱스를 계속 사용
+        logger.exception("search index refresh failed")
+        if _index is not None:
+            _index.built_at = time.monotonic()
+    finally:
+        with _refresh_lock:
+            _pending_menus.clear()
+            _refreshing = False
+        connections.close_all()
+
+
+def _start_refresh(version):
+    global _refreshing
+    with _refresh_lock:
+        if _refreshing:
+            return
+        _refreshing = True
+    threading.Thread(target=_refresh, args=(version,), name="search-index-refresh", daemon=True).start()
+
+
+def get_index():
+    """
+    워커 프로세스별 검색 인덱스
+
+    Review 전체를 읽는 것은 첫 적재뿐이다. 데이터셋 버전이 바뀌면 이전 인덱스의 메뉴로 식당 정보만 다시 읽고,
+    MAX_INDEX_AGE 가 지나면 지금 인덱스로 응답하면서 다른 워커에서 추가된 리뷰 메뉴까지
+    백그라운드에서 다시 만든다 (요청이 재생성을 기다리지 않음).
+    """
+    global _index
+    version = current_version()
+    index = _index
+    if index is not None and index.version == version:
+        if _expired(index):
+            _start_refresh(version)
+        return index
+    with _index_lock:
+        index = _index
+        if index is None or index.version != version:
+            index = build_index(index)
+            index.version = version
+            _index = index
+    return _index
+
+
+def search(query, candidates=None):
+    return get_index().search(query, candidates)
+
+
+def apply_change(restaurant=None, restaurant_id=None, version=None):
+    """
+    post_save / post_delete 시 워커의 검색 인덱스를 증분 갱신 (spatial_index.apply_change 와 동일한 규칙)
+    """
+    index = _index
+    if index is None or version is None or index.version != version - 1:
+        return
+    if restaurant is not None:
+        document = index.get(restaurant.restaurant_id)
+        menus = document.menus if document is not None else ()
+        index.add(SearchDocument(restaurant.restaurant_id, restaurant.name, restaurant.address, menus))
+    else:
+        index.remove(restaurant_id)
+    index.version = version
+
+
+def apply_review_menus(restaurant_id, menus):
+    """
+    리뷰 작성 / 수정 시 이 워커의 검색 인덱스에 메뉴 추가 (다른 워커는 재생성 시 반영)
+    """
+    index = _index
+    if index is not None:
+        index.add_menus(restaurant_id, menus)
+    with _refresh_lock:
+        if _refreshing:
+            _pending_menus.append((restaurant_id, menus))
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import Restaurant
+from utils.category import category_name
 
 
 class RestaurantSerializer(serializers.ModelSerializer):
@@ -7,6 +8,12 @@ class RestaurantSerializer(serializers.ModelSerializer):
         model = Restaurant
         fields = ["name", "category", "longitude", "latitude"]
 
+    def validate_category(self, value :list):
+        for code in value:
+            if code not in category_name:
+                raise serializers.ValidationError("Invalid category")
+        return value
+
 class OperatingHourSerializer(serializers.ModelSerializer):
     class Meta:
         model = Restaurant
@@ -0,0 +1,37 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from reviews.models import Review
+from . import autocomplete, search, spatial_index
+from .dataset import bump_version
+from .models import Restaurant
+
+
+@receiver(post_save, sender=Restaurant)
+def restaurant_saved(sender, instance, **kwargs):
+    def on_commit():
+        version = bump_version()
+        spatial_index.apply_change(restaurant=instance, version=version)
+        search.apply_change(restaurant=instance, version=version)
+        autocomplete.apply_change(restaurant=instance, version=version)
+    transaction.on_commit(on_commit)
+
+
+@receiver(post_delete, sender=Restaurant)
+def restaurant_deleted(sender, instance, **kwargs):
+    restaurant_id = instance.restaurant_id
+
+    def on_commit():
+        version = bump_version()
+        spatial_index.apply_change(restaurant_id=restaurant_id, version=version)
+        search.apply_change(restaurant_id=restaurant_id, version=version)
+        autocomplete.apply_change(restaurant_id=restaurant_id, version=version)
+    transaction.on_commit(on_commit)
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, **kwargs):
+    restaurant_id = instance.restaurant_id
+    menus = list(instance.menu or ())
+    transaction.on_commit(lambda: search.apply_review_menus(restaurant_id, menus))
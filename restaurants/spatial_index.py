@@ -0,0 +1,211 @@
+import math
+import threading
+
+import numpy as np
+from django.db import DEFAULT_DB_ALIAS
+
+from utils.category import category_mask, matches_all
+from utils.geo import haversine, haversine_many, nearest_k, grid_cell, covering_cells, EARTH_RADIUS_M
+from .dataset import current_version
+from .schedule import schedule_to_bits, is_open_at
+
+# 격자 셀 크기 (위도 기준 약 550m)
+CELL_DEG = 0.005
+
+
+class IndexedRestaurant:
+    """
+    공간 인덱스에 올라가는 식당 요약 정보
+    """
+    __slots__ = (
+        "restaurant_id", "name", "category", "category_mask", "latitude", "longitude", "open_hours",
+    )
+
+    def __init__(self, restaurant_id, name, category, latitude, longitude, open_hours):
+        self.restaurant_id = restaurant_id
+        self.name = name
+        self.category = tuple(category or ())
+        self.category_mask = category_mask(self.category)
+        self.latitude = float(latitude)
+        self.longitude = float(longitude)
+        # 주간 영업시간 비트맵 (정수)
+        self.open_hours = schedule_to_bits(open_hours)
+
+    @classmethod
+    def from_model(cls, restaurant):
+        return cls(
+            restaurant.restaurant_id,
+            restaurant.name,
+            restaurant.category,
+            restaurant.latitude,
+            restaurant.longitude,
+            restaurant.open_hours,
+        )
+
+    def is_open(self, slot):
+        """
+        slot (schedule.week_slot) 시각에 영업 중인지 비트 하나로 검사
+        """
+        return is_open_at(self.open_hours, slot)
+
+    def has_categories(self, mask):
+        """
+        mask (utils.category.category_mask) 의 카테고리를 모두 포함하는지
+        """
+        return matches_all(self.category_mask, mask)
+
+
+class SpatialIndex:
+    """
+    위경도 균일 격자 기반 식당 공간 인덱스
+
+    셀 -> {restaurant_id: IndexedRestaurant} 로 버킷팅하여
+    반경 검색과 k-최근접 검색을 DB 조회 없이 처리
+    """
+    def __init__(self, cell_deg=CELL_DEG):
+        self.cell_deg = cell_deg
+        self.version = None
+        self._cells = {}
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, restaurant_id):
+        return self._entries.get(restaurant_id)
+
+    def add(self, entry):
+        with self._lock:
+            self._remove(entry.restaurant_id)
+            cell = grid_cell(entry.latitude, entry.longitude, self.cell_deg)
+            self._cells.setdefault(cell, {})[entry.restaurant_id] = entry
+            self._entries[entry.restaurant_id] = entry
+
+    def remove(self, restaurant_id):
+        with self._lock:
+            self._remove(restaurant_id)
+
+    def _remove(self, restaurant_id):
+        entry = self._entries.pop(restaurant_id, None)
+        if entry is None:
+            return
+        cell = grid_cell(entry.latitude, entry.longitude, self.cell_deg)
+        bucket = self._cells.get(cell)
+        if bucket is not None:
+            bucket.pop(restaurant_id, None)
+            if not bucket:
+                del self._cells[cell]
+
+    def _candidates(self, cells, predicate=None):
+        for cell in cells:
+            for entry in tuple(self._cells.get(cell, {}).values()):
+                if predicate is None or predicate(entry):
+                    yield entry
+
+    def in_cell(self, cell):
+        """
+        격자 셀 하나에 속한 식당 목록
+        """
+        return list(self._cells.get(cell, {}).values())
+
+    def within(self, latitude, longitude, radius_m, predicate=None, limit=None):
+        """
+        반경 radius_m 이내 식당을 거리순으로 반환 (limit 지정 시 가까운 limit개)
+
+        Returns:
+            * [(distance, IndexedRestaurant), ...]
+        """
+        cells = covering_cells(latitude, longitude, radius_m, self.cell_deg)
+        candidates = list(self._candidates(cells, predicate))
+        if not candidates:
+            return []
+        lats = np.fromiter((entry.latitude for entry in candidates), np.float64, len(candidates))
+        lngs = np.fromiter((entry.longitude for entry in candidates), np.float64, len(candidates))
+        distances = haversine_many(latitude, longitude, lats, lngs)
+        inside = np.flatnonzero(distances <= radius_m)
+        order = inside[nearest_k(distances[inside], limit)]
+        return [(float(distances[i]), candidates[i]) for i in order]
+
+    def nearest(self, latitude, longitude, k, predicate=None, max_radius_m=5000):
+        """
+        가까운 순으로 최대 k개 식당 반환 (격자를 링 단위로 확장하며 탐색)
+
+        Returns:
+            * [(distance, IndexedRestaurant), ...]
+        """
+        # 한 링을 확장할 때 보장되는 최소 탐색 반경
+        cell_m = EARTH_RADIUS_M * math.radians(self.cell_deg)
+        ring_m = cell_m * min(1.0, math.cos(math.radians(latitude)))
+        center_row, center_col = grid_cell(latitude, longitude, self.cell_deg)
+        matches = []
+        ring = 0
+        while True:
+            cells = [
+                (center_row + d_row, center_col + d_col)
+                for d_row in range(-ring, ring + 1)
+                for d_col in range(-ring, ring + 1)
+                if max(abs(d_row), abs(d_col)) == ring
+            ]
+            for entry in self._candidates(cells, predicate):
+                dist = haversine(latitude, longitude, entry.latitude, entry.longitude)
+                if dist <= max_radius_m:
+                    matches.append((dist, entry))
+            matches.sort(key=lambda match: match[0])
+            covered_m = ring * ring_m
+            if len(matches) >= k and matches[k - 1][0] <= covered_m:
+                break
+            if covered_m >= max_radius_m:
+                break
+            ring += 1
+        return matches[:k]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def build_index():
+    from .models import Restaurant
+
+    index = SpatialIndex()
+    # 데이터셋 버전과 맞도록 replica 가 아닌 primary 에서 읽음
+    rows = Restaurant.objects.using(DEFAULT_DB_ALIAS).values_list(
+        "restaurant_id", "name", "category", "latitude", "longitude", "open_hours",
+    )
+    for row in rows.iterator(chunk_size=2000):
+        index.add(IndexedRestaurant(*row))
+    return index
+
+
+def get_index():
+    """
+    워커 프로세스별 공간 인덱스 (데이터셋 버전이 바뀌면 재생성)
+    """
+    global _index
+    version = current_version()
+    if _index is not None and _index.version == version:
+        return _index
+    with _index_lock:
+        if _index is None or _index.version != version:
+            index = build_index()
+            index.version = version
+            _index = index
+    return _index
+
+
+def apply_change(restaurant=None, restaurant_id=None, version=None):
+    """
+    post_save / post_delete 시 워커의 인덱스를 증분 갱신
+
+    인덱스가 직전 버전이었을 때만 증분 반영하고, 그 외에는
+    다음 조회 시 전체 재생성되도록 둔다.
+    """
+    index = _index
+    if index is None or version is None or index.version != version - 1:
+        return
+    if restaurant is not None:
+        index.add(IndexedRestaurant.from_model(restaurant))
+    else:
+        index.remove(restaurant_id)
+    index.version = version
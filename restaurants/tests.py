@@ -1,3 +1,183 @@
-from django.test import TestCase
+from datetime import datetime, time, timezone as dt_timezone
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from .autocomplete import AutocompleteIndex
+from .queues import InMemoryQueueBackend, queue_member
+from .schedule import SLOTS_PER_DAY, SLOTS_PER_WEEK, is_open_at, schedule_bits, week_slot
+from .search import SearchDocument, SearchIndex
+
+
+def slot(day, hour, minute=0):
+    return day * SLOTS_PER_DAY + (hour * 60 + minute) // 15
+
+
+class ScheduleBitsTests(SimpleTestCase):
+    def test_24_hours_every_day(self):
+        self.assertEqual(schedule_bits(True, [], None, None), (1 << SLOTS_PER_WEEK) - 1)
+
+    def test_24_hours_selected_days(self):
+        bits = schedule_bits(True, [2], None, None)
+        self.assertTrue(is_open_at(bits, slot(2, 0)))
+        self.assertTrue(is_open_at(bits, slot(2, 23, 45)))
+        self.assertFalse(is_open_at(bits, slot(1, 23, 45)))
+        self.assertFalse(is_open_at(bits, slot(3, 0)))
+
+    def test_daytime_hours(self):
+        bits = schedule_bits(False, [0], time(11, 0), time(21, 30))
+        self.assertFalse(is_open_at(bits, slot(0, 10, 45)))
+        self.assertTrue(is_open_at(bits, slot(0, 11, 0)))
+        self.assertTrue(is_open_at(bits, slot(0, 21, 15)))
+        self.assertFalse(is_open_at(bits, slot(0, 21, 30)))
+        self.assertFalse(is_open_at(bits, slot(1, 12, 0)))
+
+    def test_partial_slot_counts_as_open(self):
+        bits = schedule_bits(False, [0], time(11, 10), time(11, 20))
+        self.assertTrue(is_open_at(bits, slot(0, 11, 0)))
+        self.assertTrue(is_open_at(bits, slot(0, 11, 15)))
+        self.assertFalse(is_open_at(bits, slot(0, 11, 30)))
+
+    def test_overnight_wraps_to_next_day(self):
+        bits = schedule_bits(False, [6], time(18, 0), time(2, 0))
+        self.assertTrue(is_open_at(bits, slot(6, 23, 45)))
+        # 일요일 밤 -> 월요일 새벽
+        self.assertTrue(is_open_at(bits, slot(0, 1, 45)))
+        self.assertFalse(is_open_at(bits, slot(0, 2, 0)))
+        self.assertFalse(is_open_at(bits, slot(6, 1, 0)))
+
+    def test_same_start_and_end_is_all_day(self):
+        bits = schedule_bits(False, [4], time(9, 0), time(9, 0))
+        self.assertTrue(is_open_at(bits, slot(4, 3, 0)))
+        self.assertFalse(is_open_at(bits, slot(5, 3, 0)))
+
+    def test_missing_time_is_closed(self):
+        self.assertEqual(schedule_bits(False, [], None, time(9, 0)), 0)
+
+
+@override_settings(RESTAURANT_TIME_ZONE="Asia/Seoul")
+class WeekSlotTests(SimpleTestCase):
+    def test_naive_datetime(self):
+        # 2024-01-01 은 월요일
+        self.assertEqual(week_slot(datetime(2024, 1, 1, 0, 0)), 0)
+        self.assertEqual(week_slot(datetime(2024, 1, 7, 23, 59)), SLOTS_PER_WEEK - 1)
+
+    def test_aware_datetime_uses_restaurant_time_zone(self):
+        # UTC 일요일 15:00 = 서울 월요일 00:00
+        self.assertEqual(week_slot(datetime(2024, 1, 7, 15, 0, tzinfo=dt_timezone.utc)), 0)
+
+
+class AutocompleteIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = AutocompleteIndex()
+        self.index.load([
+            (1, "김밥천국 노량진점", 4.0, 37.513, 126.940),
+            (2, "김치찌개 전문점", 3.0, 37.500, 126.950),
+            (3, "국밥집", 5.0, 37.510, 126.945),
+        ])
+
+    def ids(self, query, **kwargs):
+        return [restaurant_id for restaurant_id, *_ in self.index.complete(query, **kwargs)]
+
+    def test_prefix_ranked_by_stars(self):
+        self.assertEqual(self.ids("김"), [1, 2])
+
+    def test_word_suffix_and_choseong(self):
+        self.assertEqual(self.ids("노량"), [1])
+        self.assertEqual(self.ids("ㄱㅂ"), [3, 1])
+
+    def test_last_syllable_being_typed(self):
+        self.assertEqual(self.ids("김바"), [1])
+        self.assertEqual(self.ids("국ㅂ"), [3])
+
+    def test_proximity_outranks_stars_nearby(self):
+        self.assertEqual(self.ids("김", latitude=37.500, longitude=126.950)[0], 2)
+
+    def test_nearby_low_rated_restaurant_beyond_global_candidates(self):
+        index = AutocompleteIndex()
+        index.load([(i, f"김밥{i}", 5.0, 37.0 + i * 0.01, 127.0) for i in range(200)])
+        index.add(999, "김밥 가까운집", 1.0, 38.5, 128.0)
+        self.assertEqual(index.complete("김", 38.5, 128.0, limit=1)[0][0], 999)
+
+    def test_add_and_remove(self):
+        self.index.add(4, "김밥나라", 5.0, 37.51, 126.94)
+        self.assertEqual(self.ids("김밥"), [4, 1])
+        self.index.add(4, "국수나라", 5.0, 37.51, 126.94)
+        self.assertEqual(self.ids("김밥"), [1])
+        self.index.remove(1)
+        self.assertEqual(self.ids("김밥"), [])
+        self.assertEqual(len(self.index), 3)
+
+
+class SearchIndexTests(SimpleTestCase):
+    def setUp(self):
+        self.index = SearchIndex()
+        self.index.add(SearchDocument(1, "김밥천국", "서울 동작구 노량진동", ["참치김밥"]))
+        self.index.add(SearchDocument(2, "김밥", "서울 동작구 상도동"))
+        self.index.add(SearchDocument(3, "국밥집", "서울 동작구 김밥로", ["순대국밥"]))
+
+    def test_field_weights_and_name_bonus(self):
+        scores = self.index.search("김밥")
+        # 1: 이름 prefix + 메뉴 (3 + 1 + 2), 2: 이름 일치 (3 + 2), 3: 주소 (1)
+        self.assertEqual(scores, {1: 6.0, 2: 5.0, 3: 1.0})
+
+    def test_all_terms_required(self):
+        self.assertEqual(set(self.index.search("김밥 노량진")), {1})
+        self.assertEqual(self.index.search("김밥 부산"), {})
+
+    def test_single_character_and_candidates(self):
+        self.assertEqual(set(self.index.search("집")), {3})
+        self.assertEqual(set(self.index.search("김밥", candidates={2, 3})), {2, 3})
+
+    def test_ngram_match_without_substring_is_excluded(self):
+        index = SearchIndex()
+        index.add(SearchDocument(1, "가나 나다", "주소"))
+        # "가나", "나다" 2-gram 은 모두 있지만 "가나다" 는 부분 문자열이 아님
+        self.assertEqual(index.search("가나다"), {})
+        self.assertEqual(set(index.search("가나 나다")), {1})
+
+    def test_add_menus_and_remove(self):
+        self.index.add_menus(2, ["떡볶이"])
+        self.assertEqual(set(self.index.search("떡볶이")), {2})
+        self.index.remove(2)
+        self.assertEqual(self.index.search("떡볶이"), {})
+
+
+class InMemoryQueueBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.backend = InMemoryQueueBackend()
+        self.alice = queue_member(phone_number="01000000001")
+        self.bob = queue_member(phone_number="01000000002")
+
+    def test_enqueue_orders_by_score(self):
+        self.assertEqual(self.backend.enqueue(1, self.bob, 20), 1)
+        self.assertEqual(self.backend.enqueue(1, self.alice, 10), 1)
+        self.assertEqual(self.backend.rank(1, self.bob), 2)
+        self.assertIsNone(self.backend.enqueue(1, self.alice, 30))
+        self.assertEqual(self.backend.length(1), 2)
+
+    def test_enqueue_same_reservation_is_idempotent(self):
+        # 적재가 커밋된 예약을 먼저 반영한 경우
+        self.backend.load(1, [(self.alice, 10)])
+        self.assertEqual(self.backend.enqueue(1, self.alice, 10), 1)
+        self.assertEqual(self.backend.length(1), 1)
+
+    def test_dequeue_and_remove(self):
+        self.backend.enqueue(1, self.alice, 10)
+        self.backend.enqueue(1, self.bob, 20)
+        self.assertEqual(self.backend.remove(1, self.bob), 2)
+        self.assertIsNone(self.backend.remove(1, self.bob))
+        self.assertEqual(self.backend.dequeue(1), (self.alice, 10))
+        self.assertIsNone(self.backend.dequeue(1))
+
+    def test_queues_are_per_restaurant(self):
+        self.backend.enqueue(1, self.alice, 10)
+        self.backend.enqueue(2, self.alice, 11)
+        self.assertEqual(self.backend.ranks([(1, self.alice), (2, self.alice), (3, self.alice)]), [1, 1, None])
+
+    def test_load_replaces_queue(self):
+        self.assertFalse(self.backend.is_loaded(1))
+        self.backend.enqueue(1, self.alice, 10)
+        self.backend.load(1, [(self.bob, 5)])
+        self.assertTrue(self.backend.is_loaded(1))
+        self.assertIsNone(self.backend.rank(1, self.alice))
+        self.assertEqual(self.backend.rank(1, self.bob), 1)
@@ -0,0 +1,106 @@
+from django.core.cache import cache
+from django.db import connection
+
+from utils.category import category_bit
+from .dataset import current_version
+from .schedule import week_slot
+
+MAX_ZOOM = 22
+TILE_EXTENT = 4096
+TILE_BUFFER = 64
+# 이 줌 레벨 미만에서는 서버에서 핀을 클러스터링
+CLUSTER_MAX_ZOOM = 15
+# 클러스터 격자 크기 (타일 한 변의 1/8)
+CLUSTER_GRID_DIVISIONS = 8
+# 웹 메르카토르 세계 폭 (m)
+WORLD_WIDTH_M = 40075016.68557849
+# 캐시 유지 시간
+TILE_CACHE_TIMEOUT = 60 * 60 * 24
+
+PIN_TILE_SQL = """
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(%(z)s, %(x)s, %(y)s) AS geom
+    ),
+    pins AS (
+        SELECT
+            r.restaurant_id,
+            r.name,
+            r.category,
+            r.star_avg::float AS star_avg,
+            ST_AsMVTGeom(ST_Transform(r.location, 3857), bounds.geom, %(extent)s, %(buffer)s, true) AS geom
+        FROM "Restaurant" AS r, bounds
+        WHERE r.location && ST_Transform(bounds.geom, 4326) {filters}
+    )
+    SELECT ST_AsMVT(pins.*, 'restaurants', %(extent)s, 'geom') FROM pins
+"""
+
+CLUSTER_TILE_SQL = """
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(%(z)s, %(x)s, %(y)s) AS geom
+    ),
+    pins AS (
+        SELECT r.restaurant_id, ST_Transform(r.location, 3857) AS geom
+        FROM "Restaurant" AS r, bounds
+        WHERE r.location && ST_Transform(bounds.geom, 4326) {filters}
+    ),
+    clusters AS (
+        SELECT
+            count(*) AS point_count,
+            min(pins.restaurant_id) AS restaurant_id,
+            ST_AsMVTGeom(ST_Centroid(ST_Collect(pins.geom)), bounds.geom, %(extent)s, %(buffer)s, true) AS geom
+        FROM pins, bounds
+        GROUP BY ST_SnapToGrid(pins.geom, %(grid)s), bounds.geom
+    )
+    SELECT ST_AsMVT(clusters.*, 'restaurants', %(extent)s, 'geom') FROM clusters
+"""
+
+
+def valid_tile(z, x, y):
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+def render_tile(z, x, y, category=None, open_slot=None):
+    """
+    PostGIS 로 식당 핀 Mapbox Vector Tile 생성 (낮은 줌에서는 격자 클러스터)
+
+    Returns:
+        * tile (bytes)
+    """
+    params = {"z": z, "x": x, "y": y, "extent": TILE_EXTENT, "buffer": TILE_BUFFER}
+    filters = ""
+    if category is not None:
+        # 카테고리별 부분 GiST 인덱스와 같은 조건식
+        filters += " AND (r.category_mask & %(category_bit)s) <> 0"
+        params["category_bit"] = category_bit(category)
+    if open_slot is not None:
+        # 공간 조건(&&)으로 좁힌 뒤 행마다 비트 하나만 검사
+        filters += " AND get_bit(r.open_hours, %(open_slot)s) = 1"
+        params["open_slot"] = open_slot
+
+    if z < CLUSTER_MAX_ZOOM:
+        sql = CLUSTER_TILE_SQL
+        params["grid"] = WORLD_WIDTH_M / 2 ** z / CLUSTER_GRID_DIVISIONS
+    else:
+        sql = PIN_TILE_SQL
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql.format(filters=filters), params)
+        row = cursor.fetchone()
+    return bytes(row[0]) if row and row[0] else b""
+
+
+def get_tile(z, x, y, category=None, open_now=False):
+    """
+    데이터셋 버전별 타일 캐시
+
+    영업 중 필터 결과는 (버전, 주간 slot) 만으로 결정되므로 slot 별로 캐시
+    """
+    open_slot = week_slot() if open_now else None
+    open_key = "all" if open_slot is None else f"slot{open_slot}"
+
+    key = f"tiles:v{current_version()}:{z}:{x}:{y}:{category}:{open_key}"
+    tile = cache.get(key)
+    if tile is None:
+        tile = render_tile(z, x, y, category, open_slot)
+        cache.set(key, tile, TILE_CACHE_TIMEOUT)
+    return tile
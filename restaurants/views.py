@@ -1,18 +1,110 @@
-from geopy.distance import distance
+import math
+
+from asgiref.sync import sync_to_async
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
-from django.contrib.gis.geos import Point, GEOSGeometry
-from django.contrib.gis.measure import D
-from django.db.models import Q, Avg
+from django.contrib.gis.geos import GEOSGeometry
+from django.db.models import Count
 from django.db import transaction
-from datetime import datetime
+from django.http import HttpResponse
+
+from config.db_router import ReplicaReadMixin
 
 from .serializers import RestaurantSerializer, OperatingHourSerializer
-from .models import Restaurant, Reservation
+from .models import Restaurant, Reservation, ReservationQueue
+from .queues import get_queue_backend, ensure_queue_loaded, lock_queue, queue_member, reservation_member
+from .broadcast import publish_queue_change
+from .spatial_index import get_index
+from .map_layers import get_map_layer
+from .tiles import get_tile, valid_tile
+from .schedule import week_slot
+from .search import search
+from .autocomplete import get_index as get_autocomplete_index
 from reviews.models import Review
-from config import settings
+from utils.category import category_bit, category_mask
+from utils.pagination import akeyset_page, page_params
+from utils.images import thumbnail_url
+from utils import aws
+from utils.async_views import AsyncAPIView
+from utils.geo import valid_coordinates
+from reviews.previews import alatest_reviews, latest_reviews, review_preview
+
+# 대안 추천 기본 개수
+ALTERNATIVE_LIMIT = 20
+AUTOCOMPLETE_LIMIT = 10
+AUTOCOMPLETE_MAX_LIMIT = 30
+# 주변 식당 검색 최대 반경 (km, 덮는 격자 셀 수가 반경 제곱에 비례하므로 제한)
+NEARBY_MAX_DIST_KM = 5.0
+
+
+def error_response(code, message, details):
+    return Response({
+        "status": "error",
+        "error": {
+            "code": code,
+            "message": message,
+            "details": details,
+        },
+    }, status=code)
+
+
+def presigned_upload_response(request, prefix):
+    """
+    직접 업로드용 presigned 요청 응답 (content_type, method(POST | PUT) 파라미터)
+    """
+    content_type = request.data.get('content_type')
+    method = (request.data.get('method') or "POST").upper()
+    if content_type not in aws.IMAGE_CONTENT_TYPES or method not in ("POST", "PUT"):
+        return error_response(400, "Bad Request", "Unsupported content type or method")
+    upload = aws.presign_upload(aws.upload_key(prefix, content_type), content_type, method)
+    return Response({
+        "status": "success",
+        "message": "Upload URL issued",
+        "max_bytes": aws.MAX_UPLOAD_BYTES,
+        **upload,
+    }, status=status.HTTP_200_OK)
+
+
+def uploaded_key(request, prefix):
+    """
+    완료 요청의 key 검증 (이 대상의 업로드 경로이고 버킷에 실제로 올라간 이미지인지)
+
+    Returns:
+        * (key, None) or (None, 오류 응답)
+    """
+    key = request.data.get('key')
+    if not isinstance(key, str) or not key.startswith(f"uploads/{prefix}") or ".." in key:
+        return None, error_response(400, "Bad Request", "Invalid upload key")
+    head = aws.head_object(key)
+    if head is None:
+        return None, error_response(404, "Not Found", "Uploaded object not found")
+    if head["ContentLength"] > aws.MAX_UPLOAD_BYTES or head.get("ContentType") not in aws.IMAGE_CONTENT_TYPES:
+        aws.delete(key)
+        return None, error_response(400, "Bad Request", "Invalid uploaded image")
+    return key, None
+
+
+# S3 호출 (presign / HEAD / DELETE) 은 DB 를 쓰지 않으므로 요청 스레드 대신 스레드 풀에서
+apresigned_upload_response = sync_to_async(presigned_upload_response, thread_sensitive=False)
+auploaded_key = sync_to_async(uploaded_key, thread_sensitive=False)
+
+
+@sync_to_async
+@transaction.atomic
+def aattach_upload(instance, key):
+    """
+    업로드 완료 처리 (image 갱신 후 커밋되면 변형 생성 시작)
+    """
+    instance.attach_upload(key)
+
+
+def valid_stars(stars):
+    try:
+        return 1 <= int(stars) <= 5
+    except (TypeError, ValueError):
+        return False
 
 # Create your views here.
 class CreateRestaurantView(APIView):
@@ -50,9 +142,13 @@ class CreateRestaurantView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         return Response({"error": "Unauthorized access"}, status=status.HTTP_401_UNAUTHORIZED)
 
-class RestaurantInfoView(APIView):
-    def get(self, request, restaurant_id):
-        restaurant = Restaurant.objects.filter(restaurant_id=restaurant_id).first()
+class RestaurantInfoView(ReplicaReadMixin, AsyncAPIView):
+    async def get(self, request, restaurant_id):
+        restaurant = await (
+            Restaurant.objects.filter(restaurant_id=restaurant_id)
+            .annotate(waiting=Count('reservation__user'))
+            .afirst()
+        )
         if not restaurant:
             return Response({
                 "status": "error",
@@ -63,7 +159,7 @@ class RestaurantInfoView(APIView):
                 }
             }, status=status.HTTP_404_NOT_FOUND)
             
-        review1, review2 = restaurant.review_set.order_by('-created_at')[:2]
+        reviews = (await alatest_reviews([restaurant.restaurant_id]))[restaurant.restaurant_id]
         return Response({
             "status": "success",
             "message": "Restaurant information retrieved successfully",
@@ -75,8 +171,9 @@ class RestaurantInfoView(APIView):
                 "longitude": restaurant.longitude,
                 "latitude": restaurant.latitude,
                 "address": restaurant.address,
-                "waiting": restaurant.user_set.count(),
+                "waiting": restaurant.waiting,
                 "image": restaurant.image,
+                "image_variants": restaurant.image_variants,
                 "is_24_hours": restaurant.is_24_hours,
                 "day_of_week": restaurant.day_of_week,
                 "start_time": str(restaurant.start_time.strftime("%H:%M")) if restaurant.start_time else "00:00",
@@ -84,21 +181,13 @@ class RestaurantInfoView(APIView):
                 "etc_reason": restaurant.etc_reason,
                 "created_at": restaurant.created_at,
                 "updated_at": restaurant.updated_at,
-                "review1": {
-                    "user_name": review1.user.name,
-                    "stars": review1.stars,
-                    "contents": review1.contents,
-                },
-                "review2": {
-                    "user_name": review2.user.name,
-                    "stars": review2.stars,
-                    "contents": review2.contents,
-                }
+                "review1": review_preview(reviews, 0),
+                "review2": review_preview(reviews, 1),
             }
         }, status=status.HTTP_200_OK)
 
 
-class RestaurantFilterView(APIView):
+class RestaurantFilterView(ReplicaReadMixin, APIView):
     def get(self, request):
         user_restaurant_name = request.GET.get('restaurant_name', "")
         user_category = request.GET.get('category', [])
@@ -106,22 +195,38 @@ class RestaurantFilterView(APIView):
         user_latitude = request.GET.get('latitude')
         if not (user_longitude and user_latitude):
             return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
-        user_location = Point((float(user_longitude), float(user_latitude)), srid=4326)
-
-        # 요청에 해당하는 query 작성
-        now = datetime.now()
-        query = Q(name__contains=user_restaurant_name)                 # 이름 검색
-        query &= (Q(is_24_hours=True) | Q(start_time__lte=now, end_time__gte=now)) # 운영시간 확인
-        query &= Q(location__distance_lte=(user_location, D(km=0.5)))   # 반경 100m
-        if user_category:
-            for category_id in user_category.split(','):
-                query &= Q(category__contains=[category_id])
+        try:
+            user_longitude = float(user_longitude)
+            user_latitude = float(user_latitude)
+            required_categories = category_mask((int(category_id) for category_id in user_category.split(',')), strict=True) if user_category else 0
+        except ValueError:
+            return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
+        if not valid_coordinates(user_latitude, user_longitude):
+            return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
+
+        # 공간 인덱스에서 반경 500m 후보 검색 (운영시간, 카테고리 확인)
+        slot = week_slot()
+        matches = get_index().within(
+            user_latitude, user_longitude, 500,
+            lambda r: r.is_open(slot) and r.has_categories(required_categories),
+        )
         
         restaurant_ids = []
-        restaurants = Restaurant.objects.filter(query).order_by('-star_avg')[:5]
-        print(restaurants.count())
+        if user_restaurant_name.strip():
+            # 후보 안에서 이름 / 주소 / 메뉴 검색 후 관련도, 별점, 거리 순
+            scores = search(user_restaurant_name, {r.restaurant_id for _, r in matches})
+            distances = {r.restaurant_id: dist for dist, r in matches if r.restaurant_id in scores}
+            restaurants = sorted(
+                Restaurant.objects.in_bulk(list(distances)).values(),
+                key=lambda r: (-scores[r.restaurant_id], -r.star_avg, distances[r.restaurant_id]),
+            )[:5]
+        else:
+            restaurants = list(Restaurant.objects.filter(
+                restaurant_id__in=[r.restaurant_id for _, r in matches]
+            ).order_by('-star_avg')[:5])
+        previews = latest_reviews([restaurant.restaurant_id for restaurant in restaurants])
         for restaurant in restaurants:
-            review1, review2 = restaurant.review_set.order_by('-created_at')[:2]
+            reviews = previews[restaurant.restaurant_id]
             restaurant_ids.append({
                 "restaurant_id": restaurant.restaurant_id,
                 "name": restaurant.name,
@@ -132,6 +237,7 @@ class RestaurantFilterView(APIView):
                 "address": restaurant.address,
                 # "waiting": restaurant.user_set.count(),
                 "image": restaurant.image,
+                "thumbnail": thumbnail_url(restaurant.image_variants),
                 "is_24_hours": restaurant.is_24_hours,
                 "day_of_week": restaurant.day_of_week,
                 "start_time": str(restaurant.start_time.strftime("%H:%M")) if restaurant.start_time else "00:00",
@@ -139,16 +245,8 @@ class RestaurantFilterView(APIView):
                 "etc_reason": restaurant.etc_reason,
                 "created_at": restaurant.created_at,
                 "updated_at": restaurant.updated_at,
-                "review1": {
-                    "user_name": review1.user.name,
-                    "stars": review1.stars,
-                    "contents": review1.contents,
-                },
-                "review2": {
-                    "user_name": review2.user.name,
-                    "stars": review2.stars,
-                    "contents": review2.contents,
-                }
+                "review1": review_preview(reviews, 0),
+                "review2": review_preview(reviews, 1),
             })
         return Response({
             "status": "success",
@@ -156,7 +254,39 @@ class RestaurantFilterView(APIView):
             "restaurants": restaurant_ids,
         },status=status.HTTP_200_OK)
 
-class RestaurantAlternativeView(APIView):
+class RestaurantAutocompleteView(APIView):
+    # 입력 중인 식당 이름 자동완성 (초성 검색 지원, DB 조회 없음)
+    def get(self, request):
+        query = request.GET.get('q', '')
+        user_longitude = request.GET.get('longitude')
+        user_latitude = request.GET.get('latitude')
+        try:
+            limit = int(request.GET.get('limit', AUTOCOMPLETE_LIMIT))
+            user_longitude = float(user_longitude) if user_longitude else None
+            user_latitude = float(user_latitude) if user_latitude else None
+        except ValueError:
+            return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
+        if not 0 < limit <= AUTOCOMPLETE_MAX_LIMIT:
+            return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
+
+        suggestions = []
+        for restaurant_id, name, star_avg, distance in get_autocomplete_index().complete(
+            query, user_latitude, user_longitude, limit,
+        ):
+            suggestions.append({
+                "restaurant_id": restaurant_id,
+                "name": name,
+                "star_avg": star_avg,
+                "distance": f'{distance:.2f}m' if distance is not None else None,
+            })
+        return Response({
+            "status": "success",
+            "message": "Autocomplete suggestions retrieved successfully",
+            "suggestions": suggestions,
+        }, status=status.HTTP_200_OK)
+
+
+class RestaurantAlternativeView(ReplicaReadMixin, APIView):
     def get(self, request):
         restaurant_id = request.GET.get('restaurant_id')
         restaurant = Restaurant.objects.filter(restaurant_id=restaurant_id).first()
@@ -170,25 +300,36 @@ class RestaurantAlternativeView(APIView):
                 }
             }, status=status.HTTP_404_NOT_FOUND)
         
+        try:
+            limit = int(request.GET.get('limit', ALTERNATIVE_LIMIT))
+        except ValueError:
+            return Response({
+                "status": "error",
+                "error": {
+                    "code": 400,
+                    "message": "Bad Request",
+                    "details": "Invalid input data",
+                }
+            }, status=status.HTTP_400_BAD_REQUEST)
+
         latitude = restaurant.latitude
         longitude = restaurant.longitude
-        location = Point(float(longitude), float(latitude), srid=4326)
-        categories = restaurant.category
+        categories = category_mask(restaurant.category)
         
-        now = datetime.now()
-        query = Q(location__distance_lte=(location,D(km=1)))
-        query = ~Q(restaurant_id=restaurant_id)
-        query &= (Q(is_24_hours=True) | Q(start_time__lte=now, end_time__gte=now)) # 운영시간 확인
-        for category_id in categories:
-            query &= Q(category__contains=[category_id])
+        # 공간 인덱스에서 반경 1km 내 가까운 limit개 검색 (자기 자신 제외, 운영시간, 카테고리 확인)
+        slot = week_slot()
+        matches = get_index().within(
+            float(latitude), float(longitude), 1000,
+            lambda r: r.restaurant_id != restaurant.restaurant_id and r.is_open(slot) and r.has_categories(categories),
+            limit=limit,
+        )
             
         restaurant_list = []
-        restaurants = Restaurant.objects.filter(query)
-        for alter_restaurant in restaurants:
-            point1 = (float(latitude), float(longitude))
-            point2 = (float(alter_restaurant.latitude), float(alter_restaurant.longitude))
-            dist = distance(point1, point2).meters
-            
+        restaurants = Restaurant.objects.in_bulk([r.restaurant_id for _, r in matches])
+        for dist, match in matches:
+            alter_restaurant = restaurants.get(match.restaurant_id)
+            if alter_restaurant is None:
+                continue
             restaurant_list.append({
                 "restaurant_id": alter_restaurant.restaurant_id,
                 "name": alter_restaurant.name,
@@ -197,6 +338,7 @@ class RestaurantAlternativeView(APIView):
                 "latitude": alter_restaurant.latitude,
                 "longitude": alter_restaurant.longitude,
                 "image": alter_restaurant.image,
+                "thumbnail": thumbnail_url(alter_restaurant.image_variants),
                 "is_24_hours": alter_restaurant.is_24_hours,
                 "day_of_week": alter_restaurant.day_of_week,
                 "start_time": str(alter_restaurant.start_time.strftime("%H:%M")) if alter_restaurant.start_time else "00:00",
@@ -204,7 +346,6 @@ class RestaurantAlternativeView(APIView):
                 "etc_reason": alter_restaurant.etc_reason,
                 "distance": f'{dist:.2f}m'
             })
-        restaurant_list.sort(key=lambda x:float(x['distance'][:-2]))
         return Response({
             "status": "success",
             "message": "Nearby restaurants retrieved successfully",
@@ -232,31 +373,48 @@ class RestaurantWaitingView(APIView):
             }, status=status.HTTP_200_OK)
 
     # 예약 등록(유저)
-    @transaction.atomic
     def post(self, request, restaurant_id):
         user = request.user
         restaurant = Restaurant.objects.filter(restaurant_id=restaurant_id).first()
         if not restaurant:
             return Response({"error": "Restaurant not found"}, status=status.HTTP_404_NOT_FOUND)
 
+        backend = get_queue_backend()
+        ensure_queue_loaded(restaurant.restaurant_id)
+
         # 회원 처리
         if user.is_authenticated:
-            if restaurant.queue.filter(user=user).exists():
-                return Response({"error":"Waiting already exists"}, status=status.HTTP_409_CONFLICT)
-            new_reservation = Reservation.objects.create(restaurant=restaurant, user=user, phone_number=user.phone_number)
-            restaurant.queue.add(new_reservation)
+            member = queue_member(user=user)
+            reservation_fields = {"user": user, "phone_number": user.phone_number}
+            waiting = {"reservation__user": user}
         # 비회원 처리
         else:
             phone_number = request.data.get('phone_number')
             if not phone_number:
                 return Response({"error": "Invalid input data"}, status=status.HTTP_400_BAD_REQUEST)
-            if restaurant.queue.filter(phone_number=phone_number).exists():
+            member = queue_member(phone_number=phone_number)
+            reservation_fields = {"phone_number": phone_number}
+            waiting = {"reservation__user__isnull": True, "reservation__phone_number": phone_number}
+
+        joined = {}
+        with transaction.atomic():
+            lock_queue(restaurant.restaurant_id)
+            if ReservationQueue.objects.filter(restaurant=restaurant, **waiting).exists():
                 return Response({"error":"Waiting already exists"}, status=status.HTTP_409_CONFLICT)
-            new_reservation = Reservation.objects.create(restaurant=restaurant, phone_number=phone_number)
-            restaurant.queue.add(new_reservation)
+            new_reservation = Reservation.objects.create(restaurant=restaurant, **reservation_fields)
+            ReservationQueue.objects.create(restaurant=restaurant, reservation=new_reservation)
+            # 큐 백엔드에는 커밋된 뒤에만 추가 (롤백된 예약이 큐에 남지 않도록)
+            transaction.on_commit(lambda: joined.update(
+                position=backend.enqueue(restaurant.restaurant_id, member, new_reservation.reservation_id)
+            ))
 
-        restaurant.save()
-        position = len(restaurant.queue.all())
+        # 동시 요청으로 이미 대기 중이면 방금 만든 기록을 지움
+        position = joined.get("position")
+        if position is None:
+            ReservationQueue.objects.filter(reservation=new_reservation).delete()
+            new_reservation.delete()
+            return Response({"error":"Waiting already exists"}, status=status.HTTP_409_CONFLICT)
+        publish_queue_change(restaurant.restaurant_id, "joined", position)
         return Response({
             "status": "success",
             "message": "Joined the queue successfully.",
@@ -264,25 +422,34 @@ class RestaurantWaitingView(APIView):
         }, status=status.HTTP_200_OK)
 
     # 예약 입장(매니저)
-    @transaction.atomic
     def patch(self, request, restaurant_id):
         restaurant = Restaurant.objects.filter(restaurant_id=restaurant_id).first()
         if not restaurant:
             return Response({"error": "Restaurant not found"}, status=status.HTTP_404_NOT_FOUND)
         
-        queue = restaurant.queue
-        if not queue.exists():
-            return Response({"error": "Waiting does not exist"}, status=status.HTTP_400_BAD_REQUEST)
-       
-        next = queue.first()
-        queue.remove(next)
-        restaurant.save()
-
-        if next.user:
-            next_name = next.user.name
-            next.user.reservations.remove(restaurant)
-        else:
-            next_name = 'Anonymous user'
+        backend = get_queue_backend()
+        ensure_queue_loaded(restaurant.restaurant_id)
+
+        with transaction.atomic():
+            lock_queue(restaurant.restaurant_id)
+            # 맨 앞 대기자는 Postgres 기록에서 꺼내고, 큐 백엔드에서는 커밋된 뒤에 제거 (롤백 시 큐가 어긋나지 않도록)
+            head = (
+                ReservationQueue.objects.filter(restaurant=restaurant)
+                .select_related('reservation__user').order_by('reservation_id').first()
+            )
+            if head is None:
+                return Response({"error": "Waiting does not exist"}, status=status.HTTP_400_BAD_REQUEST)
+            next = head.reservation
+            member = reservation_member(next.user_id, next.phone_number)
+            head.delete()
+            transaction.on_commit(lambda: backend.remove(restaurant.restaurant_id, member))
+            publish_queue_change(restaurant.restaurant_id, "entered", 1)
+
+            if next.user:
+                next_name = next.user.name
+                next.user.reservations.remove(restaurant)
+            else:
+                next_name = 'Anonymous user'
         return Response({
             "message": "Queuing successful",
             "name":next_name,
@@ -298,7 +465,8 @@ class RestaurantManagementView(APIView):
     # 식당 사진 삽입
     def post(self, request, restaurant_id):
         img_path = request.data.get('img_path')
-        if not img_path:
+        img_file = request.FILES.get('image')
+        if not (img_path or img_file):
             return Response({
                 "status": "error",
                 "error": {
@@ -318,13 +486,29 @@ class RestaurantManagementView(APIView):
                     "details": "Restaurant not found",
                 }
             }, status=status.HTTP_404_NOT_FOUND)
-        url = restaurant.save_img(img_path)
+        # 변형 생성 / 업로드는 워커 풀에서 처리하고 바로 응답 (완료 시 image, image_variants 갱신)
+        if img_file:
+            # presigned 직접 업로드와 같은 크기 / 형식 제한
+            if img_file.size > aws.MAX_UPLOAD_BYTES or img_file.content_type not in aws.IMAGE_CONTENT_TYPES:
+                return error_response(400, "Bad Request", "Invalid image file")
+            restaurant.enqueue_image(img_file.read())
+        else:
+            try:
+                restaurant.save_img(img_path)
+            except Exception:
+                return Response({
+                    "status": "error",
+                    "error": {
+                        "code": 400,
+                        "message": "Bad Request",
+                        "details": "Invalid image path",
+                    }
+                }, status=status.HTTP_400_BAD_REQUEST)
         return Response({
             "status": "success",
-            "message": "Save successful",
-            "base_url": settings.S3_base_url,
-            "url": url,
-        }, status=status.HTTP_200_OK)
+            "message": "Image processing started",
+            "restaurant_id": restaurant.restaurant_id,
+        }, status=status.HTTP_202_ACCEPTED)
     
     # 식당 정보 변경
     @transaction.atomic
@@ -349,7 +533,7 @@ class RestaurantManagementView(APIView):
             restaurant.start_time = start_time
             restaurant.end_time = end_time
             restaurant.etc_reason = etc_reason
-            restaurant.save()
+            restaurant.save(update_fields=["is_24_hours", "day_of_week", "start_time", "end_time", "etc_reason", "updated_at"])
             return Response({
                 "status": "success",
                 "message":"Update restaurant operating hour successful",
@@ -361,23 +545,62 @@ class RestaurantManagementView(APIView):
             }, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-class RestaurantReviewListView(APIView):
-    def get(self, request, restaurant_id):
+class RestaurantImageUploadView(AsyncAPIView):
+    # 식당 사진 직접 업로드 URL 발급
+    async def post(self, request, restaurant_id):
+        if not request.user.is_staff: # 매니저 존재시 매니저 여부로 확인
+            return error_response(403, "Forbidden", "Unauthorized access")
+        if not await Restaurant.objects.filter(restaurant_id=restaurant_id).aexists():
+            return error_response(404, "Not Found", "Restaurant not found")
+        return await apresigned_upload_response(request, f"restaurants/{restaurant_id}/")
+
+
+class RestaurantImageCompleteView(AsyncAPIView):
+    # 식당 사진 직접 업로드 완료 (변형 생성은 워커 풀에서)
+    async def post(self, request, restaurant_id):
+        if not request.user.is_staff:
+            return error_response(403, "Forbidden", "Unauthorized access")
+        restaurant = await Restaurant.objects.filter(restaurant_id=restaurant_id).afirst()
+        if not restaurant:
+            return error_response(404, "Not Found", "Restaurant not found")
+        key, error = await auploaded_key(request, f"restaurants/{restaurant_id}/")
+        if error is not None:
+            return error
+        await aattach_upload(restaurant, key)
+        return Response({
+            "status": "success",
+            "message": "Image processing started",
+            "restaurant_id": restaurant.restaurant_id,
+            "image": restaurant.image,
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class RestaurantReviewListView(ReplicaReadMixin, AsyncAPIView):
+    async def get(self, request, restaurant_id):
         user = request.user
         if user.is_authenticated:
             if restaurant_id is not None:
-                restaurant = Restaurant.objects.filter(pk = restaurant_id).first() #Restaurant 가져오기
+                restaurant = await Restaurant.objects.filter(pk = restaurant_id).afirst() #Restaurant 가져오기
                 if not restaurant:
                     return Response({"error":"Restaurant not found"}, status=status.HTTP_404_NOT_FOUND)
+                try:
+                    cursor, page_size = page_params(request)
+                except ValueError:
+                    return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
                 review_infos = []
-                reviews = Review.objects.filter(restaurant_id = restaurant)
+                # (created_at, review_id) keyset 페이지, 작성자 join
+                reviews, next_cursor = await akeyset_page(
+                    Review.objects.filter(restaurant_id = restaurant).select_related('user'),
+                    cursor, page_size, pk_field='review_id',
+                )
                 for review in reviews:
                     review_info = {
                         "review_id": review.review_id,
                         "stars": review.stars,
-                        "user_id" : user.user_id,
-                        "use_name" : user.name,
+                        "user_id" : review.user.user_id,
+                        "use_name" : review.user.name,
                         "menu" : review.menu,
+                        "thumbnail" : thumbnail_url(review.image_variants),
                         "contents": review.contents,
                         "created_at": review.created_at,
                         "updated_at": review.updated_at,
@@ -387,7 +610,8 @@ class RestaurantReviewListView(APIView):
                 responst_data = {
                     "restaurant_id" : restaurant.restaurant_id,
                     "restaurant_name" : restaurant.name,
-                    "reviews" : review_infos
+                    "reviews" : review_infos,
+                    "next_cursor" : next_cursor,
                 }
                 return Response(responst_data, status=status.HTTP_200_OK)
             error_response = {
@@ -420,15 +644,16 @@ class WriteReivew(APIView):
             contents = request.data.get('contents')
             if not (name,stars,menu,contents):
                 return Response({"error": "평점과 리뷰 내용이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+            if not valid_stars(stars):
+                return Response({"error": "평점은 1에서 5 사이여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
             try:
                 restaurant = Restaurant.objects.get(restaurant_id=restaurant_id)
             except Restaurant.DoesNotExist:
                 return Response({"error": "레스토랑을 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
             review, created = Review.objects.get_or_create(restaurant=restaurant, user=user, stars=stars, menu=menu, contents=contents)
-            star_avg = Review.objects.filter(restaurant=restaurant).aggregate(Avg('stars'))['stars__avg']
-            restaurant.star_avg = star_avg
-            restaurant.save()
             if created:
+                # 레스토랑의 리뷰 집계 증분 갱신
+                Restaurant.update_review_stats(restaurant.restaurant_id, added=int(stars), created_at=review.created_at)
 
                 response_data = {
                     "status": "success",
@@ -471,6 +696,8 @@ class EditReview(APIView):
 
             if not (name, stars, menu, contents):
                 return Response({"error": "평점과 리뷰 내용이 없습니다."}, status=status.HTTP_400_BAD_REQUEST)
+            if not valid_stars(stars):
+                return Response({"error": "평점은 1에서 5 사이여야 합니다."}, status=status.HTTP_400_BAD_REQUEST)
 
             try:
                 restaurant = Restaurant.objects.get(restaurant_id=restaurant_id)
@@ -481,15 +708,14 @@ class EditReview(APIView):
                 return Response({"error": "리뷰를 찾을 수 없습니다."}, status=status.HTTP_404_NOT_FOUND)
 
             # 새로운 데이터로 리뷰 업데이트
-            review.stars = stars
+            old_stars = review.stars
+            review.stars = int(stars)
             review.menu = menu
             review.contents = contents
             review.save()
 
-            # 레스토랑의 평균 평점 업데이트
-            star_avg = Review.objects.filter(restaurant=restaurant).aggregate(Avg('stars'))['stars__avg']
-            restaurant.star_avg = star_avg
-            restaurant.save()
+            # 레스토랑의 리뷰 집계 증분 갱신
+            Restaurant.update_review_stats(restaurant.restaurant_id, added=review.stars, removed=old_stars)
 
             response_data = {
                 "status": "success",
@@ -512,8 +738,40 @@ class EditReview(APIView):
         return Response({"error": "세션 만료"}, status=status.HTTP_400_BAD_REQUEST)
     
 
-class NearbyRestaurantInfoView(APIView):
-    def get(self, request):
+class ReviewImageUploadView(AsyncAPIView):
+    # 리뷰 사진 직접 업로드 URL 발급 (작성자만)
+    async def post(self, request, restaurant_id, review_id):
+        user = request.user
+        if not user.is_authenticated:
+            return error_response(401, "Unauthorized", "세션 만료")
+        if not await Review.objects.filter(restaurant_id=restaurant_id, review_id=review_id, user=user).aexists():
+            return error_response(404, "Not Found", "리뷰를 찾을 수 없습니다.")
+        return await apresigned_upload_response(request, f"reviews/{review_id}/")
+
+
+class ReviewImageCompleteView(AsyncAPIView):
+    # 리뷰 사진 직접 업로드 완료 (변형 생성은 워커 풀에서)
+    async def post(self, request, restaurant_id, review_id):
+        user = request.user
+        if not user.is_authenticated:
+            return error_response(401, "Unauthorized", "세션 만료")
+        review = await Review.objects.filter(restaurant_id=restaurant_id, review_id=review_id, user=user).afirst()
+        if not review:
+            return error_response(404, "Not Found", "리뷰를 찾을 수 없습니다.")
+        key, error = await auploaded_key(request, f"reviews/{review_id}/")
+        if error is not None:
+            return error
+        await aattach_upload(review, key)
+        return Response({
+            "status": "success",
+            "message": "Image processing started",
+            "review_id": review.review_id,
+            "image": review.image,
+        }, status=status.HTTP_202_ACCEPTED)
+
+
+class NearbyRestaurantInfoView(ReplicaReadMixin, AsyncAPIView):
+    async def get(self, request):
         latitude = request.GET.get('latitude')
         longitude = request.GET.get('longitude')
         dist = request.GET.get('dist')
@@ -522,19 +780,14 @@ class NearbyRestaurantInfoView(APIView):
             longitude = float(longitude)
             dist = float(dist) if dist else 0.5
         except Exception:
-            return Response({
-                "status": "error",
-                "error": {
-                    "code": 400,
-                    "message": "Bad Request",
-                    "details": "Invalid input data",
-                },
-            }, status=status.HTTP_400_BAD_REQUEST)
-        
-        now = datetime.now()
-        user_location = Point((longitude, latitude), srid=4326)
+            return error_response(400, "Bad Request", "Invalid input data")
+        if not valid_coordinates(latitude, longitude) or not math.isfinite(dist) or dist < 0:
+            return error_response(400, "Bad Request", "Invalid input data")
+        dist = min(dist, NEARBY_MAX_DIST_KM)
+
+        slot = week_slot()
         if dist == 0:
-            restaurant = Restaurant.objects.filter(latitude=latitude, longitude=longitude).first()
+            restaurant = await Restaurant.objects.filter(latitude=latitude, longitude=longitude).afirst()
             if not restaurant:
                 return Response({
                     "status": "error",
@@ -555,8 +808,9 @@ class NearbyRestaurantInfoView(APIView):
                 "longitude": restaurant.longitude,
                 "latitude": restaurant.latitude,
                 "address": restaurant.address,
-                "waiting": restaurant.user_set.count(),
+                "waiting": await restaurant.user_set.acount(),
                 "image": restaurant.image,
+                "image_variants": restaurant.image_variants,
                 "is_24_hours": restaurant.is_24_hours,
                 "day_of_week": restaurant.day_of_week,
                 "start_time": str(restaurant.start_time.strftime("%H:%M")) if restaurant.start_time else "00:00",
@@ -566,14 +820,14 @@ class NearbyRestaurantInfoView(APIView):
                 "updated_at": restaurant.updated_at,
             }
         }, status=status.HTTP_200_OK)
-        query = Q(location__distance_lte=(user_location, D(km=dist)))
-        query &= (Q(is_24_hours=True) | Q(start_time__lte=now, end_time__gte=now)) # 운영시간 확인
-        restaurants = Restaurant.objects.filter(query)
+        # 공간 인덱스에서 반경 검색 (데이터셋 버전이 바뀐 경우에만 스레드에서 다시 적재)
+        index = await sync_to_async(get_index)()
+        matches = index.within(latitude, longitude, dist * 1000, lambda r: r.is_open(slot))
         restaurant_list = []
-        for restaurant in restaurants:
+        for _, restaurant in matches:
             restaurant_list.append({
                 "restaurant_id":restaurant.restaurant_id,
-                "category":restaurant.category,
+                "category":list(restaurant.category),
                 "latitude":restaurant.latitude,
                 "longitude":restaurant.longitude,
             })
@@ -583,20 +837,54 @@ class NearbyRestaurantInfoView(APIView):
             "restaurants":restaurant_list,
         }, status=status.HTTP_200_OK)
 
-class AllRestaurantInfoView(APIView):
-    def get(self, request):
-        category = int(request.GET.get('category'))
-        
-        restaurant_location_list = []
-        for restaurant in Restaurant.objects.all():
-            if category in restaurant.category:
-                restaurant_location_list.append({
-                    "restaurant_id": restaurant.restaurant_id,
-                    "lat": restaurant.latitude,
-                    "lng": restaurant.longitude,
-                })
-        return Response({
-            "status":"success",
-            "message":"All restaurants retrieved successfully",
-            "restaurants":restaurant_location_list,
-        }, status=status.HTTP_200_OK)
+class AllRestaurantInfoView(ReplicaReadMixin, AsyncAPIView):
+    async def get(self, request):
+        try:
+            category = int(request.GET.get('category'))
+            category_bit(category)
+        except (TypeError, ValueError):
+            return Response({
+                "status": "error",
+                "error": {
+                    "code": 400,
+                    "message": "Bad Request",
+                    "details": "Invalid category",
+                },
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        # 데이터셋 버전별 카테고리 스냅샷 (ETag 일치 시 304, 미리 압축된 본문 사용)
+        layer = await sync_to_async(get_map_layer)(category)
+        return layer.response(request)
+
+
+class RestaurantTileView(AsyncAPIView):
+    async def get(self, request, z, x, y):
+        if not valid_tile(z, x, y):
+            return Response({
+                "status": "error",
+                "error": {
+                    "code": 404,
+                    "message": "Not Found",
+                    "details": "Invalid tile coordinates",
+                },
+            }, status=status.HTTP_404_NOT_FOUND)
+        category = request.GET.get('category')
+        try:
+            category = int(category) if category else None
+            if category is not None:
+                category_bit(category)
+        except ValueError:
+            return Response({
+                "status": "error",
+                "error": {
+                    "code": 400,
+                    "message": "Bad Request",
+                    "details": "Invalid category",
+                },
+            }, status=status.HTTP_400_BAD_REQUEST)
+        open_now = request.GET.get('open', '').lower() in ('1', 'true')
+
+        tile = await sync_to_async(get_tile)(z, x, y, category, open_now)
+        response = HttpResponse(tile, content_type="application/vnd.mapbox-vector-tile")
+        response["Cache-Control"] = "public, max-age=60"
+        return response
@@ -0,0 +1,325 @@
+import json
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, transaction
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+from restaurants.spatial_index import CELL_DEG, get_index
+from utils.geo import covering_cells, grid_cell, haversine
+from utils.images import thumbnail_url
+from utils.pagination import from_micros, to_micros
+
+# 피드 셀 크기 (셀 안 식당을 공간 인덱스에서 바로 찾도록 같은 격자 사용)
+FEED_CELL_DEG = CELL_DEG
+# 셀별로 보관하는 최근 리뷰 수
+FEED_SIZE = 50
+# 피드 셀 유지 시간 (초, 활동이 없는 셀은 만료 후 다시 채움)
+FEED_TTL = 60 * 60 * 24
+# 프로세스 메모리 피드의 셀 유지 시간 (초, 다른 워커의 작성 / 무효화는 만료 후 DB 에서 다시 채울 때 반영)
+LOCAL_FEED_TTL = 60
+
+
+def feed_cell(latitude, longitude):
+    return grid_cell(float(latitude), float(longitude), FEED_CELL_DEG)
+
+
+def feed_entry(review, user_name):
+    """
+    리뷰 -> 피드 항목 (식당 이름, 카테고리, 위치는 조회 시 공간 인덱스에서 채움)
+    """
+    encoder = JSONEncoder()
+    return {
+        "review_id": review.review_id,
+        "restaurant_id": review.restaurant_id,
+        "user_id": review.user_id,
+        "user_name": user_name,
+        "stars": review.stars,
+        "menu": review.menu,
+        "contents": review.contents,
+        "thumbnail": thumbnail_url(review.image_variants),
+        "created_at": encoder.default(review.created_at),
+        "updated_at": encoder.default(review.updated_at),
+        "ts": to_micros(review.created_at),
+    }
+
+
+class FeedBackend:
+    """
+    지역 셀별 최근 리뷰 ring buffer 백엔드
+
+    셀 하나에 최근 FEED_SIZE 개 리뷰 항목을 최신순으로 보관한다.
+    Postgres 의 Review 가 영속 기록이고, 셀이 없으면(미적재 / 무효화) DB 에서 다시 채운다.
+    """
+    def push(self, cell, entry):
+        """
+        적재된 셀에 새 리뷰 추가 (미적재 셀은 다음 조회 시 DB 에서 채우므로 무시)
+        """
+        raise NotImplementedError
+
+    def read_many(self, cells):
+        """
+        Returns:
+            * {cell: [entry, ...] or None(미적재)}
+        """
+        raise NotImplementedError
+
+    def load(self, cell, entries):
+        raise NotImplementedError
+
+    def invalidate(self, cell):
+        raise NotImplementedError
+
+    def clear(self):
+        """
+        모든 셀 무효화 (COPY 등 signal 을 거치지 않는 대량 적재 후)
+        """
+        raise NotImplementedError
+
+
+class InMemoryFeedBackend(FeedBackend):
+    """
+    프로세스 메모리 피드 (테스트, 단일 워커 개발용)
+
+    다른 워커의 push / invalidate 는 보이지 않으므로 셀을 ttl 초 동안만 유지한다.
+    """
+    def __init__(self, size=FEED_SIZE, ttl=LOCAL_FEED_TTL, **options):
+        self.size = size
+        self.ttl = ttl
+        # 셀 -> (만료 시각, deque)
+        self._cells = {}
+        self._lock = threading.Lock()
+
+    def _buffer(self, cell):
+        item = self._cells.get(cell)
+        if item is None:
+            return None
+        expires_at, buffer = item
+        if time.monotonic() >= expires_at:
+            del self._cells[cell]
+            return None
+        return buffer
+
+    def push(self, cell, entry):
+        with self._lock:
+            buffer = self._buffer(cell)
+            if buffer is not None:
+                buffer.appendleft(entry)
+
+    def read_many(self, cells):
+        with self._lock:
+            result = {}
+            for cell in cells:
+                buffer = self._buffer(cell)
+                result[cell] = list(buffer) if buffer is not None else None
+            return result
+
+    def load(self, cell, entries):
+        with self._lock:
+            self._cells[cell] = (time.monotonic() + self.ttl, deque(entries, maxlen=self.size))
+
+    def invalidate(self, cell):
+        with self._lock:
+            self._cells.pop(cell, None)
+
+    def clear(self):
+        with self._lock:
+            self._cells.clear()
+
+
+class RedisFeedBackend(FeedBackend):
+    """
+    Redis list 기반 피드 (셀별 key 하나, LPUSH + LTRIM 으로 크기 유지)
+    """
+    PUSH_SCRIPT = """
+        if redis.call('EXISTS', KEYS[2]) == 0 then
+            return 0
+        end
+        redis.call('LPUSH', KEYS[1], ARGV[1])
+        redis.call('LTRIM', KEYS[1], 0, tonumber(ARGV[2]) - 1)
+        redis.call('EXPIRE', KEYS[1], ARGV[3])
+        redis.call('EXPIRE', KEYS[2], ARGV[3])
+        return 1
+    """
+    LOAD_SCRIPT = """
+        redis.call('DEL', KEYS[1])
+        if #ARGV > 1 then
+            redis.call('RPUSH', KEYS[1], unpack(ARGV, 2))
+            redis.call('EXPIRE', KEYS[1], ARGV[1])
+        end
+        redis.call('SET', KEYS[2], 1, 'EX', ARGV[1])
+        return #ARGV - 1
+    """
+
+    def __init__(self, url=None, prefix="feed", size=FEED_SIZE, ttl=FEED_TTL, **options):
+        import redis
+
+        self.client = redis.Redis.from_url(url or settings.REDIS_URL, decode_responses=True)
+        self.prefix = prefix
+        self.size = size
+        self.ttl = ttl
+        self._push = self.client.register_script(self.PUSH_SCRIPT)
+        self._load = self.client.register_script(self.LOAD_SCRIPT)
+
+    def _key(self, cell):
+        return f"{self.prefix}:{cell[0]}:{cell[1]}"
+
+    def _loaded_key(self, cell):
+        return f"{self.prefix}:{cell[0]}:{cell[1]}:loaded"
+
+    def push(self, cell, entry):
+        self._push(keys=[self._key(cell), self._loaded_key(cell)], args=[json.dumps(entry), self.size, self.ttl])
+
+    def read_many(self, cells):
+        pipe = self.client.pipeline(transaction=False)
+        for cell in cells:
+            pipe.exists(self._loaded_key(cell))
+            pipe.lrange(self._key(cell), 0, -1)
+        results = pipe.execute()
+        feeds = {}
+        for i, cell in enumerate(cells):
+            loaded, items = results[2 * i], results[2 * i + 1]
+            feeds[cell] = [json.loads(item) for item in items] if loaded else None
+        return feeds
+
+    def load(self, cell, entries):
+        self._load(
+            keys=[self._key(cell), self._loaded_key(cell)],
+            args=[self.ttl, *(json.dumps(entry) for entry in entries[:self.size])],
+        )
+
+    def invalidate(self, cell):
+        self.client.delete(self._key(cell), self._loaded_key(cell))
+
+    def clear(self):
+        keys = list(self.client.scan_iter(f"{self.prefix}:*", count=1000))
+        for i in range(0, len(keys), 1000):
+            self.client.delete(*keys[i:i + 1000])
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_feed_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                config = settings.REVIEW_FEED
+                _backend = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+    return _backend
+
+
+def backfill_cell(cell):
+    """
+    셀의 최근 리뷰를 DB 에서 읽어 피드 적재 (식당 id 는 공간 인덱스에서)
+    """
+    from .models import Review
+
+    restaurant_ids = [entry.restaurant_id for entry in get_index().in_cell(cell)]
+    entries = []
+    if restaurant_ids:
+        # 공유 피드에 적재하므로 replica 가 아닌 primary 에서 읽음 (publish_review 와 순서가 어긋나지 않도록)
+        reviews = (
+            Review.objects.using(DEFAULT_DB_ALIAS).filter(restaurant_id__in=restaurant_ids)
+            .select_related("user")
+            .order_by("-created_at", "-review_id")[:FEED_SIZE]
+        )
+        entries = [feed_entry(review, review.user.name) for review in reviews]
+    get_feed_backend().load(cell, entries)
+    return entries
+
+
+def _entry_key(entry):
+    return entry["ts"], entry["review_id"]
+
+
+def nearby_reviews(latitude, longitude, radius_m=500, limit=20, after=None):
+    """
+    반경 radius_m 안 식당들의 최근 리뷰 (덮는 셀들의 피드를 병합)
+
+    Args:
+        * after ((created_at 마이크로초, review_id)): 이 리뷰보다 오래된 것만 (keyset cursor)
+
+    Returns:
+        * [(entry, IndexedRestaurant), ...] 최신순 최대 limit 개
+    """
+    cells = covering_cells(latitude, longitude, radius_m, FEED_CELL_DEG)
+    feeds = get_feed_backend().read_many(cells)
+    index = get_index()
+    merged = []
+    # 버퍼가 가득 찬 셀은 가장 오래된 항목보다 이전 리뷰가 잘려 있을 수 있음
+    truncated_at = []
+    for cell, entries in feeds.items():
+        if entries is None:
+            entries = backfill_cell(cell)
+        if len(entries) >= FEED_SIZE:
+            truncated_at.append(min(_entry_key(entry) for entry in entries))
+        for entry in entries:
+            if after is not None and _entry_key(entry) >= tuple(after):
+                continue
+            restaurant = index.get(entry["restaurant_id"])
+            if restaurant is None:
+                continue
+            if haversine(latitude, longitude, restaurant.latitude, restaurant.longitude) > radius_m:
+                continue
+            merged.append((entry, restaurant))
+    merged.sort(key=lambda item: _entry_key(item[0]), reverse=True)
+    merged = merged[:limit]
+
+    # 잘린 구간이 결과 범위에 걸치면 DB 에서 직접 조회
+    if truncated_at:
+        oldest_needed = _entry_key(merged[-1][0]) if len(merged) == limit else None
+        if oldest_needed is None or max(truncated_at) > oldest_needed:
+            return nearby_reviews_from_db(latitude, longitude, radius_m, limit, after)
+    return merged
+
+
+def nearby_reviews_from_db(latitude, longitude, radius_m=500, limit=20, after=None):
+    """
+    피드로 정확히 답할 수 없는 깊은 페이지용 DB 조회 (쿼리 1회)
+    """
+    from django.db.models import Q
+    from .models import Review
+
+    restaurants = {entry.restaurant_id: entry for _, entry in get_index().within(latitude, longitude, radius_m)}
+    if not restaurants:
+        return []
+    reviews = (
+        Review.objects.filter(restaurant_id__in=list(restaurants))
+        .select_related("user")
+        .order_by("-created_at", "-review_id")
+    )
+    if after is not None:
+        created_at = from_micros(after[0])
+        reviews = reviews.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, review_id__lt=after[1]))
+    return [
+        (feed_entry(review, review.user.name), restaurants[review.restaurant_id])
+        for review in reviews[:limit]
+    ]
+
+
+def publish_review(review, user_name):
+    """
+    리뷰 작성 시 식당 셀의 피드에 추가 (커밋 후)
+    """
+    def on_commit():
+        restaurant = get_index().get(review.restaurant_id)
+        if restaurant is not None:
+            get_feed_backend().push(feed_cell(restaurant.latitude, restaurant.longitude), feed_entry(review, user_name))
+    transaction.on_commit(on_commit)
+
+
+def invalidate_review(restaurant_id):
+    """
+    리뷰 수정 / 삭제 시 식당 셀의 피드 무효화 (다음 조회 시 DB 에서 다시 채움)
+    """
+    def on_commit():
+        restaurant = get_index().get(restaurant_id)
+        if restaurant is not None:
+            get_feed_backend().invalidate(feed_cell(restaurant.latitude, restaurant.longitude))
+    transaction.on_commit(on_commit)
@@ -0,0 +1,106 @@
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+
+from restaurants.models import Restaurant
+from reviews.feed import get_feed_backend
+from reviews.seed_data import korean_sentences, korean_menu
+from users.models import User
+from utils.bulk_copy import copy_rows
+
+
+class Command(BaseCommand):
+    help = "리뷰(및 유저, 웨이팅) 시드 데이터를 PostgreSQL COPY 로 대량 적재 후 리뷰 집계를 재계산"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--reviews", type=int, default=3 * 4510, help="생성할 리뷰 수")
+        parser.add_argument("--users", type=int, default=0, help="생성할 유저 수 (리뷰 작성자로 사용)")
+        parser.add_argument("--reservations", type=int, default=0, help="생성할 웨이팅 수")
+        parser.add_argument("--days", type=int, default=365, help="리뷰 작성일 분포 기간(일)")
+        parser.add_argument("--seed", type=int, default=0, help="난수 seed (같은 seed 면 같은 데이터)")
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        now = timezone.now()
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            if options["users"]:
+                created = copy_rows(cursor, User._meta.db_table,
+                    ["password", "name", "phone_number", "is_staff", "is_superuser", "last_login", "created_at", "updated_at"],
+                    self.user_rows(self.next_user_number(), options["users"], now))
+                self.stdout.write(f"{created} users copied")
+
+            restaurant_ids = list(Restaurant.objects.values_list("restaurant_id", flat=True))
+            user_ids = list(User.objects.values_list("user_id", flat=True))
+            if not (restaurant_ids and user_ids):
+                self.stderr.write("Restaurant 와 User 가 먼저 필요합니다.")
+                return
+
+            if options["reviews"]:
+                created = copy_rows(cursor, "Review",
+                    ["restaurant_id", "user_id", "stars", "contents", "menu", "image", "created_at", "updated_at"],
+                    self.review_rows(rng, options["reviews"], restaurant_ids, user_ids, now, options["days"]),
+                    force_not_null=["image"])
+                self.stdout.write(f"{created} reviews copied")
+
+            if options["reservations"]:
+                cursor.execute('SELECT COALESCE(MAX(reservation_id), 0) FROM "restaurants_reservation"')
+                last_reservation_id = cursor.fetchone()[0]
+                created = copy_rows(cursor, "restaurants_reservation",
+                    ["restaurant_id", "user_id", "phone_number", "reservation_date"],
+                    self.reservation_rows(rng, options["reservations"], restaurant_ids, user_ids, now))
+                cursor.execute(
+                    'INSERT INTO "restaurants_reservationqueue" (restaurant_id, reservation_id) '
+                    'SELECT restaurant_id, reservation_id FROM "restaurants_reservation" WHERE reservation_id > %s',
+                    [last_reservation_id],
+                )
+                self.stdout.write(f"{created} reservations copied (run sync_waiting_queues to refresh queues)")
+
+            updated = Restaurant.rebuild_review_stats()
+            self.stdout.write(f"review stats rebuilt for {updated} restaurants")
+            # COPY 는 signal 을 거치지 않으므로 리뷰 피드를 비워 다음 조회 시 다시 채움
+            transaction.on_commit(get_feed_backend().clear)
+        self.stdout.write(self.style.SUCCESS("Seeding finished."))
+
+    def next_user_number(self):
+        """
+        이미 적재한 시드 유저 다음 번호 (다시 실행해도 phone_number unique 제약에 걸리지 않도록)
+        """
+        last = User.objects.filter(phone_number__regex=r"^019[0-9]{8}$").aggregate(last=Max("phone_number"))["last"]
+        return int(last[3:]) + 1 if last else 0
+
+    def user_rows(self, start, count, now):
+        password = make_password("yumyum-seed")
+        for i in range(start, start + count):
+            yield (password, f"seed{i}", f"019{i:08d}", False, False, now, now, now)
+
+    def review_rows(self, rng, count, restaurant_ids, user_ids, now, days):
+        for _ in range(count):
+            created_at = now - timedelta(seconds=rng.randrange(days * 24 * 60 * 60))
+            yield (
+                rng.choice(restaurant_ids),
+                rng.choice(user_ids),
+                rng.randint(1, 5),
+                rng.choice(korean_sentences),
+                [rng.choice(korean_menu) for _ in range(rng.randint(1, 5))],
+                "",
+                created_at,
+                created_at,
+            )
+
+    def reservation_rows(self, rng, count, restaurant_ids, user_ids, now):
+        # 식당별로 같은 유저가 두 번 대기하지 않도록 중복 제외
+        seen = set()
+        attempts = 0
+        while len(seen) < count and attempts < count * 10:
+            attempts += 1
+            pair = (rng.choice(restaurant_ids), rng.choice(user_ids))
+            if pair in seen:
+                continue
+            seen.add(pair)
+            yield (pair[0], pair[1], None, now.date())
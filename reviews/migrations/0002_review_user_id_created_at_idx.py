@@ -0,0 +1,22 @@
+# Review 는 managed = False 이므로 인덱스는 RunSQL 로 추가
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                CREATE INDEX IF NOT EXISTS "Review_user_id_created_at_idx"
+                    ON "Review" (user_id, created_at DESC, review_id DESC);
+            ''',
+            reverse_sql='''
+                DROP INDEX IF EXISTS "Review_user_id_created_at_idx";
+            ''',
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Review 는 managed = False 이므로 컬럼은 RunSQL 로 추가
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0002_review_user_id_created_at_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                ALTER TABLE "Review"
+                    ADD COLUMN IF NOT EXISTS image_variants jsonb NOT NULL DEFAULT '{}'::jsonb;
+            ''',
+            reverse_sql='''
+                ALTER TABLE "Review" DROP COLUMN IF EXISTS image_variants;
+            ''',
+        ),
+    ]
@@ -2,8 +2,9 @@ from django.contrib.gis.db import models
 from restaurants.models import Restaurant
 from users.models import User
 from django.contrib.postgres.fields import ArrayField
-from utils.aws import S3ImgUploader
-from config.settings import S3_base_url
+from django.db import transaction
+from utils.aws import public_url
+from utils.images import submit_image, submit_upload
 import os
 
 class Review(models.Model):
@@ -14,6 +15,8 @@ class Review(models.Model):
     contents = models.CharField(max_length=500, blank=True, null=True)
     menu = ArrayField(models.CharField(max_length=100))
     image = models.URLField()
+    # 이미지 변형 URL (Restaurant.image_variants 와 같은 구조)
+    image_variants = models.JSONField(default=dict, blank=True)
     
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -25,8 +28,31 @@ class Review(models.Model):
     def save_img(self, img_path):
         if os.path.exists(img_path):
             with open(img_path, "rb") as img:
-                url = S3ImgUploader(img).upload_review_img(self.review_id)
-                self.image = S3_base_url + url
-                self.save()
-                return url
-        return None
\ No newline at end of file
+                self.enqueue_image(img.read())
+                return True
+        return None
+
+    def enqueue_image(self, data):
+        """
+        이미지 변형 생성 / 업로드를 커밋 후 워커 풀에 맡기고 바로 반환
+        """
+        prefix, on_done = self._image_job()
+        transaction.on_commit(lambda: submit_image(data, prefix, on_done))
+
+    def attach_upload(self, key):
+        """
+        presigned 직접 업로드 완료 처리 (Restaurant.attach_upload 와 동일)
+        """
+        self.image = public_url(key)
+        Review.objects.filter(review_id=self.review_id).update(image=self.image)
+        prefix, on_done = self._image_job()
+        transaction.on_commit(lambda: submit_upload(key, prefix, on_done))
+
+    def _image_job(self):
+        review_id = self.review_id
+
+        def on_done(variants):
+            Review.objects.filter(review_id=review_id).update(
+                image=variants["original"]["jpeg"], image_variants=variants,
+            )
+        return f"img/reviews/{review_id}/", on_done
@@ -0,0 +1,63 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from .models import Review
+
+
+def latest_reviews_queryset(restaurant_ids, limit):
+    """
+    식당별 최신 리뷰 limit개
+    (ROW_NUMBER() OVER (PARTITION BY restaurant_id ORDER BY created_at DESC))
+    """
+    return (
+        Review.objects.filter(restaurant_id__in=restaurant_ids)
+        .select_related("user")
+        .annotate(row_number=Window(
+            RowNumber(),
+            partition_by=[F("restaurant_id")],
+            order_by=[F("created_at").desc(), F("review_id").desc()],
+        ))
+        .filter(row_number__lte=limit)
+        .order_by("restaurant_id", "row_number")
+    )
+
+
+def latest_reviews(restaurant_ids, limit=2):
+    """
+    식당별 최신 리뷰 limit개를 한 번의 쿼리로 조회
+
+    Args:
+        * restaurant_ids (list): 식당 id 목록
+        * limit (int): 식당별 리뷰 개수
+
+    Returns:
+        * {restaurant_id: [Review, ...]} (작성자 user 포함)
+    """
+    previews = {restaurant_id: [] for restaurant_id in restaurant_ids}
+    for review in latest_reviews_queryset(restaurant_ids, limit):
+        previews.setdefault(review.restaurant_id, []).append(review)
+    return previews
+
+
+async def alatest_reviews(restaurant_ids, limit=2):
+    """
+    latest_reviews 의 async 버전 (async 뷰에서 사용)
+    """
+    previews = {restaurant_id: [] for restaurant_id in restaurant_ids}
+    async for review in latest_reviews_queryset(restaurant_ids, limit):
+        previews.setdefault(review.restaurant_id, []).append(review)
+    return previews
+
+
+def review_preview(reviews, index):
+    """
+    리뷰 미리보기 응답 (리뷰가 없으면 None)
+    """
+    if index >= len(reviews):
+        return None
+    review = reviews[index]
+    return {
+        "user_name": review.user.name,
+        "stars": review.stars,
+        "contents": review.contents,
+    }
@@ -1,13 +1,4 @@
-import os
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
-import django
-django.setup()
-
-from django_seed import Seed
-from restaurants.models import Restaurant
-from users.models import User
-from reviews.models import Review 
-import random
+# 리뷰 시드 데이터 생성용 문장 / 메뉴 목록
 
 korean_sentences = [
     "음식들이 다 정말 맛있어요! 재방문 의사 있어요!. 음식이 부드럽고 식감이 좋아 두고 두고 기억에 남는 맛이었습니다",
@@ -132,19 +123,3 @@ korean_menu = [
     "까르보나라",
     "바베큐스테이크",
 ]
-
-seeder = Seed.seeder()
-restaurant_ids = list(range(1, 4511))  
-user_id = 1
-
-for restaurant_id in restaurant_ids:        
-    seeder.add_entity(Review, 3, {
-        'restaurant': Restaurant.objects.get(pk=restaurant_id),
-        'user': User.objects.get(pk=user_id),
-        'stars': lambda x: seeder.faker.random_int(min=1, max=5),
-        'contents': lambda x: random.choice(korean_sentences),
-        'menu': lambda x: [random.choice(korean_menu) for _ in range(seeder.faker.random_int(min=1, max=5))],
-        'images': [],
-    })
-
-inserted_pks = seeder.execute()
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from . import feed
+from .models import Review
+
+
+@receiver(post_save, sender=Review)
+def review_saved(sender, instance, created, **kwargs):
+    if created:
+        feed.publish_review(instance, instance.user.name)
+    else:
+        feed.invalidate_review(instance.restaurant_id)
+
+
+@receiver(post_delete, sender=Review)
+def review_deleted(sender, instance, **kwargs):
+    feed.invalidate_review(instance.restaurant_id)
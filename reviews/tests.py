@@ -1,3 +1,36 @@
-from django.test import TestCase
+from django.test import SimpleTestCase
 
-# Create your tests here.
+from .feed import InMemoryFeedBackend
+
+
+class InMemoryFeedBackendTests(SimpleTestCase):
+    def setUp(self):
+        self.backend = InMemoryFeedBackend(size=3)
+
+    def test_push_ignores_unloaded_cell(self):
+        self.backend.push((1, 1), {"review_id": 1})
+        self.assertEqual(self.backend.read_many([(1, 1)]), {(1, 1): None})
+
+    def test_push_keeps_latest_entries(self):
+        self.backend.load((1, 1), [{"review_id": 2}, {"review_id": 1}])
+        self.backend.load((1, 2), [])
+        for review_id in (3, 4):
+            self.backend.push((1, 1), {"review_id": review_id})
+        feeds = self.backend.read_many([(1, 1), (1, 2), (2, 2)])
+        self.assertEqual([entry["review_id"] for entry in feeds[(1, 1)]], [4, 3, 2])
+        self.assertEqual(feeds[(1, 2)], [])
+        self.assertIsNone(feeds[(2, 2)])
+
+    def test_invalidate_and_clear(self):
+        self.backend.load((1, 1), [{"review_id": 1}])
+        self.backend.load((1, 2), [{"review_id": 2}])
+        self.backend.invalidate((1, 1))
+        self.assertEqual(self.backend.read_many([(1, 1), (1, 2)]), {(1, 1): None, (1, 2): [{"review_id": 2}]})
+        self.backend.clear()
+        self.assertEqual(self.backend.read_many([(1, 2)]), {(1, 2): None})
+
+    def test_cells_expire_after_ttl(self):
+        backend = InMemoryFeedBackend(size=3, ttl=0)
+        backend.load((1, 1), [{"review_id": 1}])
+        backend.push((1, 1), {"review_id": 2})
+        self.assertEqual(backend.read_many([(1, 1)]), {(1, 1): None})
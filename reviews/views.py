@@ -1,17 +1,15 @@
+from asgiref.sync import sync_to_async
 from rest_framework import status
-from rest_framework.views import APIView
 from rest_framework.response import Response
-from django.contrib.gis.geos import Point, GEOSGeometry
-from django.contrib.gis.db.models.functions import Distance
-from django.contrib.gis.measure import D
-from django.db.models import Q
-from restaurants.models import Restaurant
-from users.models import User
-from .models import Review
+from config.db_router import ReplicaReadMixin
+from utils.async_views import AsyncAPIView
+from utils.geo import valid_coordinates
+from utils.pagination import encode_cursor, page_params
+from .feed import nearby_reviews
 
 
-class ReviewThread(APIView):  # thread 만들기
-    def get(self, request):
+class ReviewThread(ReplicaReadMixin, AsyncAPIView):  # thread 만들기
+    async def get(self, request):
         user = request.user
         if user.is_authenticated:
             user_longitude = request.GET.get("longitude")
@@ -27,37 +25,52 @@ class ReviewThread(APIView):  # thread 만들기
                     }
                     }, status=status.HTTP_400_BAD_REQUEST)
 
-            user_location = Point(float(user_longitude), float(user_latitude), srid=4326)
+            try:
+                user_longitude = float(user_longitude)
+                user_latitude = float(user_latitude)
+                cursor, page_size = page_params(request)
+                # nan / inf 나 범위를 벗어난 좌표는 피드 셀 계산에서 실패하므로 여기서 거부
+                if not valid_coordinates(user_latitude, user_longitude):
+                    raise ValueError("Invalid coordinates")
+            except ValueError:
+                return Response({
+                    "status": "error",
+                    "error": {
+                        "code": 400,
+                        "message": "BadRequest",
+                        "details": "Invalid parameters. Please provide valid location data."
+                    }
+                    }, status=status.HTTP_400_BAD_REQUEST)
 
-            # 1km 반경 안에 있는 리뷰를 가져오기
-            reviews = (
-                Review.objects.annotate(
-                    distance=Distance("restaurant__location", user_location)
-                )
-                .filter(distance__lte=D(m=500))
-                .order_by("-created_at")[:20]
-            )
+            # 500m 반경을 덮는 셀들의 최근 리뷰 피드를 병합 (다음 페이지 확인용으로 1개 더)
+            reviews = await sync_to_async(nearby_reviews)(user_latitude, user_longitude, 500, page_size + 1, after=cursor)
+            next_cursor = None
+            if len(reviews) > page_size:
+                reviews = reviews[:page_size]
+                next_cursor = encode_cursor(reviews[-1][0]["ts"], reviews[-1][0]["review_id"])
 
             review_list = []
-            for review in reviews:
+            for review, restaurant in reviews:
                 review_list.append(
                     {
-                        "review_id": review.review_id,
-                        "restaurant_name": review.restaurant.name,
-                        "category": review.restaurant.category,
-                        "user_id": review.user.user_id,
-                        "user_name": review.user.name,
-                        "stars": review.stars,
-                        "menu": review.menu,
-                        "contents": review.contents,
-                        "created_at": review.created_at,
-                        "updated_at": review.updated_at,
+                        "review_id": review["review_id"],
+                        "restaurant_name": restaurant.name,
+                        "category": list(restaurant.category),
+                        "user_id": review["user_id"],
+                        "user_name": review["user_name"],
+                        "stars": review["stars"],
+                        "menu": review["menu"],
+                        "thumbnail": review.get("thumbnail"),
+                        "contents": review["contents"],
+                        "created_at": review["created_at"],
+                        "updated_at": review["updated_at"],
                     }
                 )
             return Response({
                 "status": "success",
                 "message": "Nearby restauant reviews retrived sucessfully.",
-                "reviews": review_list
+                "reviews": review_list,
+                "next_cursor": next_cursor,
                 }, status=status.HTTP_200_OK)
             
         return Response({
@@ -0,0 +1,76 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .revocation import revoked_key
+
+USER_CACHE_PREFIX = "jwt:user"
+# 인증된 User 캐시 유지 시간 (초, 수정 / 삭제 시에는 바로 무효화)
+USER_CACHE_TTL = 60
+
+
+def user_cache_key(user_id):
+    return f"{USER_CACHE_PREFIX}:{user_id}"
+
+
+def invalidate_user(user):
+    """
+    User 수정 / 삭제 시 캐시 무효화
+
+    커밋 전 다른 요청이 이전 값을 다시 캐시할 수 있어 커밋 후에도 한 번 더 지운다.
+    """
+    key = user_cache_key(getattr(user, api_settings.USER_ID_FIELD))
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    User 조회를 캐시하는 JWTAuthentication
+
+    서명 / 만료 검증 후 폐기된 jti 여부와 캐시된 User 를 get_many 한 번으로 확인하므로
+    캐시에 User 가 있으면 DB 조회 없이 인증한다.
+    """
+    def authenticate(self, request):
+        header = self.get_header(request)
+        if header is None:
+            return None
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+        validated_token = self.get_validated_token(raw_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_("Token contained no recognizable user identification"))
+        user_key = user_cache_key(user_id)
+        keys = [user_key]
+        jti = validated_token.get(api_settings.JTI_CLAIM)
+        if jti is not None:
+            keys.append(revoked_key(jti))
+        found = cache.get_many(keys)
+
+        if jti is not None and revoked_key(jti) in found:
+            raise InvalidToken(_("Token is blacklisted"))
+        user = found.get(user_key)
+        if user is None:
+            user = self.get_user(validated_token)
+            cache.set(user_key, user, timeout=USER_CACHE_TTL)
+        else:
+            self.check_user(user, validated_token)
+        return user, validated_token
+
+    def check_user(self, user, validated_token):
+        """
+        캐시된 User 에도 JWTAuthentication.get_user 와 같은 검사 적용
+        """
+        if not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
@@ -0,0 +1,26 @@
+import time
+
+from django.core.cache import cache
+from rest_framework_simplejwt.settings import api_settings
+
+REVOKED_PREFIX = "jwt:revoked"
+
+
+def revoked_key(jti):
+    return f"{REVOKED_PREFIX}:{jti}"
+
+
+def revoke_token(token):
+    """
+    토큰의 jti 를 폐기 목록에 추가 (토큰 만료 시각까지만 보관하므로 목록이 계속 커지지 않음)
+    """
+    jti = token.get(api_settings.JTI_CLAIM)
+    if jti is None:
+        return
+    timeout = int(token.get("exp", 0) - time.time())
+    if timeout > 0:
+        cache.set(revoked_key(jti), 1, timeout=timeout)
+
+
+def is_revoked(jti):
+    return cache.get(revoked_key(jti)) is not None
@@ -1,3 +1,22 @@
-from django.test import TestCase
+import time
 
-# Create your tests here.
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from .revocation import is_revoked, revoke_token
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class RevocationTests(SimpleTestCase):
+    def tearDown(self):
+        cache.clear()
+
+    def test_revoke_until_expiry(self):
+        self.assertFalse(is_revoked("a"))
+        revoke_token({"jti": "a", "exp": time.time() + 60})
+        self.assertTrue(is_revoked("a"))
+
+    def test_expired_or_jti_less_token_is_ignored(self):
+        revoke_token({"jti": "b", "exp": time.time() - 1})
+        revoke_token({"exp": time.time() + 60})
+        self.assertFalse(is_revoked("b"))
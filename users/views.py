@@ -2,16 +2,27 @@ from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.tokens import RefreshToken, Token
 from rest_framework_simplejwt.exceptions import TokenError
 from django.contrib.auth import authenticate
 from django.db import transaction
 from datetime import datetime
 
+from config.db_router import ReplicaReadMixin
+
 from restaurants.models import Restaurant, Reservation
+from restaurants.queues import get_queue_backend, lock_queue, queue_member, user_queue_positions
+from restaurants.broadcast import publish_queue_change
 from .models import User
+from .revocation import revoke_token
 from .serializers import *
 from reviews.models import Review
+from utils.async_views import AsyncAPIView
+from utils.pagination import akeyset_page, page_params
+from utils.images import thumbnail_url
+
+# 내 리뷰 목록 기본 페이지 크기
+USER_REVIEW_PAGE_SIZE = 10
 
 # Create your views here.
 class SignupView(APIView):
@@ -139,10 +150,14 @@ class AuthView(APIView):
     def delete(self, request):
         user = request.user
         if user.is_authenticated:
-            print(user)
             refresh_token = request.data.get('refresh')
             try:
-                RefreshToken(refresh_token).blacklist()
+                refresh_token = RefreshToken(refresh_token)
+                refresh_token.blacklist()
+                # 만료 전 access / refresh 토큰을 폐기 목록에 추가 (인증 시 DB 조회 없이 거부)
+                revoke_token(refresh_token)
+                if isinstance(request.auth, Token):
+                    revoke_token(request.auth)
                 res = Response(
                     {
                         "status": "success",
@@ -225,12 +240,10 @@ class UserWaitingView(APIView):
         user = request.user
         if user.is_authenticated:
             reservation_list = []
-            for restaurant in user.reservations.all():
-                queue = restaurant.queue
-                position = queue.filter(reservation_id__lte=queue.get(user=user).reservation_id).count()
+            for restaurant_id, restaurant_name, position in user_queue_positions(user):
                 reservation_list.append({
-                    "restaurant_id": restaurant.restaurant_id,
-                    "restaurant": restaurant.name,
+                    "restaurant_id": restaurant_id,
+                    "restaurant": restaurant_name,
                     "position": position,
                 })
             return Response({
@@ -278,7 +291,15 @@ class UserWaitingView(APIView):
                     }, status=status.HTTP_404_NOT_FOUND)
             
             reservation_id = reservation.reservation_id
+            backend = get_queue_backend()
+            member = queue_member(user=user)
+            lock_queue(restaurant.restaurant_id)
+            position = backend.rank(restaurant.restaurant_id, member)
             reservation.delete()
+            # 큐 백엔드에서는 커밋된 뒤에 제거 (롤백 시 큐가 어긋나지 않도록)
+            transaction.on_commit(lambda: backend.remove(restaurant.restaurant_id, member))
+            if position is not None:
+                publish_queue_change(restaurant.restaurant_id, "left", position)
             return Response(
             {
                 "status": "success",
@@ -297,12 +318,20 @@ class UserWaitingView(APIView):
         }, status=status.HTTP_401_UNAUTHORIZED)
         
         
-class UserReviewListView(APIView):
-    def get(self, request):
+class UserReviewListView(ReplicaReadMixin, AsyncAPIView):
+    async def get(self, request):
         user = request.user
         if user.is_authenticated:
+            try:
+                cursor, page_size = page_params(request, default=USER_REVIEW_PAGE_SIZE)
+            except ValueError:
+                return Response({"error": "Invalid request. Please check your input data"}, status=status.HTTP_400_BAD_REQUEST)
             review_infos = []
-            reviews = Review.objects.filter(user_id = user).order_by('-created_at')[:10]
+            # (created_at, review_id) keyset 페이지, 식당 join
+            reviews, next_cursor = await akeyset_page(
+                Review.objects.filter(user_id = user).select_related('restaurant'),
+                cursor, page_size, pk_field='review_id',
+            )
             
             for review in reviews:
                 review_info = {
@@ -310,6 +339,7 @@ class UserReviewListView(APIView):
                     "restaurant_id" : review.restaurant.restaurant_id,
                     "name" : review.restaurant.name,
                     "stars": review.stars,
+                    "thumbnail": thumbnail_url(review.image_variants),
                     "contents": review.contents,
                     "created_at": review.created_at,
                     "updated_at": review.updated_at,
@@ -318,7 +348,8 @@ class UserReviewListView(APIView):
                 
             responst_data = {
                 "user_id" : user.user_id,
-                "reviews" : review_infos
+                "reviews" : review_infos,
+                "next_cursor" : next_cursor,
             }
             return Response(responst_data, status=status.HTTP_200_OK)
         error_response = {
@@ -345,7 +376,10 @@ class DeleteReview(APIView):
                         "review_id": review.review_id
                     }
                 }
-                review.delete()
+                with transaction.atomic():
+                    review.delete()
+                    # 레스토랑의 리뷰 집계 증분 갱신
+                    Restaurant.update_review_stats(review.restaurant_id, removed=review.stars)
                 return Response(responst_data, status=status.HTTP_204_NO_CONTENT)
             except Review.DoesNotExist:
                 responst_data = {
@@ -0,0 +1,39 @@
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """
+    async def get / post 핸들러를 쓰는 APIView (DRF 3.14 는 async 뷰를 지원하지 않음)
+
+    인증 / 권한 / throttle (initial) 은 sync 코드라 요청 스레드에서 실행하고,
+    핸들러는 이벤트 루프에서 실행해 DB / S3 를 기다리는 동안 다른 요청을 처리한다.
+    핸들러 안에서는 async ORM (aget, afirst, async for ...) 또는 sync_to_async 로만 DB 에 접근한다.
+    예외 처리와 응답 렌더링은 APIView 와 같다.
+    """
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                # options / http_method_not_allowed
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
@@ -1,4 +1,142 @@
-import boto3, uuid, os, mimetypes
+import mimetypes
+import os
+import threading
+import uuid
+
+import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from django.conf import settings
+
+MB = 1024 * 1024
+# upload_fileobj 멀티파트 설정 (8MB 이상이면 8MB 조각을 병렬 업로드)
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=8 * MB,
+    max_concurrency=8,
+    use_threads=True,
+)
+# presigned 업로드 URL 유효 시간 (초)
+PRESIGN_EXPIRES = 60 * 10
+# 직접 업로드 최대 크기
+MAX_UPLOAD_BYTES = 20 * MB
+# 직접 업로드를 허용하는 Content-Type -> 확장자
+IMAGE_CONTENT_TYPES = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_s3_client():
+    """
+    프로세스 공용 S3 client
+
+    boto3 client 는 thread-safe 하고 생성 비용(자격 증명, endpoint 해석)이 커서 한 번만 만든다.
+    연결 풀 크기는 이미지 업로드 워커 수보다 크게 잡는다.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                session = boto3.session.Session(
+                    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+                    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+                    region_name=settings.S3_REGION,
+                )
+                _client = session.client(
+                    "s3",
+                    endpoint_url=settings.S3_ENDPOINT_URL,
+                    config=Config(
+                        signature_version="s3v4",
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                        retries={"max_attempts": 3, "mode": "standard"},
+                        tcp_keepalive=True,
+                        # presigned URL 이 리전 endpoint 를 가리키도록 (S3 호환 저장소는 path 방식)
+                        s3={"addressing_style": "path" if settings.S3_ENDPOINT_URL else "virtual"},
+                    ),
+                )
+    return _client
+
+
+def public_url(key):
+    return settings.S3_BASE_URL + key
+
+
+def upload_key(prefix, content_type):
+    """
+    직접 업로드용 새 key (uploads/{prefix}{uuid}.{확장자})
+
+    Raises:
+        * KeyError: 허용하지 않는 Content-Type
+    """
+    return f"uploads/{prefix}{uuid.uuid4().hex}.{IMAGE_CONTENT_TYPES[content_type]}"
+
+
+def presign_upload(key, content_type, method="POST", max_bytes=MAX_UPLOAD_BYTES, expires_in=PRESIGN_EXPIRES):
+    """
+    클라이언트가 버킷에 바로 올릴 presigned 요청 생성
+
+    POST 는 크기 상한(content-length-range)을 서명에 포함하므로 기본값으로 사용,
+    PUT 은 크기를 강제할 수 없어 완료 처리에서 크기를 다시 확인한다.
+
+    Returns:
+        * {"method", "url", "fields"(POST) 또는 "headers"(PUT), "key", "expires_in"}
+    """
+    client = get_s3_client()
+    if method == "PUT":
+        url = client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": settings.S3_BUCKET, "Key": key, "ContentType": content_type},
+            ExpiresIn=expires_in,
+        )
+        return {
+            "method": "PUT",
+            "url": url,
+            "headers": {"Content-Type": content_type},
+            "key": key,
+            "expires_in": expires_in,
+        }
+    post = client.generate_presigned_post(
+        settings.S3_BUCKET,
+        key,
+        Fields={"Content-Type": content_type},
+        Conditions=[{"Content-Type": content_type}, ["content-length-range", 1, max_bytes]],
+        ExpiresIn=expires_in,
+    )
+    return {
+        "method": "POST",
+        "url": post["url"],
+        "fields": post["fields"],
+        "key": key,
+        "expires_in": expires_in,
+    }
+
+
+def head_object(key):
+    """
+    Returns:
+        * head_object 응답 or None(객체 없음)
+    """
+    try:
+        return get_s3_client().head_object(Bucket=settings.S3_BUCKET, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+
+def download(key):
+    return get_s3_client().get_object(Bucket=settings.S3_BUCKET, Key=key)["Body"].read()
+
+
+def delete(key):
+    get_s3_client().delete_object(Bucket=settings.S3_BUCKET, Key=key)
+
 
 class S3ImgUploader:
     """
@@ -9,41 +147,31 @@ class S3ImgUploader:
 
     def upload(self):
         return self.__upload()
-    
+
     def upload_review_img(self, review_id:int=0):
         dir = f"{review_id}/" if review_id > 0 else ""
         return self.__upload(f'reviews/{dir}')
-    
+
     def upload_restaurant_img(self, restaurant_id:int=0):
         dir = f"{restaurant_id}/" if restaurant_id > 0 else ""
         return self.__upload(f'restaurants/{dir}')
-        
+
     def delete(self, url):
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id = os.environ['AWS_ACCESS_KEY_ID'],
-            aws_secret_access_key = os.environ['AWS_SECRET_ACCESS_KEY']
-        )
         try:
-            s3_client.delete_object(Bucket="yumyum-s3-bucket", Key=url)
+            delete(url)
             return True
         except Exception:
             return False
 
     def __upload(self, dir:str=""):
-        s3_client = boto3.client(
-            's3',
-            aws_access_key_id = os.environ['AWS_ACCESS_KEY_ID'],
-            aws_secret_access_key = os.environ['AWS_SECRET_ACCESS_KEY']
-        )
-        
         content_type, _ = mimetypes.guess_type(self.file.name)
         file_name, _ = os.path.splitext(os.path.basename(self.file.name))
         url = 'img/'+dir+file_name+'_'+uuid.uuid1().hex
-        s3_client.upload_fileobj(
-            self.file, 
-            "yumyum-s3-bucket", 
-            url, 
-            ExtraArgs={"ContentType": content_type}
+        get_s3_client().upload_fileobj(
+            self.file,
+            settings.S3_BUCKET,
+            url,
+            ExtraArgs={"ContentType": content_type},
+            Config=TRANSFER_CONFIG,
         )
         return url
@@ -0,0 +1,69 @@
+import csv
+import io
+
+
+def pg_array(values):
+    """
+    Python 리스트를 Postgres 배열 리터럴로 변환 ({"a","b"})
+    """
+    items = []
+    for value in values:
+        if isinstance(value, str):
+            value = '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+        items.append(str(value))
+    return "{" + ",".join(items) + "}"
+
+
+class CopyStream(io.RawIOBase):
+    """
+    행 iterator 를 COPY FROM STDIN 용 CSV 스트림으로 변환 (메모리에 전체를 올리지 않음)
+
+    None 은 NULL, list 는 Postgres 배열, 그 외는 str() 로 기록
+    """
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buffer = b""
+        self._text = io.StringIO()
+        self._writer = csv.writer(self._text, lineterminator="\n")
+
+    def readable(self):
+        return True
+
+    def _encode(self, row):
+        self._writer.writerow([pg_array(value) if isinstance(value, (list, tuple)) else value for value in row])
+        data = self._text.getvalue().encode("utf-8")
+        self._text.seek(0)
+        self._text.truncate(0)
+        return data
+
+    def read(self, size=-1):
+        while size < 0 or len(self._buffer) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer += self._encode(row)
+        if size < 0:
+            data, self._buffer = self._buffer, b""
+        else:
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def copy_rows(cursor, table, columns, rows, force_not_null=()):
+    """
+    PostgreSQL COPY FROM STDIN 으로 행 스트림 적재
+
+    Args:
+        * cursor: Django DB cursor (psycopg2)
+        * table (str): 테이블 이름
+        * columns (list): 컬럼 이름
+        * rows (iterable): 행 (columns 순서의 tuple)
+        * force_not_null (list): 빈 값을 NULL 이 아닌 '' 로 읽을 컬럼
+    """
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    options = "FORMAT csv"
+    if force_not_null:
+        options += ", FORCE_NOT_NULL (" + ", ".join(f'"{column}"' for column in force_not_null) + ")"
+    sql = f'COPY "{table}" ({column_list}) FROM STDIN WITH ({options})'
+    cursor.cursor.copy_expert(sql, CopyStream(rows))
+    return cursor.rowcount
@@ -20,4 +20,56 @@ category_name = {
     600:"패스트푸드",
     700:"인스턴트",
     800:"카페"
-}
\ No newline at end of file
+}
+
+# 카테고리 코드 -> 비트 (코드 // 100 번째 비트, 기타=1, 한식=2, ..., 카페=256)
+def category_bit(code):
+    """
+    카테고리 코드 -> bitmask 비트
+
+    Raises:
+        * ValueError: 정의되지 않은 카테고리 코드
+    """
+    if code not in category_name:
+        raise ValueError(f"Unknown category code: {code}")
+    return 1 << (code // 100)
+
+
+def category_mask(codes, strict=False):
+    """
+    카테고리 코드 목록 -> bitmask
+
+    저장된 데이터에는 정의되지 않은 코드가 있을 수 있으므로 기본은 그런 코드를 건너뛴다.
+    사용자 입력처럼 잘못된 코드를 거부해야 하면 strict=True.
+
+    Raises:
+        * ValueError: strict 이고 정의되지 않은 카테고리 코드가 있는 경우
+    """
+    mask = 0
+    for code in codes or ():
+        if code in category_name:
+            mask |= category_bit(code)
+        elif strict:
+            raise ValueError(f"Unknown category code: {code}")
+    return mask
+
+
+def category_codes(mask):
+    """
+    bitmask -> 카테고리 코드 목록 (오름차순)
+    """
+    return [code for code in sorted(category_name) if mask & (1 << (code // 100))]
+
+
+def matches_all(mask, required):
+    """
+    required 의 카테고리를 모두 포함하는지
+    """
+    return mask & required == required
+
+
+def matches_any(mask, wanted):
+    """
+    wanted 의 카테고리 중 하나라도 포함하는지 (wanted 가 0 이면 항상 참)
+    """
+    return not wanted or bool(mask & wanted)
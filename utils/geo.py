@@ -0,0 +1,86 @@
+import math
+
+import numpy as np
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def haversine(lat1, lng1, lat2, lng2):
+    """
+    두 좌표 사이의 구면 거리(m)
+
+    Args:
+        * lat1, lng1 (float): 기준 좌표
+        * lat2, lng2 (float): 대상 좌표
+
+    Returns:
+        * distance (float): 미터 단위 거리
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lng2 - lng1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(a))
+
+
+def valid_coordinates(lat, lng):
+    """
+    유한한 값이고 위경도 범위 안인지 (nan / inf 는 격자 계산에서 예외를 일으킴)
+    """
+    return math.isfinite(lat) and math.isfinite(lng) and -90 <= lat <= 90 and -180 <= lng <= 180
+
+
+def grid_cell(lat, lng, cell_deg):
+    """
+    위경도를 균일 격자 셀 좌표로 변환
+    """
+    return math.floor(lat / cell_deg), math.floor(lng / cell_deg)
+
+
+def covering_cells(lat, lng, radius_m, cell_deg):
+    """
+    (lat, lng) 중심 반경 radius_m 원을 덮는 격자 셀 목록
+    """
+    d_lat = math.degrees(radius_m / EARTH_RADIUS_M)
+    cos_lat = max(math.cos(math.radians(lat)), 1e-6)
+    d_lng = d_lat / cos_lat
+    min_row, min_col = grid_cell(lat - d_lat, lng - d_lng, cell_deg)
+    max_row, max_col = grid_cell(lat + d_lat, lng + d_lng, cell_deg)
+    return [
+        (row, col)
+        for row in range(min_row, max_row + 1)
+        for col in range(min_col, max_col + 1)
+    ]
+
+
+def haversine_many(lat, lng, lats, lngs):
+    """
+    기준 좌표에서 여러 좌표까지의 구면 거리(m)를 한 번에 계산
+
+    Args:
+        * lat, lng (float): 기준 좌표
+        * lats, lngs (array-like): 대상 좌표 배열
+
+    Returns:
+        * distances (numpy.ndarray): 미터 단위 거리 배열
+    """
+    phi1 = math.radians(lat)
+    phi2 = np.radians(np.asarray(lats, dtype=np.float64))
+    d_phi = phi2 - phi1
+    d_lambda = np.radians(np.asarray(lngs, dtype=np.float64) - lng)
+    a = np.sin(d_phi / 2) ** 2 + math.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(a))
+
+
+def nearest_k(distances, k=None):
+    """
+    거리 배열에서 가까운 k개의 위치를 거리순으로 반환 (전체 정렬 대신 argpartition)
+    """
+    distances = np.asarray(distances)
+    if k is None or k >= len(distances):
+        return np.argsort(distances, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    top = np.argpartition(distances, k - 1)[:k]
+    return top[np.argsort(distances[top], kind="stable")]
@@ -0,0 +1,105 @@
+import csv
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def normalize_address(addr):
+    """
+    캐시 key 용 주소 정규화 (앞뒤 공백 제거, 연속 공백 축소)
+    """
+    return re.sub(r"\s+", " ", addr or "").strip()
+
+
+class GeocodeCache:
+    """
+    정규화된 주소 -> (경도, 위도) 디스크 캐시 (sqlite)
+
+    재실행 시 이미 변환한 주소는 API 를 다시 호출하지 않는다.
+    """
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS geocode (address TEXT PRIMARY KEY, longitude REAL, latitude REAL)"
+        )
+        self._db.commit()
+
+    def get(self, addr):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT longitude, latitude FROM geocode WHERE address = ?", (normalize_address(addr),)
+            ).fetchone()
+        return row
+
+    def set(self, addr, longitude, latitude):
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO geocode (address, longitude, latitude) VALUES (?, ?, ?)",
+                (normalize_address(addr), longitude, latitude),
+            )
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class CachedGeocoder:
+    """
+    geocoder(addr) -> (경도, 위도) 앞에 디스크 캐시를 두는 래퍼
+
+    변환에 실패한 주소(None)는 캐시하지 않아 다음 실행에서 재시도한다.
+    """
+    def __init__(self, geocoder, cache):
+        self.geocoder = geocoder
+        self.cache = cache
+
+    def __call__(self, addr):
+        cached = self.cache.get(addr)
+        if cached is not None:
+            return cached
+        longitude, latitude = self.geocoder(normalize_address(addr))
+        if longitude is not None and latitude is not None:
+            self.cache.set(addr, longitude, latitude)
+        return longitude, latitude
+
+
+class StubGeocoder:
+    """
+    오프라인 테스트용 geocoder (주소,경도,위도 CSV 또는 dict)
+    """
+    def __init__(self, coords=None, csv_path=None):
+        self.coords = {normalize_address(addr): tuple(value) for addr, value in (coords or {}).items()}
+        if csv_path:
+            with open(csv_path, "r") as f:
+                for addr, longitude, latitude in csv.reader(f):
+                    self.coords[normalize_address(addr)] = (float(longitude), float(latitude))
+
+    def __call__(self, addr):
+        return self.coords.get(normalize_address(addr), (None, None))
+
+
+def geocode_many(addresses, geocoder, executor):
+    """
+    주소 목록을 워커 풀에서 병렬 변환
+
+    Returns:
+        * [((경도, 위도) or None, error or None), ...] (입력 순서 유지)
+    """
+    def geocode(addr):
+        try:
+            longitude, latitude = geocoder(addr)
+        except Exception as e:
+            return None, e
+        if longitude is None or latitude is None:
+            return None, None
+        return (longitude, latitude), None
+
+    return list(executor.map(geocode, addresses))
+
+
+def make_executor(workers):
+    return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="geocode")
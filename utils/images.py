@@ -0,0 +1,193 @@
+import io
+import logging
+import os
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import connections
+from django.utils.module_loading import import_string
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# 변형 이름 -> 최대 크기 (None 이면 원본 크기)
+VARIANTS = {
+    "thumbnail": (200, 200),
+    "medium": (800, 800),
+    "original": None,
+}
+# 포맷 이름 -> (Pillow 포맷, Content-Type, 확장자, 저장 옵션)
+FORMATS = {
+    "webp": ("WEBP", "image/webp", "webp", {"quality": 80, "method": 4}),
+    "jpeg": ("JPEG", "image/jpeg", "jpg", {"quality": 85, "optimize": True, "progressive": True}),
+}
+
+
+def render_variants(data):
+    """
+    원본 이미지 bytes -> {(변형, 포맷): bytes}
+
+    EXIF 회전을 반영하고 RGB 로 변환한 뒤 변형별로 축소해 WebP / JPEG 로 인코딩
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source).convert("RGB")
+    rendered = {}
+    for variant, size in VARIANTS.items():
+        resized = image
+        if size is not None:
+            resized = image.copy()
+            resized.thumbnail(size, Image.LANCZOS)
+        for fmt, (pil_format, _, _, options) in FORMATS.items():
+            buffer = io.BytesIO()
+            resized.save(buffer, pil_format, **options)
+            rendered[(variant, fmt)] = buffer.getvalue()
+    return rendered
+
+
+class ImageStorage:
+    """
+    이미지 변형 저장소 (key -> 공개 URL)
+    """
+    def save(self, key, data, content_type):
+        raise NotImplementedError
+
+
+class S3ImageStorage(ImageStorage):
+    """
+    S3 저장소 (공용 client 사용, S3_ENDPOINT_URL 로 moto 서버 등 S3 호환 저장소 사용 가능)
+    """
+    def __init__(self, bucket, base_url, **options):
+        self.bucket = bucket
+        self.base_url = base_url
+
+    def save(self, key, data, content_type):
+        from .aws import get_s3_client
+
+        get_s3_client().put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=data,
+            ContentType=content_type,
+            CacheControl="public, max-age=31536000, immutable",
+        )
+        return self.base_url + key
+
+
+class LocalImageStorage(ImageStorage):
+    """
+    로컬 파일 시스템 저장소 (개발, 테스트용)
+    """
+    def __init__(self, root, base_url, **options):
+        self.root = root
+        self.base_url = base_url
+
+    def save(self, key, data, content_type):
+        path = os.path.join(self.root, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+        return self.base_url + key
+
+
+_storage = None
+_executor = None
+_upload_executor = None
+_lock = threading.Lock()
+
+
+def get_image_storage():
+    global _storage
+    if _storage is None:
+        with _lock:
+            if _storage is None:
+                config = settings.IMAGE_STORAGE
+                _storage = import_string(config["BACKEND"])(**config.get("OPTIONS", {}))
+    return _storage
+
+
+def get_executor():
+    """
+    이미지 처리 워커 풀 (Pillow 리사이즈 / 인코딩은 대부분 GIL 을 놓고 실행)
+    """
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=settings.IMAGE_WORKERS, thread_name_prefix="images")
+    return _executor
+
+
+def get_upload_executor():
+    """
+    변형 업로드 풀 (처리 풀과 분리해 처리 작업이 업로드를 기다리며 풀을 막지 않도록)
+    """
+    global _upload_executor
+    if _upload_executor is None:
+        with _lock:
+            if _upload_executor is None:
+                _upload_executor = ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_UPLOAD_WORKERS, thread_name_prefix="image-uploads",
+                )
+    return _upload_executor
+
+
+def process_image(data, key_prefix):
+    """
+    변형 생성 후 병렬 업로드
+
+    Returns:
+        * {"thumbnail": {"webp": url, "jpeg": url}, "medium": {...}, "original": {...}}
+    """
+    storage = get_image_storage()
+    name = uuid.uuid4().hex
+    rendered = render_variants(data)
+    futures = {}
+    for (variant, fmt), body in rendered.items():
+        _, content_type, extension, _ = FORMATS[fmt]
+        key = f"{key_prefix}{name}_{variant}.{extension}"
+        futures[(variant, fmt)] = get_upload_executor().submit(storage.save, key, body, content_type)
+    variants = {}
+    for (variant, fmt), future in futures.items():
+        variants.setdefault(variant, {})[fmt] = future.result()
+    return variants
+
+
+def _submit(load, key_prefix, on_done, cleanup=None):
+    def run():
+        try:
+            on_done(process_image(load(), key_prefix))
+            if cleanup is not None:
+                cleanup()
+        except Exception:
+            logger.exception("Image processing failed for %s", key_prefix)
+        finally:
+            # on_done 이 이 스레드에서 연 DB 연결 정리
+            connections.close_all()
+    return get_executor().submit(run)
+
+
+def submit_image(data, key_prefix, on_done):
+    """
+    이미지 처리를 워커 풀에 넘기고 바로 반환 (완료 시 on_done(variants) 호출)
+    """
+    return _submit(lambda: data, key_prefix, on_done)
+
+
+def submit_upload(upload_key, key_prefix, on_done):
+    """
+    클라이언트가 버킷에 직접 올린 원본(upload_key)을 워커에서 내려받아 처리
+
+    변형 생성이 끝나면 원본 업로드 객체는 삭제한다.
+    """
+    from . import aws
+
+    return _submit(lambda: aws.download(upload_key), key_prefix, on_done, lambda: aws.delete(upload_key))
+
+
+def thumbnail_url(variants, fmt="webp"):
+    """
+    목록 응답용 썸네일 URL (아직 처리 전이면 None)
+    """
+    return ((variants or {}).get("thumbnail") or {}).get(fmt)
@@ -0,0 +1,237 @@
+import hmac
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse
+
+# 응답 시간 histogram 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 요청당 SQL 쿼리 수 histogram 구간
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+# URL 패턴을 찾지 못한 요청의 route label (경로를 그대로 쓰면 label 수가 무한히 늘어남)
+UNMATCHED_ROUTE = "<unmatched>"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class EndpointStats:
+    __slots__ = ("latency_buckets", "latency_sum", "query_buckets", "query_sum", "sql_seconds", "response_bytes", "statuses")
+
+    def __init__(self):
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+        self.query_buckets = [0] * (len(QUERY_BUCKETS) + 1)
+        self.query_sum = 0
+        self.sql_seconds = 0.0
+        self.response_bytes = 0
+        # 상태 코드 -> 요청 수
+        self.statuses = {}
+
+
+class MetricsRegistry:
+    """
+    (route, method) 별 요청 통계 (프로세스 메모리)
+
+    Procfile 기준 dyno 하나에 daphne 프로세스 하나이므로 프로세스별 집계를 그대로 내보내고,
+    여러 dyno 는 Prometheus 가 instance label 로 구분한다.
+    """
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def observe(self, route, method, status, seconds, queries, sql_seconds, response_bytes):
+        key = (route, method)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = EndpointStats()
+            stats.latency_buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+            stats.latency_sum += seconds
+            stats.query_buckets[bisect_left(QUERY_BUCKETS, queries)] += 1
+            stats.query_sum += queries
+            stats.sql_seconds += sql_seconds
+            stats.response_bytes += response_bytes
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                key: (
+                    list(stats.latency_buckets), stats.latency_sum,
+                    list(stats.query_buckets), stats.query_sum,
+                    stats.sql_seconds, stats.response_bytes, dict(stats.statuses),
+                )
+                for key, stats in self._stats.items()
+            }
+
+    def clear(self):
+        with self._lock:
+            self._stats.clear()
+
+
+registry = MetricsRegistry()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+def _histogram(lines, name, buckets, counts, total, route, method):
+    cumulative = 0
+    for bound, count in zip(buckets, counts):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels(route=route, method=method, le=bound)} {cumulative}")
+    cumulative += counts[-1]
+    lines.append(f"{name}_bucket{_labels(route=route, method=method, le='+Inf')} {cumulative}")
+    lines.append(f"{name}_sum{_labels(route=route, method=method)} {total}")
+    lines.append(f"{name}_count{_labels(route=route, method=method)} {cumulative}")
+
+
+def render(snapshot):
+    """
+    snapshot -> Prometheus text exposition format
+    """
+    rows = sorted(snapshot.items())
+    lines = [
+        "# HELP http_requests_total Requests by URL pattern, method and status.",
+        "# TYPE http_requests_total counter",
+    ]
+    for (route, method), (_, _, _, _, _, _, statuses) in rows:
+        for code, count in sorted(statuses.items()):
+            lines.append(f"http_requests_total{_labels(route=route, method=method, status=code)} {count}")
+
+    lines += [
+        "# HELP http_request_duration_seconds Request latency by URL pattern.",
+        "# TYPE http_request_duration_seconds histogram",
+    ]
+    for (route, method), (latency_buckets, latency_sum, *_) in rows:
+        _histogram(lines, "http_request_duration_seconds", LATENCY_BUCKETS, latency_buckets, latency_sum, route, method)
+
+    lines += [
+        "# HELP db_queries_per_request SQL queries per request by URL pattern.",
+        "# TYPE db_queries_per_request histogram",
+    ]
+    for (route, method), (_, _, query_buckets, query_sum, *_) in rows:
+        _histogram(lines, "db_queries_per_request", QUERY_BUCKETS, query_buckets, query_sum, route, method)
+
+    lines += [
+        "# HELP db_query_duration_seconds_total SQL execution time by URL pattern.",
+        "# TYPE db_query_duration_seconds_total counter",
+    ]
+    for (route, method), (_, _, _, _, sql_seconds, _, _) in rows:
+        lines.append(f"db_query_duration_seconds_total{_labels(route=route, method=method)} {sql_seconds}")
+
+    lines += [
+        "# HELP http_response_bytes_total Response body bytes by URL pattern.",
+        "# TYPE http_response_bytes_total counter",
+    ]
+    for (route, method), (_, _, _, _, _, response_bytes, _) in rows:
+        lines.append(f"http_response_bytes_total{_labels(route=route, method=method)} {response_bytes}")
+    return "\n".join(lines) + "\n"
+
+
+class QueryCounter:
+    """
+    요청 중 실행된 SQL 수와 시간
+    """
+    __slots__ = ("count", "seconds")
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+
+
+# 현재 요청의 QueryCounter (sync view 가 도는 스레드로도 전파됨)
+_current = ContextVar("metrics_query_counter", default=None)
+
+
+def count_queries(execute, sql, params, many, context):
+    """
+    connection.execute_wrapper: 요청 처리 중이면 SQL 수와 시간을 QueryCounter 에 더함
+
+    요청마다 wrapper 를 걸고 푸는 대신 연결마다 한 번만 등록한다.
+    """
+    counter = _current.get()
+    if counter is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        counter.seconds += time.perf_counter() - start
+        counter.count += 1
+
+
+def install_query_counter(sender, connection, **kwargs):
+    if count_queries not in connection.execute_wrappers:
+        connection.execute_wrappers.append(count_queries)
+
+
+connection_created.connect(install_query_counter)
+
+
+class MetricsMiddleware:
+    """
+    URL 패턴별 응답 시간, SQL 쿼리 수 / 시간, 응답 크기 기록 (MIDDLEWARE 맨 앞에 둔다)
+
+    async 뷰에서도 sync_to_async 가 ContextVar 를 스레드로 복사하므로 같은 counter 에 집계된다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        counter = QueryCounter()
+        token = _current.set(counter)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.observe(request, response, counter, time.perf_counter() - start)
+        return response
+
+    async def __acall__(self, request):
+        counter = QueryCounter()
+        token = _current.set(counter)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self.observe(request, response, counter, time.perf_counter() - start)
+        return response
+
+    def observe(self, request, response, counter, seconds):
+        match = request.resolver_match
+        route = match.route if match is not None else UNMATCHED_ROUTE
+        size = 0 if response.streaming else len(response.content)
+        registry.observe(route, request.method, response.status_code, seconds, counter.count, counter.seconds, size)
+
+
+def metrics_view(request):
+    """
+    GET /metrics (Authorization: Bearer <METRICS_TOKEN> 필요, METRICS_TOKEN 이 없으면 DEBUG 에서만 공개)
+    """
+    token = getattr(settings, "METRICS_TOKEN", None)
+    if token:
+        expected = f"Bearer {token}"
+        if not hmac.compare_digest(request.headers.get("Authorization", ""), expected):
+            return HttpResponse(status=401)
+    elif not settings.DEBUG:
+        return HttpResponse(status=403)
+    return HttpResponse(render(registry.snapshot()), content_type=CONTENT_TYPE)
@@ -0,0 +1,123 @@
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+
+from django.db.models import Q
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def to_micros(value):
+    """
+    aware datetime -> epoch 마이크로초 (정수, 반올림 오차 없음)
+    """
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def from_micros(micros):
+    return EPOCH + timedelta(microseconds=micros)
+
+
+# datetime 으로 표현할 수 있는 cursor 시각 범위 (벗어나면 from_micros 가 OverflowError)
+MIN_MICROS = to_micros(datetime.min.replace(tzinfo=timezone.utc))
+MAX_MICROS = to_micros(datetime.max.replace(tzinfo=timezone.utc))
+
+
+def encode_cursor(created_at, pk):
+    """
+    (created_at, pk) -> 불투명 cursor 문자열
+
+    created_at 은 aware datetime 또는 epoch 마이크로초
+    """
+    if isinstance(created_at, datetime):
+        created_at = to_micros(created_at)
+    payload = json.dumps([created_at, pk], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    cursor 문자열 -> (created_at 마이크로초, pk)
+
+    Raises:
+        * InvalidCursor
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        micros, pk = json.loads(payload)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+    if not (isinstance(micros, int) and isinstance(pk, int)):
+        raise InvalidCursor("Invalid cursor")
+    if not MIN_MICROS <= micros <= MAX_MICROS:
+        raise InvalidCursor("Invalid cursor")
+    return micros, pk
+
+
+def page_params(request, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    """
+    요청의 cursor / page_size 파라미터
+
+    Returns:
+        * (cursor (micros, pk) or None, page_size)
+
+    Raises:
+        * ValueError: page_size 또는 cursor 가 잘못된 경우
+    """
+    page_size = int(request.GET.get("page_size", default))
+    if not 0 < page_size <= maximum:
+        raise ValueError("Invalid page size")
+    cursor = request.GET.get("cursor")
+    return (decode_cursor(cursor) if cursor else None), page_size
+
+
+def keyset_queryset(queryset, cursor, page_size, time_field="created_at", pk_field="pk"):
+    """
+    (time_field, pk_field) 내림차순으로 cursor 다음 page_size + 1 개 (다음 페이지 확인용 1개 포함)
+    """
+    queryset = queryset.order_by(f"-{time_field}", f"-{pk_field}")
+    if cursor is not None:
+        micros, pk = cursor
+        created_at = from_micros(micros)
+        queryset = queryset.filter(
+            Q(**{f"{time_field}__lt": created_at})
+            | Q(**{time_field: created_at, f"{pk_field}__lt": pk})
+        )
+    return queryset[:page_size + 1]
+
+
+def split_page(rows, page_size, time_field="created_at", pk_field="pk"):
+    """
+    page_size + 1 개까지 읽은 rows -> (rows, next_cursor or None)
+    """
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, time_field), getattr(last, pk_field))
+    return rows, next_cursor
+
+
+def keyset_page(queryset, cursor, page_size, time_field="created_at", pk_field="pk"):
+    """
+    (time_field, pk_field) 내림차순 keyset 페이지 (쿼리 1회)
+
+    Returns:
+        * (rows, next_cursor or None)
+    """
+    rows = list(keyset_queryset(queryset, cursor, page_size, time_field, pk_field))
+    return split_page(rows, page_size, time_field, pk_field)
+
+
+async def akeyset_page(queryset, cursor, page_size, time_field="created_at", pk_field="pk"):
+    """
+    keyset_page 의 async 버전 (async 뷰에서 사용)
+    """
+    rows = [row async for row in keyset_queryset(queryset, cursor, page_size, time_field, pk_field)]
+    return split_page(rows, page_size, time_field, pk_field)
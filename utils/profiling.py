@@ -0,0 +1,295 @@
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import ExitStack
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.db import connections
+from django.http import HttpResponse
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_FLAG = "_profile"
+# 서명된 X-Profile 토큰 유효 시간 (초)
+PROFILE_TOKEN_MAX_AGE = 60 * 30
+PROFILE_TOKEN_SALT = "utils.profiling"
+# 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.002
+# 보관하는 최근 프로파일 수
+PROFILE_BUFFER_SIZE = 50
+# 프로파일에 남기는 SQL 수 / 길이
+MAX_SQL_STATEMENTS = 200
+MAX_SQL_LENGTH = 500
+
+
+def profile_token():
+    """
+    X-Profile 헤더 값 (PROFILE_TOKEN_MAX_AGE 동안 유효)
+    """
+    return signing.TimestampSigner(salt=PROFILE_TOKEN_SALT).sign("profile")
+
+
+def valid_token(token):
+    try:
+        return signing.TimestampSigner(salt=PROFILE_TOKEN_SALT).unsign(token, max_age=PROFILE_TOKEN_MAX_AGE) == "profile"
+    except signing.BadSignature:
+        return False
+
+
+def frame_name(code):
+    filename = code.co_filename
+    base = str(settings.BASE_DIR) + os.sep
+    if filename.startswith(base):
+        filename = filename[len(base):]
+    else:
+        # site-packages 등은 패키지 경로만
+        marker = filename.rfind("site-packages" + os.sep)
+        if marker >= 0:
+            filename = filename[marker + len("site-packages" + os.sep):]
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+def collapse(frame):
+    """
+    frame -> collapsed stack 한 줄 ("바깥;...;안쪽", flamegraph.pl / speedscope 입력 형식)
+    """
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+class StackSampler:
+    """
+    대상 스레드들의 스택을 일정 간격으로 수집하는 샘플링 프로파일러
+    """
+    def __init__(self, thread_ids, interval=SAMPLE_INTERVAL):
+        self.thread_ids = tuple(thread_ids)
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frames = sys._current_frames()
+            for thread_id in self.thread_ids:
+                frame = frames.get(thread_id)
+                if frame is not None:
+                    self.stacks[collapse(frame)] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+    def collapsed(self):
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.most_common())
+
+
+class SQLRecorder:
+    """
+    프로파일 중인 요청의 SQL 과 실행 시간
+    """
+    def __init__(self):
+        self.statements = []
+        self.count = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            seconds = time.perf_counter() - start
+            self.count += 1
+            self.seconds += seconds
+            if len(self.statements) < MAX_SQL_STATEMENTS:
+                self.statements.append({"sql": sql[:MAX_SQL_LENGTH], "ms": round(seconds * 1000, 3)})
+
+
+class ProfileBuffer:
+    """
+    최근 프로파일 ring buffer (프로세스 메모리)
+    """
+    def __init__(self, size=PROFILE_BUFFER_SIZE):
+        self._profiles = deque(maxlen=size)
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def add(self, profile):
+        with self._lock:
+            profile["id"] = next(self._ids)
+            self._profiles.append(profile)
+        return profile["id"]
+
+    def list(self):
+        with self._lock:
+            return list(reversed(self._profiles))
+
+    def get(self, profile_id):
+        with self._lock:
+            for profile in self._profiles:
+                if profile["id"] == profile_id:
+                    return profile
+        return None
+
+
+profiles = ProfileBuffer()
+
+
+def profiling_requested(request):
+    """
+    서명된 X-Profile 헤더, 또는 관리자(세션 로그인)의 ?_profile=1
+    """
+    token = request.headers.get(PROFILE_HEADER)
+    if token is not None:
+        return valid_token(token)
+    if PROFILE_QUERY_FLAG in request.GET:
+        user = getattr(request, "user", None)
+        return bool(user is not None and user.is_authenticated and user.is_staff)
+    return False
+
+
+class ProfilingMiddleware:
+    """
+    요청 단위 프로파일링 (AuthenticationMiddleware 뒤에 둔다)
+
+    요청하지 않은 요청은 헤더 / 쿼리 확인만 하고 그대로 통과한다.
+    프로파일한 요청은 응답에 X-Profile-Id 를 붙이고 결과를 ring buffer 에 남긴다.
+    async 요청은 이벤트 루프 스레드와 이 요청의 sync 코드 (ORM 등) 가 도는 스레드를 함께 샘플링한다.
+    이벤트 루프 스레드의 샘플에는 같은 시간에 처리된 다른 요청도 섞일 수 있다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not profiling_requested(request):
+            return self.get_response(request)
+
+        sampler = StackSampler([threading.get_ident()])
+        recorder = SQLRecorder()
+        started_at = timezone.now()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            sampler.start()
+            try:
+                response = self.get_response(request)
+            finally:
+                sampler.stop()
+        return self.record(request, response, sampler, recorder, started_at, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        if PROFILE_HEADER not in request.headers and PROFILE_QUERY_FLAG not in request.GET:
+            return await self.get_response(request)
+        # ?_profile 은 세션 유저 확인 (DB 조회) 이 필요
+        if not await sync_to_async(profiling_requested)(request):
+            return await self.get_response(request)
+
+        recorder = SQLRecorder()
+        stack = ExitStack()
+
+        def install():
+            # DB 연결은 스레드별이므로 이 요청의 sync 코드가 도는 스레드에서 wrapper 를 건다
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            return threading.get_ident()
+
+        sync_thread_id = await sync_to_async(install)()
+        try:
+            sampler = StackSampler([threading.get_ident(), sync_thread_id])
+            started_at = timezone.now()
+            start = time.perf_counter()
+            sampler.start()
+            try:
+                response = await self.get_response(request)
+            finally:
+                sampler.stop()
+        finally:
+            await sync_to_async(stack.close)()
+        return self.record(request, response, sampler, recorder, started_at, time.perf_counter() - start)
+
+    def record(self, request, response, sampler, recorder, started_at, seconds):
+        match = request.resolver_match
+        profile_id = profiles.add({
+            "method": request.method,
+            "path": request.get_full_path(),
+            "route": match.route if match is not None else None,
+            "view": match.view_name if match is not None else None,
+            "status": response.status_code,
+            "started_at": started_at.isoformat(),
+            "duration_ms": round(seconds * 1000, 3),
+            "samples": sum(sampler.stacks.values()),
+            "sample_interval_ms": sampler.interval * 1000,
+            "collapsed": sampler.collapsed(),
+            "sql_count": recorder.count,
+            "sql_ms": round(recorder.seconds * 1000, 3),
+            "sql": recorder.statements,
+        })
+        response["X-Profile-Id"] = str(profile_id)
+        return response
+
+
+class ProfileListView(APIView):
+    permission_classes = [IsAdminUser]
+
+    # 최근 프로파일 목록 (collapsed stack, SQL 제외)
+    def get(self, request):
+        return Response({
+            "status": "success",
+            "profiles": [
+                {key: value for key, value in profile.items() if key not in ("collapsed", "sql")}
+                for profile in profiles.list()
+            ],
+        }, status=status.HTTP_200_OK)
+
+    # X-Profile 헤더 토큰 발급
+    def post(self, request):
+        return Response({
+            "status": "success",
+            "header": PROFILE_HEADER,
+            "token": profile_token(),
+            "expires_in": PROFILE_TOKEN_MAX_AGE,
+        }, status=status.HTTP_200_OK)
+
+
+class ProfileDetailView(APIView):
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, profile_id):
+        profile = profiles.get(profile_id)
+        if profile is None:
+            return Response({"error": "Profile not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"status": "success", "profile": profile}, status=status.HTTP_200_OK)
+
+
+class ProfileCollapsedView(APIView):
+    permission_classes = [IsAdminUser]
+
+    # flamegraph.pl / speedscope 에 바로 넣을 수 있는 collapsed stack
+    def get(self, request, profile_id):
+        profile = profiles.get(profile_id)
+        if profile is None:
+            return HttpResponse(status=404)
+        return HttpResponse(profile["collapsed"] + "\n", content_type="text/plain; charset=utf-8")
@@ -0,0 +1,102 @@
+from datetime import datetime, timezone
+
+from django.test import SimpleTestCase
+
+from .category import category_bit, category_codes, category_mask, matches_all, matches_any
+from .geo import valid_coordinates
+from .metrics import MetricsRegistry, render
+from .pagination import InvalidCursor, decode_cursor, encode_cursor, from_micros, to_micros
+
+
+class CategoryMaskTests(SimpleTestCase):
+    def test_mask_and_codes(self):
+        mask = category_mask([100, 800])
+        self.assertEqual(mask, (1 << 1) | (1 << 8))
+        self.assertEqual(category_codes(mask), [100, 800])
+        self.assertEqual(category_mask([0]), 1)
+        self.assertEqual(category_mask(None), 0)
+
+    def test_unknown_code_skipped_unless_strict(self):
+        self.assertEqual(category_mask([100, 150, 900]), category_bit(100))
+        with self.assertRaises(ValueError):
+            category_mask([100, 900], strict=True)
+        with self.assertRaises(ValueError):
+            category_bit(900)
+
+    def test_matches(self):
+        mask = category_mask([100, 200])
+        self.assertTrue(matches_all(mask, category_mask([100])))
+        self.assertFalse(matches_all(mask, category_mask([100, 300])))
+        self.assertTrue(matches_any(mask, category_mask([200, 300])))
+        self.assertFalse(matches_any(mask, category_mask([300])))
+        self.assertTrue(matches_any(mask, 0))
+
+
+class ValidCoordinatesTests(SimpleTestCase):
+    def test_valid_coordinates(self):
+        self.assertTrue(valid_coordinates(37.5, 126.9))
+        self.assertTrue(valid_coordinates(-90.0, 180.0))
+        for lat, lng in ((float("nan"), 126.9), (37.5, float("inf")), (91.0, 0.0), (0.0, -180.5)):
+            with self.subTest(lat=lat, lng=lng):
+                self.assertFalse(valid_coordinates(lat, lng))
+
+
+class CursorTests(SimpleTestCase):
+    def test_round_trip(self):
+        created_at = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        micros, pk = decode_cursor(encode_cursor(created_at, 42))
+        self.assertEqual(pk, 42)
+        self.assertEqual(from_micros(micros), created_at)
+        self.assertEqual(decode_cursor(encode_cursor(to_micros(created_at), 42)), (micros, 42))
+
+    def test_invalid_cursor(self):
+        for cursor in ("", "not a cursor", "WyJhIiwgMV0", "WzEsIDIsIDNd"):
+            with self.subTest(cursor=cursor), self.assertRaises(InvalidCursor):
+                decode_cursor(cursor)
+
+    def test_out_of_range_micros(self):
+        # [10000000000000000000, 1]
+        with self.assertRaises(InvalidCursor):
+            decode_cursor("WzEwMDAwMDAwMDAwMDAwMDAwMDAsIDFd")
+
+
+class MetricsTests(SimpleTestCase):
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        self.registry.observe("restaurants/", "GET", 200, 0.02, 3, 0.004, 100)
+        self.registry.observe("restaurants/", "GET", 404, 2.0, 0, 0.0, 50)
+
+    def test_snapshot(self):
+        latency_buckets, latency_sum, query_buckets, query_sum, sql_seconds, response_bytes, statuses = (
+            self.registry.snapshot()[("restaurants/", "GET")]
+        )
+        self.assertEqual(sum(latency_buckets), 2)
+        self.assertAlmostEqual(latency_sum, 2.02)
+        self.assertEqual(query_buckets[0], 1)
+        self.assertEqual(query_sum, 3)
+        self.assertEqual(response_bytes, 150)
+        self.assertEqual(statuses, {200: 1, 404: 1})
+
+    def test_render(self):
+        lines = render(self.registry.snapshot()).splitlines()
+        labels = 'route="restaurants/",method="GET"'
+        for line in (
+            f'http_requests_total{{{labels},status="200"}} 1',
+            f'http_requests_total{{{labels},status="404"}} 1',
+            f'http_request_duration_seconds_bucket{{{labels},le="0.01"}} 0',
+            f'http_request_duration_seconds_bucket{{{labels},le="0.025"}} 1',
+            f'http_request_duration_seconds_bucket{{{labels},le="2.5"}} 2',
+            f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+            f'http_request_duration_seconds_count{{{labels}}} 2',
+            f'db_queries_per_request_bucket{{{labels},le="0"}} 1',
+            f'db_queries_per_request_bucket{{{labels},le="2"}} 1',
+            f'db_queries_per_request_bucket{{{labels},le="5"}} 2',
+            f'db_queries_per_request_sum{{{labels}}} 3',
+            f'http_response_bytes_total{{{labels}}} 150',
+        ):
+            self.assertIn(line, lines)
+
+    def test_label_escaping(self):
+        registry = MetricsRegistry()
+        registry.observe('a"b', "GET", 200, 0.0, 0, 0.0, 0)
+        self.assertIn('route="a\\"b"', render(registry.snapshot()))